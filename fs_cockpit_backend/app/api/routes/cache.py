@@ -1,34 +1,64 @@
 """Cache management API endpoints."""
 
-from typing import Any, Dict
+import time
+from typing import Any, Dict, Tuple
 
+import orjson
 import structlog
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import ORJSONResponse
 
 from app.cache.memory_cache import get_cache
+from app.utils.http_cache import compute_etag, etag_matches, not_modified
 
 logger = structlog.get_logger(__name__)
 
-router = APIRouter(prefix="/api/v1/cache", tags=["Cache Management"])
+router = APIRouter(
+    prefix="/api/v1/cache", tags=["Cache Management"], default_response_class=ORJSONResponse
+)
+
+# Serialized /stats body reused by dashboards that poll more often than this
+_STATS_SNAPSHOT_TTL_SECONDS = 1.0
+_STATS_CACHE_CONTROL = "no-cache"  # clients may keep it but must revalidate via ETag
+_stats_snapshot: Tuple[float, bytes, str] = (0.0, b"", "")
+
+
+def _invalidate_stats_snapshot() -> None:
+    """Drop the serialized stats snapshot so the next /stats call recomputes it."""
+    global _stats_snapshot
+    _stats_snapshot = (0.0, b"", "")
 
 
 @router.get("/stats", summary="Get Cache Statistics")
-async def get_cache_stats() -> Dict[str, Any]:
+async def get_cache_stats(request: Request) -> Response:
     """
     Get comprehensive cache statistics including hits, misses, and hit rate.
 
+    The serialized payload is reused for up to _STATS_SNAPSHOT_TTL_SECONDS, and clients
+    sending the snapshot's ETag in If-None-Match get a 304 while it is unchanged.
+
     Returns:
-        dict: Cache statistics
+        Response: Cache statistics
     """
-    try:
+    global _stats_snapshot
+    now = time.monotonic()
+    taken_at, body, etag = _stats_snapshot
+    if not body or now - taken_at >= _STATS_SNAPSHOT_TTL_SECONDS:
         cache = get_cache()
         stats = cache.stats()
 
         logger.info("Cache statistics retrieved", **stats)
-        return {"status": "success", "data": stats}
-    except Exception as e:
-        logger.error("Failed to get cache statistics", error=str(e))
-        raise HTTPException(status_code=500, detail=f"Failed to get cache statistics: {str(e)}")
+        body = orjson.dumps({"status": "success", "data": stats})
+        etag = compute_etag(body)
+        _stats_snapshot = (now, body, etag)
+
+    if etag_matches(request, etag):
+        return not_modified(etag, _STATS_CACHE_CONTROL)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": _STATS_CACHE_CONTROL},
+    )
 
 
 @router.delete("/clear", summary="Clear All Cache")
@@ -39,15 +69,12 @@ async def clear_cache() -> Dict[str, str]:
     Returns:
         dict: Success message
     """
-    try:
-        cache = get_cache()
-        cache.clear()
+    cache = get_cache()
+    cache.clear()
+    _invalidate_stats_snapshot()
 
-        logger.warning("Cache cleared manually")
-        return {"status": "success", "message": "All cache entries cleared successfully"}
-    except Exception as e:
-        logger.error("Failed to clear cache", error=str(e))
-        raise HTTPException(status_code=500, detail=f"Failed to clear cache: {str(e)}")
+    logger.warning("Cache cleared manually")
+    return {"status": "success", "message": "All cache entries cleared successfully"}
 
 
 @router.delete("/key/{key:path}", summary="Delete Specific Cache Key")
@@ -61,27 +88,23 @@ async def delete_cache_key(key: str) -> Dict[str, Any]:
     Returns:
         dict: Success status and message
     """
-    try:
-        cache = get_cache()
-        deleted = cache.delete(key)
-
-        if deleted:
-            logger.info("Cache key deleted", key=key)
-            return {
-                "status": "success",
-                "message": f"Cache key '{key}' deleted successfully",
-                "deleted": True,
-            }
-        else:
-            logger.debug("Cache key not found", key=key)
-            return {
-                "status": "success",
-                "message": f"Cache key '{key}' not found",
-                "deleted": False,
-            }
-    except Exception as e:
-        logger.error("Failed to delete cache key", key=key, error=str(e))
-        raise HTTPException(status_code=500, detail=f"Failed to delete cache key: {str(e)}")
+    cache = get_cache()
+    deleted = cache.delete(key)
+
+    if deleted:
+        logger.info("Cache key deleted", key=key)
+        return {
+            "status": "success",
+            "message": f"Cache key '{key}' deleted successfully",
+            "deleted": True,
+        }
+    else:
+        logger.debug("Cache key not found", key=key)
+        return {
+            "status": "success",
+            "message": f"Cache key '{key}' not found",
+            "deleted": False,
+        }
 
 
 @router.delete("/pattern/{pattern}", summary="Delete Cache Keys by Pattern")
@@ -95,19 +118,15 @@ async def delete_cache_pattern(pattern: str) -> Dict[str, Any]:
     Returns:
         dict: Number of keys deleted
     """
-    try:
-        cache = get_cache()
-        deleted_count = cache.delete_pattern(pattern)
+    cache = get_cache()
+    deleted_count = cache.delete_pattern(pattern)
 
-        logger.info("Cache pattern deleted", pattern=pattern, count=deleted_count)
-        return {
-            "status": "success",
-            "message": f"Deleted {deleted_count} cache entries matching pattern '{pattern}'",
-            "deleted_count": deleted_count,
-        }
-    except Exception as e:
-        logger.error("Failed to delete cache pattern", pattern=pattern, error=str(e))
-        raise HTTPException(status_code=500, detail=f"Failed to delete cache pattern: {str(e)}")
+    logger.info("Cache pattern deleted", pattern=pattern, count=deleted_count)
+    return {
+        "status": "success",
+        "message": f"Deleted {deleted_count} cache entries matching pattern '{pattern}'",
+        "deleted_count": deleted_count,
+    }
 
 
 @router.post("/cleanup", summary="Cleanup Expired Entries")
@@ -118,19 +137,15 @@ async def cleanup_expired() -> Dict[str, Any]:
     Returns:
         dict: Number of expired entries removed
     """
-    try:
-        cache = get_cache()
-        removed_count = cache.cleanup_expired()
+    cache = get_cache()
+    removed_count = cache.cleanup_expired()
 
-        logger.info("Manual cache cleanup completed", removed=removed_count)
-        return {
-            "status": "success",
-            "message": f"Removed {removed_count} expired cache entries",
-            "removed_count": removed_count,
-        }
-    except Exception as e:
-        logger.error("Failed to cleanup expired entries", error=str(e))
-        raise HTTPException(status_code=500, detail=f"Failed to cleanup expired entries: {str(e)}")
+    logger.info("Manual cache cleanup completed", removed=removed_count)
+    return {
+        "status": "success",
+        "message": f"Removed {removed_count} expired cache entries",
+        "removed_count": removed_count,
+    }
 
 
 @router.post("/reset-stats", summary="Reset Cache Statistics")
@@ -142,12 +157,9 @@ async def reset_cache_stats() -> Dict[str, str]:
     Returns:
         dict: Success message
     """
-    try:
-        cache = get_cache()
-        cache.reset_stats()
+    cache = get_cache()
+    cache.reset_stats()
+    _invalidate_stats_snapshot()
 
-        logger.info("Cache statistics reset")
-        return {"status": "success", "message": "Cache statistics reset successfully"}
-    except Exception as e:
-        logger.error("Failed to reset cache statistics", error=str(e))
-        raise HTTPException(status_code=500, detail=f"Failed to reset cache statistics: {str(e)}")
+    logger.info("Cache statistics reset")
+    return {"status": "success", "message": "Cache statistics reset successfully"}
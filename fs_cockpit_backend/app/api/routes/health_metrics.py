@@ -1,14 +1,25 @@
 """API routes for health metrics and uptime/downtime tracking."""
 
+from typing import Literal
+
 import structlog
 from fastapi import APIRouter, Query
+from fastapi.responses import ORJSONResponse
 
 from app.utils.health_metrics import get_health_tracker
 
 # logging configuration
 logger = structlog.get_logger(__name__)
 
-router = APIRouter(prefix="/api/v1/health", tags=["Health Metrics"])
+router = APIRouter(
+    prefix="/api/v1/health", tags=["Health Metrics"], default_response_class=ORJSONResponse
+)
+
+# Route-level service name -> tracker service name (built once at import)
+_SERVICE_MAP = {"servicenow": "ServiceNow", "intune": "Intune", "nextthink": "NextThink"}
+
+# Validated by FastAPI, so unknown services get a 422 before the handler runs
+ServiceName = Literal["servicenow", "intune", "nextthink"]
 
 
 @router.get("/metrics", summary="Get Service Uptime/Downtime Metrics")
@@ -51,12 +62,12 @@ async def get_health_metrics(
     """
     logger.info("Fetching health metrics", hours=hours)
     tracker = get_health_tracker()
-    return tracker.get_all_services_stats(hours=hours)
+    return ORJSONResponse(content=tracker.get_all_services_stats(hours=hours))
 
 
 @router.get("/metrics/{service}", summary="Get Specific Service Metrics")
 async def get_service_metrics(
-    service: str,
+    service: ServiceName,
     hours: int = Query(default=24, ge=1, le=168, description="Hours to look back (1-168)"),
 ):
     """
@@ -69,12 +80,7 @@ async def get_service_metrics(
     Returns:
         dict: Detailed metrics for the specified service
     """
-    # Normalize service name
-    service_map = {"servicenow": "ServiceNow", "intune": "Intune", "nextthink": "NextThink"}
-
-    service_name = service_map.get(service.lower())
-    if not service_name:
-        return {"error": f"Unknown service: {service}", "valid_services": list(service_map.keys())}
+    service_name = _SERVICE_MAP[service]
 
     logger.info("Fetching service metrics", service=service_name, hours=hours)
     tracker = get_health_tracker()
@@ -83,7 +89,7 @@ async def get_service_metrics(
 
 @router.get("/history/{service}", summary="Get Service Health History")
 async def get_service_history(
-    service: str,
+    service: ServiceName,
     limit: int = Query(default=50, ge=1, le=500, description="Number of recent records"),
 ):
     """
@@ -96,20 +102,17 @@ async def get_service_history(
     Returns:
         list: Recent health check records
     """
-    # Normalize service name
-    service_map = {"servicenow": "ServiceNow", "intune": "Intune", "nextthink": "NextThink"}
-
-    service_name = service_map.get(service.lower())
-    if not service_name:
-        return {"error": f"Unknown service: {service}", "valid_services": list(service_map.keys())}
+    service_name = _SERVICE_MAP[service]
 
     logger.info("Fetching service history", service=service_name, limit=limit)
     tracker = get_health_tracker()
     history = tracker.get_recent_history(service_name, limit=limit)
 
-    return {
-        "service": service_name,
-        "limit": limit,
-        "records_returned": len(history),
-        "history": history,
-    }
+    return ORJSONResponse(
+        content={
+            "service": service_name,
+            "limit": limit,
+            "records_returned": len(history),
+            "history": history,
+        }
+    )
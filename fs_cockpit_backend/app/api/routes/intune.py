@@ -1,21 +1,30 @@
 """API routes for Intune integration."""
 
+from functools import lru_cache
+
 import structlog
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 
-from app.middleware.request_id import get_request_id as _get_request_id
+from app.middleware.request_id import request_id_dependency as _get_request_id
 from app.schemas.device import DeviceDTO, DeviceListResponse
 from app.services.intune_service import IntuneService
 
 # logging configuration
 logger = structlog.get_logger(__name__)
 
-router = APIRouter(prefix="/api/v1/intune", tags=["Intune"])
+router = APIRouter(prefix="/api/v1/intune", tags=["Intune"], default_response_class=ORJSONResponse)
+
+
+@lru_cache
+def _intune_service() -> IntuneService:
+    """Build the shared IntuneService instance (the service only holds settings)."""
+    return IntuneService()
 
 
 async def get_service():
     """Dependency to get IntuneService instance."""
-    return IntuneService()
+    return _intune_service()
 
 
 @router.get("/health", summary="Intune Health Check")
@@ -1,11 +1,16 @@
 """API routes for NextThink integration."""
 
 import asyncio
+from functools import lru_cache
+from typing import Any, FrozenSet, Optional, Tuple
 
+import orjson
 import structlog
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 
-from app.middleware.request_id import get_request_id as _get_request_id
+from app.middleware.request_id import request_id_dependency as _get_request_id
+from app.schemas.incident import IncidentDTO
 from app.schemas.diagnostics import (
     AVAILABLE_DIAGNOSTIC_CATEGORIES,
     ComprehensiveDiagnosticsResponse,
@@ -21,26 +26,77 @@ from app.schemas.remote_action import (
 from app.services.nextthink_diagnostics_service import NextThinkDiagnosticsService
 from app.services.nextthink_service import NextThinkService
 from app.services.servicenow_service import ServiceNowService
+from app.utils.http_cache import compute_etag, etag_matches, not_modified
 
 # logging configuration
 logger = structlog.get_logger(__name__)
 
-router = APIRouter(prefix="/api/v1/nextthink", tags=["NextThink"])
+router = APIRouter(
+    prefix="/api/v1/nextthink", tags=["NextThink"], default_response_class=ORJSONResponse
+)
+
+# Static diagnostics category descriptors (built once at import)
+_CATEGORY_DESCRIPTIONS = {
+    "hardware": "CPU, GPU, Memory, Disk, Battery diagnostics (last 24 hours for CPU/GPU)",
+    "os_health": "Operating System build, uptime, drivers, restart status",
+    "security": "Encryption, antivirus, firewall, vulnerability status",
+    "compliance": "Patch status, compliance score, policy violations",
+    "incident_history": "Past ServiceNow tickets, recurring issues",
+    "logs": "System event logs, application crashes, BSOD incidents",
+    "services": "Running services, processes, resource consumption",
+    "network": "Network connectivity, interfaces, DNS, latency",
+}
+_CATEGORIES_PAYLOAD = [
+    {"name": cat, "description": _CATEGORY_DESCRIPTIONS.get(cat, "Diagnostics for this category")}
+    for cat in AVAILABLE_DIAGNOSTIC_CATEGORIES
+]
+_CATEGORIES_TOTAL = len(AVAILABLE_DIAGNOSTIC_CATEGORIES)
+_CATEGORIES_ETAG = compute_etag(orjson.dumps(_CATEGORIES_PAYLOAD))
+_CATEGORIES_CACHE_CONTROL = "public, max-age=3600"
+
+
+@lru_cache(maxsize=256)
+def _parse_status(status: str) -> Optional[FrozenSet[str]]:
+    """
+    Parse a comma-separated status query value into lower-cased, non-empty statuses.
+
+    Only a handful of distinct values are ever sent, so results are cached.
+    """
+    statuses = frozenset(s.strip().lower() for s in status.split(",")) - {""}
+    return statuses or None
+
+
+@lru_cache
+def _nextthink_service() -> NextThinkService:
+    """Build the shared NextThinkService instance (the service only holds settings)."""
+    return NextThinkService()
+
+
+@lru_cache
+def _servicenow_service() -> ServiceNowService:
+    """Build the shared ServiceNowService instance."""
+    return ServiceNowService()
+
+
+@lru_cache
+def _diagnostics_service() -> NextThinkDiagnosticsService:
+    """Build the shared NextThinkDiagnosticsService instance."""
+    return NextThinkDiagnosticsService()
 
 
 async def get_service():
     """Dependency to get NextThinkService instance."""
-    return NextThinkService()
+    return _nextthink_service()
 
 
 async def get_servicenow_service():
     """Dependency to get ServiceNowService instance."""
-    return ServiceNowService()
+    return _servicenow_service()
 
 
 async def get_diagnostics_service():
     """Dependency to get NextThinkDiagnosticsService instance."""
-    return NextThinkDiagnosticsService()
+    return _diagnostics_service()
 
 
 @router.get("/health", summary="NextThink Health Check")
@@ -82,7 +138,7 @@ async def nextthink_authenticate(
 @router.get(
     "/remote-actions",
     summary="Get Remote Actions",
-    response_model=RemoteActionListResponse,
+    responses={200: {"model": RemoteActionListResponse}},
 )
 async def get_remote_actions(
     device_name: str,
@@ -112,11 +168,9 @@ async def get_remote_actions(
         - Get top 10 recent: ?device_name=CPC-vijay-BSCCU&limit=10&days=7
     """
     # Parse status filter
-    status_filter = None
-    if status:
-        status_filter = [s.strip() for s in status.split(",")]
+    status_filter = _parse_status(status) if status else None
 
-    logger.info(
+    logger.debug(
         "Fetching remote actions",
         device_name=device_name,
         query_type=query_type,
@@ -133,7 +187,12 @@ async def get_remote_actions(
         limit=limit,
     )
 
-    return {"actions": actions, "total": len(actions)}
+    return ORJSONResponse(
+        content={
+            "actions": [action.model_dump(mode="json") for action in actions],
+            "total": len(actions),
+        }
+    )
 
 
 @router.get(
@@ -161,37 +220,88 @@ async def get_remote_action_by_id(action_id: str, service: NextThinkService = De
 @router.post(
     "/remote-actions/execute",
     summary="Execute Remote Action",
-    response_model=RemoteActionExecuteResponse,
+    status_code=202,
+    responses={202: {"model": RemoteActionExecuteResponse}},
 )
 async def execute_remote_action(
-    request: RemoteActionExecuteRequest, service: NextThinkService = Depends(get_service)
+    request: RemoteActionExecuteRequest,
+    background_tasks: BackgroundTasks,
+    service: NextThinkService = Depends(get_service),
 ):
     """
-    Execute a remote action on NextThink.
+    Submit a remote action to NextThink.
+
+    Returns 202 Accepted as soon as NextThink has queued the action; poll
+    GET /remote-actions/{actionId} for its progress. The action is recorded in the
+    database after the response is sent.
 
     Args:
         request (RemoteActionExecuteRequest): The action execution request
 
     Returns:
-        RemoteActionExecuteResponse: Execution response
+        RemoteActionExecuteResponse: Submission response with the action ID to poll
     """
     logger.info(
         "Executing remote action", action_type=request.actionType, device_id=request.deviceId
     )
     result = await service.execute_remote_action(request)
+    background_tasks.add_task(service.record_remote_action, request, result)
 
-    # Map the response to the expected format
-    return RemoteActionExecuteResponse(
+    # Map the response to the expected format (server-built, so skip re-validation)
+    response = RemoteActionExecuteResponse.model_construct(
         actionId=result.get("actionId", result.get("id", "")),
         status=result.get("status", "unknown"),
         message=result.get("message", result.get("msg")),
     )
+    return ORJSONResponse(content=response.model_dump(mode="json"), status_code=202)
+
+
+async def _resolve_device_name(
+    incident: IncidentDTO,
+    request: RecommendationRequest,
+    servicenow_service: ServiceNowService,
+    prefetched_caller_device: Any,
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Resolve the device to recommend actions for, returning at the first source that applies.
+
+    Priority: device_name from the request, the incident's cmdb_ci, then the caller's device
+    (the request's caller_id, looked up alongside the incident, or the incident's caller).
+
+    Args:
+        incident (IncidentDTO): The incident being resolved
+        request (RecommendationRequest): The recommendation request
+        servicenow_service (ServiceNowService): Service used for ServiceNow lookups
+        prefetched_caller_device: Result (or exception) of the caller_id lookup, if one ran
+
+    Returns:
+        Tuple[Optional[str], Optional[str]]: (device name, source), or (None, None)
+    """
+    if request.device_name:
+        return request.device_name, "request"
+
+    if incident.deviceName:
+        # cmdb_ci may hold a sys_id rather than the device name
+        resolved_name = await servicenow_service.resolve_device_name(incident.deviceName)
+        return resolved_name or incident.deviceName, "cmdb_ci"
+
+    if request.caller_id:
+        if isinstance(prefetched_caller_device, BaseException):
+            raise prefetched_caller_device
+        caller_device, source = prefetched_caller_device, "caller_id"
+    elif incident.callerId:
+        caller_device = await servicenow_service.get_device_name_from_caller(incident.callerId)
+        source = "incident_caller"
+    else:
+        return None, None
+
+    return (caller_device, source) if caller_device else (None, None)
 
 
 @router.post(
     "/recommendations",
     summary="Get Remote Action Recommendations for Incident",
-    response_model=RecommendationResponse,
+    responses={200: {"model": RecommendationResponse}},
 )
 async def get_recommendations(
     request: RecommendationRequest,
@@ -228,88 +338,79 @@ async def get_recommendations(
             "incident_number": "INC0002012"
         }
     """
-    logger.info("Getting recommendations for incident", incident_number=request.incident_number)
+    logger.debug("Getting recommendations for incident", incident_number=request.incident_number)
 
-    # Fetch incident details from ServiceNow
-    incident = await servicenow_service.fetch_incident_details(request.incident_number)
+    candidate_actions = None
+    caller_device = None
+    if request.device_name:
+        # Device is known up front: fetch its remote actions alongside the incident
+        incident, candidate_actions = await asyncio.gather(
+            servicenow_service.fetch_incident_details(request.incident_number),
+            nextthink_service.get_recommendation_candidates(request.device_name),
+            return_exceptions=True,
+        )
+        if isinstance(incident, BaseException):
+            raise incident
+        if isinstance(candidate_actions, BaseException):
+            # Retried inside get_recommendations_for_incident so the error surfaces there
+            candidate_actions = None
+    elif request.caller_id:
+        # The caller's device is only used when the incident has no CI, but looking it up
+        # alongside the incident saves a serial ServiceNow round trip when it is needed
+        incident, caller_device = await asyncio.gather(
+            servicenow_service.fetch_incident_details(request.incident_number),
+            servicenow_service.get_device_name_from_caller(request.caller_id),
+            return_exceptions=True,
+        )
+        if isinstance(incident, BaseException):
+            raise incident
+    else:
+        # Fetch incident details from ServiceNow
+        incident = await servicenow_service.fetch_incident_details(request.incident_number)
 
     if not incident:
         raise HTTPException(
             status_code=404, detail=f"Incident {request.incident_number} not found in ServiceNow"
         )
 
-    # Override device name if provided in request body
-    if request.device_name:
-        incident.deviceName = request.device_name
-        logger.info("Using override device name", device_name=request.device_name)
-    else:
-        # Parallel execution: resolve device name and get device from caller simultaneously
-        # These operations are independent and can run in parallel
-        resolve_device_task = None
-        get_caller_device_task = None
-
-        # Task 1: Try to resolve device name if it's a sys_id
-        if incident.deviceName:
-            resolve_device_task = servicenow_service.resolve_device_name(incident.deviceName)
-
-        # Task 2: Try to get device from caller_id (from request or incident)
-        caller_sys_id = request.caller_id or incident.callerId
-        if not incident.deviceName and caller_sys_id:
-            get_caller_device_task = servicenow_service.get_device_name_from_caller(caller_sys_id)
-
-        # Execute tasks in parallel if both exist
-        if resolve_device_task and get_caller_device_task:
-            resolved_name, device_from_caller = await asyncio.gather(
-                resolve_device_task, get_caller_device_task, return_exceptions=True
-            )
-            # Use resolved name if available, otherwise use caller device
-            if not isinstance(resolved_name, Exception) and resolved_name:
-                incident.deviceName = resolved_name
-                logger.info("Resolved device name from cmdb_ci", device_name=resolved_name)
-            elif not isinstance(device_from_caller, Exception) and device_from_caller:
-                incident.deviceName = device_from_caller
-                logger.info("Resolved device name from caller", device_name=device_from_caller)
-        elif resolve_device_task:
-            resolved_name = await resolve_device_task
-            if resolved_name:
-                incident.deviceName = resolved_name
-                logger.info("Resolved device name from cmdb_ci", device_name=resolved_name)
-        elif get_caller_device_task:
-            logger.info("Attempting to get device from caller", caller_id=caller_sys_id)
-            device_from_caller = await get_caller_device_task
-            if device_from_caller:
-                incident.deviceName = device_from_caller
-                logger.info(
-                    "Resolved device name from caller",
-                    device_name=device_from_caller,
-                    source="request" if request.caller_id else "incident",
-                )
+    # The DTO is shared with the cache and coalesced callers; resolve the device on a copy
+    incident = incident.model_copy()
+
+    device_name, source = await _resolve_device_name(
+        incident, request, servicenow_service, caller_device
+    )
+    if device_name:
+        incident.deviceName = device_name
+        logger.debug("Resolved device name", device_name=device_name, source=source)
 
     # Get recommendations using category-based filtering
     recommendations = await nextthink_service.get_recommendations_for_incident(
-        incident=incident, limit=request.limit or 10
+        incident=incident, limit=request.limit or 10, candidate_actions=candidate_actions
     )
 
     # Extract category info from incident
     category = incident.category or "unknown"
 
-    response = RecommendationResponse(
-        incident_number=request.incident_number,
-        device_name=incident.deviceName,
-        category=category,
-        recommendations=recommendations,
-        total=len(recommendations),
-    )
-
     # Add helpful messages
+    message = None
     if not incident.deviceName:
-        response.message = (
+        message = (
             "No device name found in incident. Remote action recommendations require a device name. "
             "Please either: 1) Add 'device_name' to the request body, or 2) Update the incident's 'Configuration Item' (cmdb_ci) field in ServiceNow, "
             "or 3) Include a device name in the incident description using patterns like 'CPC-*', 'LAPTOP-*', etc."
         )
     elif not recommendations:
-        response.message = f"No relevant remote actions found for device '{incident.deviceName}' in the last 30 days."
+        message = f"No relevant remote actions found for device '{incident.deviceName}' in the last 30 days."
+
+    # Built in one step from trusted service output, so skip re-validation
+    response = RecommendationResponse.model_construct(
+        incident_number=request.incident_number,
+        device_name=incident.deviceName,
+        category=category,
+        recommendations=recommendations,
+        total=len(recommendations),
+        message=message,
+    )
 
     logger.info(
         "Recommendations generated",
@@ -318,13 +419,13 @@ async def get_recommendations(
         recommendations_count=len(recommendations),
     )
 
-    return response
+    return ORJSONResponse(content=response.model_dump(mode="json"))
 
 
 @router.post(
     "/diagnostics",
     summary="Get Device Diagnostics (Full or Partial)",
-    response_model=ComprehensiveDiagnosticsResponse,
+    responses={200: {"model": ComprehensiveDiagnosticsResponse}},
 )
 async def get_device_diagnostics(
     request: DiagnosticsRequest,
@@ -384,7 +485,7 @@ async def get_device_diagnostics(
         - services: Running applications and services
         - network: Network connectivity and status
     """
-    logger.info(
+    logger.debug(
         "Device diagnostics requested",
         request_id=request_id,
         device_name=request.device_name,
@@ -407,20 +508,12 @@ async def get_device_diagnostics(
                 detail=f"Invalid categories: {', '.join(invalid_cats)}. Available: {', '.join(AVAILABLE_DIAGNOSTIC_CATEGORIES)}",
             )
 
-    try:
-        diagnostics = await service.get_device_diagnostics(request)
-        diagnostics.__dict__["request_id"] = request_id
-        return diagnostics
-    except Exception as e:  # noqa: BLE001
-        logger.error(
-            "Error retrieving device diagnostics",
-            request_id=request_id,
-            device_name=request.device_name,
-            error=str(e),
-        )
-        raise HTTPException(
-            status_code=500, detail=f"Failed to retrieve diagnostics: {str(e)}"
-        ) from e
+    # Failures surface through GlobalErrorHandlerMiddleware
+    diagnostics = await service.get_device_diagnostics(request)
+    # Add request_id to the dumped body; the model may be the shared cached instance
+    body = diagnostics.model_dump(mode="json")
+    body["request_id"] = request_id
+    return ORJSONResponse(content=body)
 
 
 @router.get(
@@ -428,11 +521,14 @@ async def get_device_diagnostics(
     summary="Get Available Diagnostic Categories",
     response_model=dict,
 )
-async def get_diagnostic_categories(request_id: str = Depends(_get_request_id)):
+async def get_diagnostic_categories(
+    http_request: Request, request_id: str = Depends(_get_request_id)
+):
     """
     Get list of available diagnostic categories that can be queried.
 
     This is useful for understanding what categories can be selected in partial diagnostics mode.
+    The list is static, so clients sending a matching If-None-Match get a 304.
 
     Returns:
         dict: Available categories and their descriptions
@@ -453,27 +549,16 @@ async def get_diagnostic_categories(request_id: str = Depends(_get_request_id)):
             ]
         }
     """
-    logger.info("Fetching diagnostic categories", request_id=request_id)
-
-    category_descriptions = {
-        "hardware": "CPU, GPU, Memory, Disk, Battery diagnostics (last 24 hours for CPU/GPU)",
-        "os_health": "Operating System build, uptime, drivers, restart status",
-        "security": "Encryption, antivirus, firewall, vulnerability status",
-        "compliance": "Patch status, compliance score, policy violations",
-        "incident_history": "Past ServiceNow tickets, recurring issues",
-        "logs": "System event logs, application crashes, BSOD incidents",
-        "services": "Running services, processes, resource consumption",
-        "network": "Network connectivity, interfaces, DNS, latency",
-    }
-
-    return {
-        "request_id": request_id,
-        "total_categories": len(AVAILABLE_DIAGNOSTIC_CATEGORIES),
-        "categories": [
-            {
-                "name": cat,
-                "description": category_descriptions.get(cat, "Diagnostics for this category"),
-            }
-            for cat in AVAILABLE_DIAGNOSTIC_CATEGORIES
-        ],
-    }
+    logger.debug("Fetching diagnostic categories", request_id=request_id)
+
+    if etag_matches(http_request, _CATEGORIES_ETAG):
+        return not_modified(_CATEGORIES_ETAG, _CATEGORIES_CACHE_CONTROL)
+
+    return ORJSONResponse(
+        content={
+            "request_id": request_id,
+            "total_categories": _CATEGORIES_TOTAL,
+            "categories": _CATEGORIES_PAYLOAD,
+        },
+        headers={"ETag": _CATEGORIES_ETAG, "Cache-Control": _CATEGORIES_CACHE_CONTROL},
+    )
@@ -3,33 +3,147 @@ ServiceNow API Routes Module
 This module defines API routes for interacting with the ServiceNow platform.
 """
 
+import asyncio
+from functools import lru_cache, partial
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Tuple
+
+import orjson
 import structlog
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel
 
-from app.middleware.request_id import get_request_id as _get_request_id
+from app.config.settings import get_settings
+from app.middleware.request_id import request_id_dependency as _get_request_id
 from app.schemas.computer import ComputerListResponse
 from app.schemas.incident import (
     IncidentDTO,
     PaginatedIncidentListResponse,
+    PaginationMetadata,
 )
 from app.schemas.knowledge import KnowledgeSearchResponse
 from app.schemas.solution_summary import SolutionSummaryResponse
 from app.services.servicenow_service import ServiceNowService
+from app.utils.http_cache import conditional_body_response, conditional_json_response
+from app.utils.incident_utils import IncidentUtils
 
 # logging configuration
 logger = structlog.get_logger(__name__)
 
-router = APIRouter(prefix="/api/v1/servicenow", tags=["ServiceNow"])
+router = APIRouter(
+    prefix="/api/v1/servicenow", tags=["ServiceNow"], default_response_class=ORJSONResponse
+)
+
+# Incident lists, details and KB results are served from a short service-side cache, so
+# browsers may reuse them briefly and revalidate with If-None-Match afterwards.
+# Incidents carry caller PII and stay private. KB results are the same for every user,
+# but behind Azure AD a shared cache (CDN/reverse proxy) would hand an authenticated
+# response to anonymous callers, so they are only public when auth is disabled.
+_INCIDENT_CACHE_CONTROL = "private, max-age=30"
+_PUBLIC_KNOWLEDGE_CACHE_CONTROL = "public, max-age=30, s-maxage=300, stale-while-revalidate=60"
+_KNOWLEDGE_VARY = "Accept-Encoding"
+# Username -> sys_id mappings and device assignments rarely change (service TTLs are
+# 1 hour and 15 minutes); solution summaries are cached for 15 minutes service-side
+_USER_SYS_ID_CACHE_CONTROL = "private, max-age=3600"
+_DEVICES_CACHE_CONTROL = "private, max-age=300"
+_SOLUTION_CACHE_CONTROL = "private, max-age=300"
+# GZipMiddleware buffers a streamed body until it ends, which would hold back the first
+# NDJSON line; it leaves responses that already declare an encoding alone
+_NDJSON_HEADERS = {"Content-Encoding": "identity"}
+
+
+@lru_cache
+def _servicenow_service() -> ServiceNowService:
+    """Build the shared ServiceNowService instance (the service only holds settings)."""
+    return ServiceNowService()
 
 
 async def get_service():
     """Dependency to get ServiceNowService instance."""
-    return ServiceNowService()
+    return _servicenow_service()
+
+
+# Shared dependency markers, declared once instead of in every route signature
+_SN_SERVICE = Depends(get_service)
+_REQUEST_ID = Depends(_get_request_id)
+
+
+def _knowledge_cache_control() -> str:
+    """Cache-Control for KB results: shared caches may keep them only without auth."""
+    if get_settings().AZURE_AD_ENABLED:
+        return _INCIDENT_CACHE_CONTROL
+    return _PUBLIC_KNOWLEDGE_CACHE_CONTROL
+
+
+def _decode_cursor(cursor: str | None) -> tuple[str, str] | None:
+    """Decode the `cursor` query parameter, rejecting malformed values with a 400."""
+    if cursor is None:
+        return None
+    try:
+        return IncidentUtils.decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor") from e
+
+
+def _paginated_incidents_response(
+    request: Request, dtos: List[IncidentDTO], total: int, limit: int, offset: int
+) -> Response:
+    """
+    Serialize a page of incidents straight to JSON bytes, honouring If-None-Match.
+
+    The DTOs were validated when mapped from ServiceNow, so the page is assembled with
+    model_construct and dumped by pydantic-core without another validation pass.
+    """
+    has_more = offset + len(dtos) < total
+    next_cursor = IncidentUtils.encode_cursor(dtos[-1]) if has_more and dtos else None
+    page = PaginatedIncidentListResponse.model_construct(
+        incidents=dtos,
+        pagination=PaginationMetadata.model_construct(
+            total=total, limit=limit, offset=offset, has_more=has_more, next_cursor=next_cursor
+        ),
+    )
+    return conditional_body_response(
+        request, page.model_dump_json().encode(), _INCIDENT_CACHE_CONTROL
+    )
+
+
+def _encode_pydantic(obj: Any) -> Any:
+    """orjson `default` hook for the DTOs nested in service result dicts."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError
+
+
+async def _tagged(kind: str, call: Awaitable[dict]) -> Tuple[str, dict]:
+    """Await a service call and label its result (or its error) for the NDJSON stream."""
+    try:
+        return kind, await call
+    except Exception as e:  # noqa: BLE001
+        # The 200 status is already sent, so a failed part is reported in its own line
+        logger.error("Incident log stream part failed", kind=kind, error=str(e))
+        return kind, {"error": str(e)}
+
+
+async def _stream_incident_logs(
+    calls: List[Tuple[str, Callable[[], Awaitable[dict]]]], request_id: str
+) -> AsyncIterator[bytes]:
+    """Yield one NDJSON line per finished service call, fastest first."""
+    # Started here, so nothing runs unless the response is actually streamed
+    tasks = [asyncio.ensure_future(_tagged(kind, call())) for kind, call in calls]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            kind, result = await finished
+            line = {"kind": kind, **result, "request_id": request_id}
+            yield orjson.dumps(line, default=_encode_pydantic) + b"\n"
+    finally:
+        # The client may disconnect before both parts were sent
+        for task in tasks:
+            task.cancel()
 
 
 @router.get("/health", summary="ServiceNow Health Check")
 async def servicenow_health_check(
-    request_id: str = Depends(_get_request_id), service: ServiceNowService = Depends(get_service)
+    request_id: str = _REQUEST_ID, service: ServiceNowService = _SN_SERVICE
 ):
     """
     Health check endpoint for ServiceNow integration.
@@ -39,39 +153,47 @@ async def servicenow_health_check(
     Returns:
         dict: A dictionary indicating the health status.
     """
-    logger.info("ServiceNow health check", request_id=request_id)
+    logger.debug("ServiceNow health check", request_id=request_id)
     result = await service.health_check()
     result["request_id"] = request_id
     return result
 
 
-@router.get("/user/{username}/sys_id", summary="Get ServiceNow User Sys ID by Username")
+@router.get(
+    "/user/{username}/sys_id",
+    summary="Get ServiceNow User Sys ID by Username",
+    responses={200: {"model": str}},
+)
 async def fetch_user_sys_id_by_username(
-    username: str, service: ServiceNowService = Depends(get_service)
-):
+    username: str, request: Request, service: ServiceNowService = _SN_SERVICE
+) -> Response:
     """
     Fetch the ServiceNow `sys_id` for a user given their username.
 
     Args:
         username (str): The user_name (login) of the ServiceNow user to look up.
     Returns:
-        str: The ServiceNow `sys_id` for the user, or an empty string if not found.
+        Response: The ServiceNow `sys_id` for the user (an empty string if not found),
+            or 304 Not Modified when If-None-Match matches the current ETag.
     """
-    logger.info("Fetching ServiceNow user sys_id", username=username)
-    return await service.fetch_user_sys_id_by_username(username)
+    logger.debug("Fetching ServiceNow user sys_id", username=username)
+    sys_id = await service.fetch_user_sys_id_by_username(username)
+    return conditional_json_response(request, sys_id, _USER_SYS_ID_CACHE_CONTROL)
 
 
 @router.get(
     "/technician/{technician_username}/incidents",
     summary="Get Incidents by Technician ID with Pagination",
-    response_model=PaginatedIncidentListResponse,
+    responses={200: {"model": PaginatedIncidentListResponse}},
 )
 async def fetch_incidents_assigned_to_technician(
     technician_username: str,
+    request: Request,
     device_name: str | None = None,
     limit: int = 25,
     offset: int = 0,
-    service: ServiceNowService = Depends(get_service),
+    cursor: str | None = None,
+    service: ServiceNowService = _SN_SERVICE,
 ):
     """
     Retrieve incidents assigned to a specific technician with pagination support.
@@ -81,6 +203,7 @@ async def fetch_incidents_assigned_to_technician(
         device_name (str | None): Optional device/CMDB CI name to filter incidents.
         limit (int): Number of incidents per page (default 25, max 300).
         offset (int): Number of incidents to skip (default 0).
+        cursor (str | None): `next_cursor` from the previous page (takes precedence over offset).
 
     Returns:
         PaginatedIncidentListResponse: Paginated list of incidents with metadata.
@@ -88,32 +211,34 @@ async def fetch_incidents_assigned_to_technician(
     Example:
         GET /api/v1/servicenow/technician/john.smith/incidents?limit=25&offset=0
     """
-    logger.info(
+    logger.debug(
         "Fetching incidents for technician",
         technician_username=technician_username,
         limit=limit,
         offset=offset,
     )
-    dtos, total = await service.fetch_incidents_by_technician(
-        technician_username, cmdb_ci_name=device_name, limit=limit, offset=offset
+    dtos, total, offset = await service.fetch_incidents_by_technician(
+        technician_username,
+        cmdb_ci_name=device_name,
+        limit=limit,
+        offset=offset,
+        after=_decode_cursor(cursor),
     )
-    has_more = offset + limit < total
-    return {
-        "incidents": dtos,
-        "pagination": {"total": total, "limit": limit, "offset": offset, "has_more": has_more},
-    }
+    return _paginated_incidents_response(request, dtos, total, limit, offset)
 
 
 @router.get(
     "/user/{user_name}/incidents",
     summary="Get Incidents by User Name with Pagination",
-    response_model=PaginatedIncidentListResponse,
+    responses={200: {"model": PaginatedIncidentListResponse}},
 )
 async def fetch_incidents_by_user(
     user_name: str,
+    request: Request,
     limit: int = 25,
     offset: int = 0,
-    service: ServiceNowService = Depends(get_service),
+    cursor: str | None = None,
+    service: ServiceNowService = _SN_SERVICE,
 ):
     """
     Retrieve incidents reported by a specific user with pagination support.
@@ -122,6 +247,7 @@ async def fetch_incidents_by_user(
         user_name (str): The name/username of the user who reported the incidents.
         limit (int): Number of incidents per page (default 25, max 300).
         offset (int): Number of incidents to skip (default 0).
+        cursor (str | None): `next_cursor` from the previous page (takes precedence over offset).
 
     Returns:
         PaginatedIncidentListResponse: Paginated list of incidents with metadata.
@@ -129,25 +255,25 @@ async def fetch_incidents_by_user(
     Example:
         GET /api/v1/servicenow/user/jane.doe/incidents?limit=25&offset=0
     """
-    logger.info("Fetching incidents for user", user_name=user_name, limit=limit, offset=offset)
-    dtos, total = await service.fetch_incidents_by_user(user_name, limit=limit, offset=offset)
-    has_more = offset + limit < total
-    return {
-        "incidents": dtos,
-        "pagination": {"total": total, "limit": limit, "offset": offset, "has_more": has_more},
-    }
+    logger.debug("Fetching incidents for user", user_name=user_name, limit=limit, offset=offset)
+    dtos, total, offset = await service.fetch_incidents_by_user(
+        user_name, limit=limit, offset=offset, after=_decode_cursor(cursor)
+    )
+    return _paginated_incidents_response(request, dtos, total, limit, offset)
 
 
 @router.get(
     "/device/{device_name}/incidents",
     summary="Get Incidents by Device Name with Pagination",
-    response_model=PaginatedIncidentListResponse,
+    responses={200: {"model": PaginatedIncidentListResponse}},
 )
 async def fetch_incidents_by_device(
     device_name: str,
+    request: Request,
     limit: int = 25,
     offset: int = 0,
-    service: ServiceNowService = Depends(get_service),
+    cursor: str | None = None,
+    service: ServiceNowService = _SN_SERVICE,
 ):
     """
     Retrieve incidents related to a specific device with pagination support.
@@ -156,6 +282,7 @@ async def fetch_incidents_by_device(
         device_name (str): The name of the device.
         limit (int): Number of incidents per page (default 25, max 300).
         offset (int): Number of incidents to skip (default 0).
+        cursor (str | None): `next_cursor` from the previous page (takes precedence over offset).
 
     Returns:
         PaginatedIncidentListResponse: Paginated list of incidents with metadata.
@@ -163,77 +290,85 @@ async def fetch_incidents_by_device(
     Example:
         GET /api/v1/servicenow/device/DESKTOP-12345/incidents?limit=25&offset=0
     """
-    logger.info(
+    logger.debug(
         "Fetching incidents for device",
         device_name=device_name,
         limit=limit,
         offset=offset,
     )
-    dtos, total = await service.fetch_incidents_by_device(
-        device_name, limit=limit, offset=offset
+    dtos, total, offset = await service.fetch_incidents_by_device(
+        device_name, limit=limit, offset=offset, after=_decode_cursor(cursor)
     )
-    has_more = offset + limit < total
-    return {
-        "incidents": dtos,
-        "pagination": {"total": total, "limit": limit, "offset": offset, "has_more": has_more},
-    }
+    return _paginated_incidents_response(request, dtos, total, limit, offset)
 
 
 @router.get(
     "/incident/{incident_number}/details",
     summary="Get Incident Details by Incident Number",
-    response_model=IncidentDTO,
+    responses={200: {"model": IncidentDTO}},
 )
 async def fetch_incident_details(
-    incident_number: str, service: ServiceNowService = Depends(get_service)
-):
+    incident_number: str, request: Request, service: ServiceNowService = _SN_SERVICE
+) -> Response:
     """
     Retrieve details of a specific incident.
 
+    Clients sending the ETag of the current representation in If-None-Match get a 304.
+
     Args:
         incident_number (str): The number of the incident.
     Returns:
-        dict: A dictionary containing incident details.
+        Response: The incident details, or 304 Not Modified.
     """
-    logger.info("Fetching incident details", incident_number=incident_number)
+    logger.debug("Fetching incident details", incident_number=incident_number)
     result = await service.fetch_incident_details(incident_number)
     if result is None:
         raise HTTPException(status_code=404, detail=f"Incident {incident_number} not found")
-    return result
+    return conditional_body_response(
+        request, result.model_dump_json().encode(), _INCIDENT_CACHE_CONTROL
+    )
 
 
 @router.get(
     "/user/{user_sys_id}/devices",
     summary="Get Devices by User Sys ID",
-    response_model=ComputerListResponse,
+    responses={200: {"model": ComputerListResponse}},
 )
 async def fetch_devices_by_user(
-    user_sys_id: str, service: ServiceNowService = Depends(get_service)
-):
+    user_sys_id: str, request: Request, service: ServiceNowService = _SN_SERVICE
+) -> Response:
     """
     Retrieve devices (computers) assigned to a specific user.
 
+    The ComputerDTOs were validated when mapped from ServiceNow, so the response is
+    assembled with model_construct instead of being validated again.
+
     Args:
         user_sys_id (str): The sys_id of the user.
     Returns:
-        ComputerListResponse: A list of computers assigned to the user.
+        Response: A list of computers assigned to the user (ComputerListResponse), or 304
+            Not Modified when If-None-Match matches the current ETag.
     """
-    logger.info("Fetching devices for user", user_sys_id=user_sys_id)
+    logger.debug("Fetching devices for user", user_sys_id=user_sys_id)
     computers = await service.fetch_devices_by_user(user_sys_id)
-    return {"computers": computers, "count": len(computers)}
+    content = ComputerListResponse.model_construct(computers=computers, count=len(computers))
+    return conditional_body_response(
+        request, content.model_dump_json().encode(), _DEVICES_CACHE_CONTROL
+    )
 
 
 @router.get(
     "/knowledge/search",
     summary="Search Knowledge Articles",
-    response_model=KnowledgeSearchResponse,
+    responses={200: {"model": KnowledgeSearchResponse}},
 )
 async def search_knowledge_articles(
     query: str,
+    request: Request,
     limit: int = 5,
     use_search_api: bool = False,  # Default to Table API (more compatible)
-    service: ServiceNowService = Depends(get_service),
-):
+    service: ServiceNowService = _SN_SERVICE,
+) -> Response:
     """
     Search for knowledge articles matching the query.
     Uses ServiceNow Search API for relevance ranking by default.
@@ -244,21 +379,30 @@ async def search_knowledge_articles(
         use_search_api (bool): Use Search API (True) or Table API (False)
 
     Returns:
-        KnowledgeSearchResponse: Matching articles sorted by relevance or popularity.
+        Response: Matching articles sorted by relevance or popularity (KnowledgeSearchResponse),
+            or 304 Not Modified when If-None-Match matches the current ETag.
     """
-    logger.info("Searching knowledge articles", query=query, limit=limit)
+    logger.debug("Searching knowledge articles", query=query, limit=limit)
     articles = await service.search_knowledge_articles(query, limit, use_search_api)
-    return {"articles": articles, "count": len(articles), "query": query}
+    content = KnowledgeSearchResponse.model_construct(
+        articles=articles, count=len(articles), query=query
+    )
+    return conditional_body_response(
+        request, content.model_dump_json().encode(), _knowledge_cache_control(), _KNOWLEDGE_VARY
+    )
 
 
 @router.get(
     "/incident/{incident_number}/knowledge",
     summary="Get Knowledge Articles for Incident",
-    response_model=KnowledgeSearchResponse,
+    responses={200: {"model": KnowledgeSearchResponse}},
 )
 async def get_knowledge_for_incident(
-    incident_number: str, limit: int = 5, service: ServiceNowService = Depends(get_service)
-):
+    incident_number: str,
+    request: Request,
+    limit: int = 5,
+    service: ServiceNowService = _SN_SERVICE,
+) -> Response:
     """
     Search for knowledge articles relevant to a specific incident.
     Uses the incident's short description to find matching articles.
@@ -268,11 +412,17 @@ async def get_knowledge_for_incident(
         limit (int): Maximum number of articles (default: 5)
 
     Returns:
-        KnowledgeSearchResponse: Relevant articles sorted by relevance.
+        Response: Relevant articles sorted by relevance (KnowledgeSearchResponse), or 304 Not
+            Modified when If-None-Match matches the current ETag.
     """
-    logger.info("Fetching KB articles for incident", incident_number=incident_number)
+    logger.debug("Fetching KB articles for incident", incident_number=incident_number)
     articles = await service.search_knowledge_articles_for_incident(incident_number, limit)
-    return {"articles": articles, "count": len(articles), "query": f"incident:{incident_number}"}
+    content = KnowledgeSearchResponse.model_construct(
+        articles=articles, count=len(articles), query=f"incident:{incident_number}"
+    )
+    return conditional_body_response(
+        request, content.model_dump_json().encode(), _knowledge_cache_control(), _KNOWLEDGE_VARY
+    )
 
 
 @router.get(
@@ -281,7 +431,10 @@ async def get_knowledge_for_incident(
     response_model=SolutionSummaryResponse,
 )
 async def get_solution_summary_for_incident(
-    incident_number: str, limit: int = 3, service: ServiceNowService = Depends(get_service)
+    incident_number: str,
+    response: Response,
+    limit: int = 3,
+    service: ServiceNowService = _SN_SERVICE,
 ):
     """
     Get a summary of solution points needed to resolve a ticket.
@@ -320,10 +473,11 @@ async def get_solution_summary_for_incident(
             "message": "Solution summary extracted from 2 relevant KB articles"
         }
     """
-    logger.info(
+    logger.debug(
         "Fetching solution summary for incident", incident_number=incident_number, limit=limit
     )
     result = await service.get_solution_summary_for_incident(incident_number, limit)
+    response.headers["Cache-Control"] = _SOLUTION_CACHE_CONTROL
     return result
 
 
@@ -335,8 +489,8 @@ async def fetch_incident_comments(
     incident_number: str,
     limit: int = 100,
     offset: int = 0,
-    request_id: str = Depends(_get_request_id),
-    service: ServiceNowService = Depends(get_service),
+    request_id: str = _REQUEST_ID,
+    service: ServiceNowService = _SN_SERVICE,
 ):
     """
     Retrieve all comments and notes for a specific incident.
@@ -383,12 +537,12 @@ async def fetch_incident_comments(
             "has_more": false
         }
     """
-    logger.info(
+    logger.debug(
         "Fetching comments for incident", incident_number=incident_number, request_id=request_id
     )
     result = await service.fetch_incident_comments(incident_number, limit=limit, offset=offset)
-    result["request_id"] = request_id
-    return result
+    # The dict is shared with the cache and coalesced callers, so don't mutate it
+    return {**result, "request_id": request_id}
 
 
 @router.get(
@@ -399,8 +553,8 @@ async def fetch_incident_activity(
     incident_number: str,
     limit: int = 100,
     offset: int = 0,
-    request_id: str = Depends(_get_request_id),
-    service: ServiceNowService = Depends(get_service),
+    request_id: str = _REQUEST_ID,
+    service: ServiceNowService = _SN_SERVICE,
 ):
     """
     Retrieve activity logs (field changes and updates) for a specific incident.
@@ -459,14 +613,14 @@ async def fetch_incident_activity(
             "has_more": false
         }
     """
-    logger.info(
+    logger.debug(
         "Fetching activity logs for incident",
         incident_number=incident_number,
         request_id=request_id,
     )
     result = await service.fetch_incident_activity_logs(incident_number, limit=limit, offset=offset)
-    result["request_id"] = request_id
-    return result
+    # The dict is shared with the cache and coalesced callers, so don't mutate it
+    return {**result, "request_id": request_id}
 
 
 @router.get(
@@ -477,18 +631,24 @@ async def fetch_incident_logs(
     incident_number: str,
     limit: int = 100,
     offset: int = 0,
-    request_id: str = Depends(_get_request_id),
-    service: ServiceNowService = Depends(get_service),
+    stream: bool = False,
+    request_id: str = _REQUEST_ID,
+    service: ServiceNowService = _SN_SERVICE,
 ):
     """
     Retrieve both comments and activity logs for a specific incident in one call.
 
     Combines comments/notes and activity logs (field changes) into a single response.
+    With `stream=true` the response is NDJSON instead: one line per part, each sent as
+    soon as it is available, tagged `"kind": "comments"` or `"kind": "activity"` and
+    carrying the same fields as the /comments and /activity endpoints. A part that fails
+    is sent as `{"kind": ..., "error": ...}` instead.
 
     Args:
         incident_number (str): The incident number (e.g., "INC0024934")
         limit (int): Maximum number of items to return for each category (default: 100)
         offset (int): Pagination offset (default: 0)
+        stream (bool): Stream the two parts as NDJSON as they complete (default: False)
         request_id (str): The unique request identifier
 
     Returns:
@@ -499,6 +659,8 @@ async def fetch_incident_logs(
             - activity_logs: List of activity log entries
             - total_comments: Total comments retrieved
             - total_activity_logs: Total activity logs retrieved
+            - has_more_comments: Whether there are more comments available
+            - has_more_activity_logs: Whether there are more activity logs available
             - limit: Requested limit
             - offset: Requested offset
 
@@ -513,24 +675,37 @@ async def fetch_incident_logs(
             "activity_logs": [...],
             "total_comments": 5,
             "total_activity_logs": 12,
+            "has_more_comments": false,
+            "has_more_activity_logs": false,
             "limit": 50,
             "offset": 0,
             "request_id": "req-123..."
         }
     """
-    logger.info(
+    logger.debug(
         "Fetching comments and activity logs for incident",
         incident_number=incident_number,
         request_id=request_id,
     )
 
-    comments_result = await service.fetch_incident_comments(
-        incident_number, limit=limit, offset=offset
+    # Independent ServiceNow calls; the incident sys_id lookup they share is coalesced
+    comments_call = partial(
+        service.fetch_incident_comments, incident_number, limit=limit, offset=offset
     )
-    activity_result = await service.fetch_incident_activity_logs(
-        incident_number, limit=limit, offset=offset
+    activity_call = partial(
+        service.fetch_incident_activity_logs, incident_number, limit=limit, offset=offset
     )
 
+    if stream:
+        calls = [("comments", comments_call), ("activity", activity_call)]
+        return StreamingResponse(
+            _stream_incident_logs(calls, request_id),
+            media_type="application/x-ndjson",
+            headers=_NDJSON_HEADERS,
+        )
+
+    comments_result, activity_result = await asyncio.gather(comments_call(), activity_call())
+
     combined_result = {
         "incident_number": incident_number,
         "incident_sys_id": comments_result.get(
@@ -540,6 +715,8 @@ async def fetch_incident_logs(
         "activity_logs": activity_result.get("activity_logs", []),
         "total_comments": comments_result.get("total_comments", 0),
         "total_activity_logs": activity_result.get("total_activity_logs", 0),
+        "has_more_comments": comments_result.get("has_more", False),
+        "has_more_activity_logs": activity_result.get("has_more", False),
         "limit": limit,
         "offset": offset,
         "request_id": request_id,
@@ -11,14 +11,114 @@ with the following features:
 - Memory efficient with configurable limits
 """
 
-from datetime import datetime, timedelta
+import heapq
+import time
+from collections import OrderedDict, defaultdict
 from threading import RLock
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Cache keys are namespaced as "<namespace>:<kind>:..." (e.g. "sn:incident_details:INC001")
+_NAMESPACE_SEPARATOR = ":"
+# Keys are indexed under their "<namespace>" and "<namespace>:<kind>" prefixes
+_INDEXED_SEGMENTS = 2
+# Independently locked partitions, so unrelated keys do not contend for one lock
+_DEFAULT_STRIPES = 16
+# Stale expiry-heap records tolerated before a stripe rebuilds its heap
+_HEAP_SLACK = 64
+
+
+def _index_prefixes(key: str) -> Tuple[str, ...]:
+    """Return the prefixes a key is indexed under, e.g. ("sn", "sn:incident_details")."""
+    segments = key.split(_NAMESPACE_SEPARATOR, _INDEXED_SEGMENTS)
+    # The last segment is the remainder of the key, not a complete prefix
+    return tuple(_NAMESPACE_SEPARATOR.join(segments[: i + 1]) for i in range(len(segments) - 1))
+
+
+class _CacheStripe:
+    """One independently locked partition of an InMemoryCache."""
+
+    __slots__ = (
+        "entries",
+        "prefix_index",
+        "expiry_heap",
+        "lock",
+        "max_size",
+        "hits",
+        "misses",
+        "evictions",
+        "sets",
+    )
+
+    def __init__(self, max_size: int):
+        # key -> (value, monotonic expiry), ordered from least to most recently used
+        self.entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        # key prefix -> keys, so pattern deletes only scan the namespace/kind they target
+        self.prefix_index: Dict[str, Set[str]] = defaultdict(set)
+        # (expiry, key) min-heap; entries for overwritten or deleted keys are skipped lazily
+        self.expiry_heap: List[Tuple[float, str]] = []
+        self.lock = RLock()
+        self.max_size = max_size
+        # Statistics, updated under the lock the operation already holds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.sets = 0
+
+    def add(self, key: str, value: Any, expiry: float) -> int:
+        """
+        Store an entry and return how many LRU entries were evicted to make room.
+        Caller must hold the lock.
+        """
+        evicted = 0
+        if key in self.entries:
+            self.entries.move_to_end(key)
+        else:
+            # Make room by dropping the least recently used entries
+            while self.entries and len(self.entries) >= self.max_size:
+                self.remove(next(iter(self.entries)))
+                evicted += 1
+            for prefix in _index_prefixes(key):
+                self.prefix_index[prefix].add(key)
+        self.entries[key] = (value, expiry)
+        self.sets += 1
+        self.evictions += evicted
+        heapq.heappush(self.expiry_heap, (expiry, key))
+        if len(self.expiry_heap) > 2 * len(self.entries) + _HEAP_SLACK:
+            self._rebuild_heap()
+        return evicted
+
+    def pop_expired(self, now: float) -> int:
+        """Remove entries whose expiry has passed. Caller must hold the lock."""
+        removed = 0
+        heap = self.expiry_heap
+        while heap and heap[0][0] <= now:
+            expiry, key = heapq.heappop(heap)
+            entry = self.entries.get(key)
+            # Skip heap records left behind by an overwrite or delete
+            if entry is not None and entry[1] == expiry:
+                self.remove(key)
+                removed += 1
+        return removed
+
+    def _rebuild_heap(self) -> None:
+        """Drop stale heap records once they outnumber live entries."""
+        self.expiry_heap = [(expiry, key) for key, (_, expiry) in self.entries.items()]
+        heapq.heapify(self.expiry_heap)
+
+    def remove(self, key: str) -> None:
+        """Delete a key and its prefix index entries. Caller must hold the lock."""
+        del self.entries[key]
+        for prefix in _index_prefixes(key):
+            keys = self.prefix_index.get(prefix)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.prefix_index[prefix]
+
 
 class InMemoryCache:
     """
@@ -27,7 +127,8 @@ class InMemoryCache:
     Features:
     - Automatic expiration based on TTL
     - Size limits with LRU eviction
-    - Thread-safe for concurrent access
+    - Thread-safe for concurrent access, with keys spread over independently
+      locked stripes so unrelated keys do not contend for one lock
     - Statistics tracking (hits, misses, evictions)
     - Cleanup utilities for expired entries
 
@@ -37,26 +138,25 @@ class InMemoryCache:
         value = cache.get("key")  # Returns {"data": "value"} or None
     """
 
-    def __init__(self, max_size: int = 10000):
+    def __init__(self, max_size: int = 10000, stripes: int = _DEFAULT_STRIPES):
         """
         Initialize cache with maximum size.
 
         Args:
             max_size: Maximum number of cache entries (default 10,000)
+            stripes: Number of lock stripes; LRU eviction is per stripe, each holding
+                an equal share of max_size (default 16)
         """
-        self._cache: Dict[str, Tuple[Any, datetime, datetime]] = (
-            {}
-        )  # key -> (value, expiry, created)
-        self._lock = RLock()  # Thread-safe operations
+        stripes = max(1, min(stripes, max_size))
+        base, extra = divmod(max_size, stripes)
+        self._stripes = tuple(_CacheStripe(base + (i < extra)) for i in range(stripes))
         self._max_size = max_size
 
-        # Statistics
-        self._hits = 0
-        self._misses = 0
-        self._evictions = 0
-        self._sets = 0
+        logger.info("InMemoryCache initialized", max_size=max_size, stripes=stripes)
 
-        logger.info("InMemoryCache initialized", max_size=max_size)
+    def _stripe(self, key: str) -> _CacheStripe:
+        """Return the stripe that owns a key."""
+        return self._stripes[hash(key) % len(self._stripes)]
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -68,22 +168,31 @@ class InMemoryCache:
         Returns:
             Cached value or None if not found/expired
         """
-        with self._lock:
-            if key in self._cache:
-                value, expiry, _ = self._cache[key]
-
-                if datetime.now() < expiry:
-                    self._hits += 1
-                    logger.debug("Cache hit", key=key)
-                    return value
+        stripe = self._stripe(key)
+        expired = False
+        with stripe.lock:
+            entry = stripe.entries.get(key)
+            if entry is not None:
+                if time.monotonic() < entry[1]:
+                    stripe.entries.move_to_end(key)
                 else:
                     # Expired - remove it
-                    del self._cache[key]
-                    logger.debug("Cache expired", key=key)
-
-            self._misses += 1
-            logger.debug("Cache miss", key=key)
-            return None
+                    stripe.remove(key)
+                    entry, expired = None, True
+            if entry is not None:
+                stripe.hits += 1
+            else:
+                stripe.misses += 1
+
+        # Logging is kept out of the critical section
+        if entry is not None:
+            logger.debug("Cache hit", key=key)
+            return entry[0]
+
+        if expired:
+            logger.debug("Cache expired", key=key)
+        logger.debug("Cache miss", key=key)
+        return None
 
     def set(self, key: str, value: Any, ttl_seconds: int = 300) -> None:
         """
@@ -94,17 +203,71 @@ class InMemoryCache:
             value: Value to cache (must be serializable)
             ttl_seconds: Time to live in seconds (default 5 minutes)
         """
-        with self._lock:
-            # Check if we're at capacity and need to evict
-            if len(self._cache) >= self._max_size and key not in self._cache:
-                self._evict_lru()
+        stripe = self._stripe(key)
+        expiry = time.monotonic() + ttl_seconds
+        with stripe.lock:
+            evicted = stripe.add(key, value, expiry)
 
-            expiry = datetime.now() + timedelta(seconds=ttl_seconds)
-            created = datetime.now()
-            self._cache[key] = (value, expiry, created)
-            self._sets += 1
+        if evicted:
+            logger.debug("Cache LRU eviction", evicted=evicted)
+        logger.debug("Cache set", key=key, ttl=ttl_seconds)
 
-            logger.debug("Cache set", key=key, ttl=ttl_seconds, size=len(self._cache))
+    def many_get(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Get several values, taking each stripe's lock once for the whole batch.
+
+        Args:
+            keys: Cache keys to look up
+
+        Returns:
+            Dictionary mapping the keys that were found (and not expired) to their values
+        """
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, Any] = {}
+        for stripe, stripe_keys in self._group_by_stripe(keys).items():
+            with stripe.lock:
+                now = time.monotonic()
+                hits = 0
+                for key in stripe_keys:
+                    entry = stripe.entries.get(key)
+                    if entry is None:
+                        continue
+                    if now < entry[1]:
+                        stripe.entries.move_to_end(key)
+                        found[key] = entry[0]
+                        hits += 1
+                    else:
+                        # Expired - remove it
+                        stripe.remove(key)
+                stripe.hits += hits
+                stripe.misses += len(stripe_keys) - hits
+
+        logger.debug("Cache many_get", requested=len(keys), hits=len(found))
+        return found
+
+    def many_set(self, items: Dict[str, Any], ttl_seconds: int = 300) -> None:
+        """
+        Store several values, taking each stripe's lock once for the whole batch.
+
+        Args:
+            items: Mapping of cache key to value
+            ttl_seconds: Time to live in seconds for every item (default 5 minutes)
+        """
+        expiry = time.monotonic() + ttl_seconds
+        evicted = 0
+        for stripe, stripe_keys in self._group_by_stripe(items).items():
+            with stripe.lock:
+                for key in stripe_keys:
+                    evicted += stripe.add(key, items[key], expiry)
+
+        logger.debug("Cache many_set", count=len(items), ttl=ttl_seconds, evicted=evicted)
+
+    def _group_by_stripe(self, keys: Iterable[str]) -> Dict[_CacheStripe, List[str]]:
+        """Group keys by the stripe that owns them."""
+        groups: Dict[_CacheStripe, List[str]] = defaultdict(list)
+        for key in keys:
+            groups[self._stripe(key)].append(key)
+        return groups
 
     def delete(self, key: str) -> bool:
         """
@@ -116,80 +279,79 @@ class InMemoryCache:
         Returns:
             True if key existed and was deleted, False otherwise
         """
-        with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                logger.debug("Cache key deleted", key=key)
-                return True
-            return False
+        stripe = self._stripe(key)
+        with stripe.lock:
+            if key not in stripe.entries:
+                return False
+            stripe.remove(key)
+        logger.debug("Cache key deleted", key=key)
+        return True
 
     def delete_pattern(self, pattern: str) -> int:
         """
         Delete all keys matching pattern (contains substring).
 
+        Patterns that start with a known namespace or kind (e.g. "nt:remote_actions:DEV1:")
+        only scan the keys under that prefix instead of the whole cache; other patterns
+        fall back to a full substring scan.
+
         Args:
             pattern: String pattern to match in keys
 
         Returns:
             Number of keys deleted
         """
-        with self._lock:
-            keys_to_delete = [k for k in self._cache.keys() if pattern in k]
-            for key in keys_to_delete:
-                del self._cache[key]
-
-            if keys_to_delete:
-                logger.info("Cache pattern delete", pattern=pattern, count=len(keys_to_delete))
-
-            return len(keys_to_delete)
+        # Narrowest indexed prefix first: "nt:remote_actions" before "nt"
+        prefixes = tuple(reversed(_index_prefixes(pattern)))
+        deleted = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                candidates = stripe.entries.keys()
+                for prefix in prefixes:
+                    if prefix in stripe.prefix_index:
+                        candidates = stripe.prefix_index[prefix]
+                        break
+
+                keys_to_delete = [k for k in candidates if pattern in k]
+                for key in keys_to_delete:
+                    stripe.remove(key)
+            deleted += len(keys_to_delete)
+
+        if deleted:
+            logger.info("Cache pattern delete", pattern=pattern, count=deleted)
+
+        return deleted
 
     def clear(self) -> None:
         """Clear all cache entries."""
-        with self._lock:
-            count = len(self._cache)
-            self._cache.clear()
-            logger.info("Cache cleared", entries_removed=count)
+        count = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                count += len(stripe.entries)
+                stripe.entries.clear()
+                stripe.prefix_index.clear()
+                stripe.expiry_heap.clear()
+        logger.info("Cache cleared", entries_removed=count)
 
     def cleanup_expired(self) -> int:
         """
         Remove all expired entries from cache.
 
+        Only the earliest-expiring entries of each stripe are inspected, so the cost
+        scales with the number of expired entries rather than the cache size.
+
         Returns:
             Number of expired entries removed
         """
-        with self._lock:
-            now = datetime.now()
-            expired_keys = [key for key, (_, expiry, _) in self._cache.items() if now >= expiry]
-
-            for key in expired_keys:
-                del self._cache[key]
-
-            if expired_keys:
-                logger.info("Cache cleanup completed", expired_entries=len(expired_keys))
-
-            return len(expired_keys)
-
-    def _evict_lru(self) -> None:
-        """
-        Evict oldest 10% of entries when cache is full (LRU-like).
-        Uses creation time to determine oldest entries.
-        """
-        if not self._cache:
-            return
-
-        # Sort by creation time (oldest first)
-        sorted_items = sorted(
-            self._cache.items(), key=lambda x: x[1][2]  # Sort by created timestamp
-        )
-
-        # Evict oldest 10% (minimum 1 entry)
-        evict_count = max(1, len(sorted_items) // 10)
+        removed = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                removed += stripe.pop_expired(time.monotonic())
 
-        for key, _ in sorted_items[:evict_count]:
-            del self._cache[key]
-            self._evictions += 1
+        if removed:
+            logger.info("Cache cleanup completed", expired_entries=removed)
 
-        logger.info("Cache LRU eviction", evicted=evict_count, remaining=len(self._cache))
+        return removed
 
     def stats(self) -> Dict[str, Any]:
         """
@@ -198,35 +360,36 @@ class InMemoryCache:
         Returns:
             Dictionary with cache statistics
         """
-        with self._lock:
-            total_requests = self._hits + self._misses
-            hit_rate = (self._hits / total_requests * 100) if total_requests > 0 else 0
-
-            return {
-                "size": len(self._cache),
-                "max_size": self._max_size,
-                "usage_percent": round(len(self._cache) / self._max_size * 100, 2),
-                "hits": self._hits,
-                "misses": self._misses,
-                "hit_rate_percent": round(hit_rate, 2),
-                "evictions": self._evictions,
-                "total_sets": self._sets,
-                "total_requests": total_requests,
-            }
+        size = self.size()
+        # Each stripe keeps its own counters; the totals are a point-in-time approximation
+        hits = sum(stripe.hits for stripe in self._stripes)
+        misses = sum(stripe.misses for stripe in self._stripes)
+        total_requests = hits + misses
+        hit_rate = (hits / total_requests * 100) if total_requests > 0 else 0
+
+        return {
+            "size": size,
+            "max_size": self._max_size,
+            "usage_percent": round(size / self._max_size * 100, 2),
+            "hits": hits,
+            "misses": misses,
+            "hit_rate_percent": round(hit_rate, 2),
+            "evictions": sum(stripe.evictions for stripe in self._stripes),
+            "total_sets": sum(stripe.sets for stripe in self._stripes),
+            "total_requests": total_requests,
+        }
 
     def size(self) -> int:
         """Get current number of entries in cache."""
-        with self._lock:
-            return len(self._cache)
+        # len() of each stripe is atomic; the total is a point-in-time approximation
+        return sum(len(stripe.entries) for stripe in self._stripes)
 
     def reset_stats(self) -> None:
         """Reset statistics counters."""
-        with self._lock:
-            self._hits = 0
-            self._misses = 0
-            self._evictions = 0
-            self._sets = 0
-            logger.info("Cache statistics reset")
+        for stripe in self._stripes:
+            with stripe.lock:
+                stripe.hits = stripe.misses = stripe.evictions = stripe.sets = 0
+        logger.info("Cache statistics reset")
 
 
 # Global singleton cache instance
@@ -0,0 +1,68 @@
+"""
+Request coalescing ("single-flight") for async service calls.
+
+When several requests ask for the same upstream resource at the same time,
+only the first one calls the upstream API; the others await the same task and
+receive its result (or exception). Entries are dropped as soon as the call
+finishes, so this complements the TTL cache rather than replacing it.
+"""
+
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+def _consume_exception(task: "asyncio.Task[Any]") -> None:
+    """Mark a finished task's exception as retrieved if every waiter went away."""
+    if not task.cancelled():
+        task.exception()
+
+
+def singleflight(
+    key_fn: Callable[..., str]
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Coalesce concurrent calls of an async function that share the same key.
+
+    The upstream call runs in its own task, so a cancelled caller does not cancel
+    the call for the other waiters.
+
+    Args:
+        key_fn: Receives the same arguments as the decorated function and returns the
+            key identifying identical calls
+
+    Returns:
+        Decorator for async functions/methods
+
+    Example:
+        @singleflight(lambda self, incident_number: incident_number)
+        async def fetch_incident_details(self, incident_number): ...
+    """
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        in_flight: Dict[str, "asyncio.Task[T]"] = {}
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            key = key_fn(*args, **kwargs)
+            task = in_flight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(func(*args, **kwargs))
+                in_flight[key] = task
+                task.add_done_callback(
+                    lambda done: in_flight.pop(key, None) if in_flight.get(key) is done else None
+                )
+                task.add_done_callback(_consume_exception)
+            else:
+                logger.debug("Coalesced in-flight call", function=func.__qualname__, key=key)
+            return await asyncio.shield(task)
+
+        return wrapper
+
+    return decorator
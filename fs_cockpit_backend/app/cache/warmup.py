@@ -0,0 +1,99 @@
+"""
+Startup cache warming.
+
+After a deploy or restart the in-memory cache is empty, so the first requests for
+the busiest devices all go to ServiceNow, NextThink and Intune. This module preloads
+the device incident lists, remote-action history and Intune device records for the
+devices with the most incident activity over the last day, as recorded in the
+incidents table.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import List
+
+import structlog
+from sqlalchemy import func
+
+from app.db import Incident, SessionLocal
+from app.services.intune_service import IntuneService
+from app.services.nextthink_service import NextThinkService
+from app.services.servicenow_service import ServiceNowService
+
+logger = structlog.get_logger(__name__)
+
+# Look-back window for picking the devices to warm
+_ACTIVITY_WINDOW = timedelta(days=1)
+# Devices warmed concurrently, to stay polite with the upstream APIs
+_WARMUP_CONCURRENCY = 5
+
+
+def _top_devices(limit: int) -> List[str]:
+    """Return the devices with the most incidents updated within the activity window."""
+    since = datetime.utcnow() - _ACTIVITY_WINDOW
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(Incident.device_name, func.count(Incident.id).label("hits"))
+            .filter(Incident.device_name.isnot(None), Incident.updated_at >= since)
+            .group_by(Incident.device_name)
+            .order_by(func.count(Incident.id).desc())
+            .limit(limit)
+            .all()
+        )
+        return [row.device_name for row in rows if row.device_name]
+    finally:
+        db.close()
+
+
+async def warm_caches(top_devices: int) -> int:
+    """
+    Preload cached upstream data for the most active devices.
+
+    Failures are logged and skipped; warming never raises.
+
+    Args:
+        top_devices: Maximum number of devices to warm
+
+    Returns:
+        int: Number of devices warmed without errors
+    """
+    try:
+        devices = await asyncio.to_thread(_top_devices, top_devices)
+    except Exception as e:  # noqa: BLE001
+        logger.warning("Cache warmup skipped, could not read device activity", error=str(e))
+        return 0
+
+    if not devices:
+        logger.debug("Cache warmup found no recently active devices")
+        return 0
+
+    servicenow_service = ServiceNowService()
+    nextthink_service = NextThinkService()
+    semaphore = asyncio.Semaphore(_WARMUP_CONCURRENCY)
+
+    async def warm_device(device_name: str) -> bool:
+        async with semaphore:
+            results = await asyncio.gather(
+                servicenow_service.fetch_incidents_by_device(device_name),
+                nextthink_service.get_recommendation_candidates(device_name),
+                return_exceptions=True,
+            )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            logger.debug(
+                "Cache warmup failed for device", device_name=device_name, error=str(errors[0])
+            )
+        return not errors
+
+    async def warm_intune() -> None:
+        # One Graph $batch call covers up to 20 devices, so this runs once for all of them
+        try:
+            await IntuneService().fetch_devices_by_names(devices)
+        except Exception as e:  # noqa: BLE001
+            logger.debug("Cache warmup failed for Intune devices", error=str(e))
+
+    *results, _ = await asyncio.gather(*(warm_device(name) for name in devices), warm_intune())
+    warmed = sum(results)
+    logger.info("Cache warmup complete", devices=len(devices), warmed=warmed)
+    return warmed
@@ -0,0 +1,295 @@
+"""Base client module defining the BaseClient class for API interactions."""
+
+import asyncio
+import random
+from typing import Any, AsyncContextManager, Dict, Optional, Tuple
+
+import httpx
+import orjson
+import structlog
+
+from app.config.settings import get_settings
+from app.exceptions.custom_exceptions import ServiceConnectionError, ServiceTimeoutError
+
+__all__ = ["BaseClient"]
+
+# logging configuration
+logger = structlog.get_logger(__name__)
+
+# httpx needs the optional h2 package (httpx[http2]) to negotiate HTTP/2
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# Upper bound, in seconds, on the randomized delay between retry attempts
+_RETRY_BACKOFF_MAX = 10.0
+
+
+class _PerLoopSemaphore:
+    """A process-wide semaphore, rebuilt if the running event loop changes."""
+
+    def __init__(self) -> None:
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get(self, limit: int) -> asyncio.Semaphore:
+        """Return the semaphore for the running loop, creating it with `limit` slots."""
+        loop = asyncio.get_running_loop()
+        # An asyncio.Semaphore is tied to the event loop it first waits on
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(limit)
+            self._loop = loop
+        return self._semaphore
+
+
+class BaseClient:
+    """Base client for interacting with external APIs with connection pooling."""
+
+    # Class-level connection pool (shared across instances)
+    _http_client: Optional[httpx.AsyncClient] = None
+    # Dedicated pools for clients constructed with their own limits, keyed by host
+    _host_clients: Dict[str, httpx.AsyncClient] = {}
+    # Bounds in-flight requests to what the shared pool can serve
+    _pool_slots = _PerLoopSemaphore()
+    # Pool configuration, read from settings once by _pool_config()
+    _limits: Optional[httpx.Limits] = None
+    _pool_timeout: Optional[int] = None
+    _http2: bool = False
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 30,
+        max_retries: int = 3,
+        retry_backoff: float = 0.3,
+        auth: Optional[httpx.Auth] = None,
+        auth_headers: Optional[Dict[str, str]] = None,
+        limits: Optional[httpx.Limits] = None,
+    ):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.auth = auth
+        self.auth_headers = auth_headers or {}
+        self.limits = limits
+        self.settings = get_settings()
+        self.client: Optional[httpx.AsyncClient] = None
+        # Service label for errors and logs, e.g. "ServiceNow" for ServiceNowClient
+        self._service_name = type(self).__name__.removesuffix("Client")
+
+    @property
+    def auth_headers(self) -> Dict[str, str]:
+        """Headers sent with every request, e.g. a bearer token."""
+        return self._auth_headers
+
+    @auth_headers.setter
+    def auth_headers(self, headers: Optional[Dict[str, str]]) -> None:
+        self._auth_headers = headers or {}
+        # Built once here and passed by reference, rather than re-merged on every request
+        self._headers = httpx.Headers(self._auth_headers) if self._auth_headers else None
+
+    @staticmethod
+    def _pool_config() -> Tuple[httpx.Limits, int, bool]:
+        """Return the shared pool's limits, timeout and HTTP/2 flag, read from settings once."""
+        if BaseClient._limits is None:
+            settings = get_settings()
+            BaseClient._pool_timeout = settings.HTTP_TIMEOUT_SECONDS
+            # HTTP/2 multiplexes concurrent calls to a host over one connection
+            BaseClient._http2 = settings.HTTP_ENABLE_HTTP2 and _HTTP2_AVAILABLE
+            if settings.HTTP_ENABLE_HTTP2 and not _HTTP2_AVAILABLE:
+                logger.warning(
+                    "HTTP/2 support disabled - h2 package not installed. "
+                    "Install with: pip install httpx[http2]"
+                )
+            BaseClient._limits = httpx.Limits(
+                max_connections=settings.HTTP_POOL_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_POOL_MAX_KEEPALIVE,
+                keepalive_expiry=settings.HTTP_POOL_KEEPALIVE_EXPIRY,
+            )
+        return BaseClient._limits, BaseClient._pool_timeout, BaseClient._http2
+
+    @staticmethod
+    def _build_pool(limits: httpx.Limits) -> httpx.AsyncClient:
+        """Create a pooled HTTP client with the configured timeout and HTTP/2 setting."""
+        _, timeout, http2 = BaseClient._pool_config()
+        return httpx.AsyncClient(limits=limits, timeout=timeout, http2=http2, follow_redirects=True)
+
+    @classmethod
+    def _get_shared_client(cls) -> httpx.AsyncClient:
+        """Get or create shared HTTP client with connection pooling."""
+        if cls._http_client is None:
+            limits, _, http2 = cls._pool_config()
+            cls._http_client = cls._build_pool(limits)
+            logger.info(
+                "Initialized shared HTTP client pool",
+                max_connections=limits.max_connections,
+                max_keepalive=limits.max_keepalive_connections,
+                keepalive_expiry=limits.keepalive_expiry,
+                http2=http2,
+            )
+        return cls._http_client
+
+    @classmethod
+    def _get_host_client(cls, base_url: str, limits: httpx.Limits) -> httpx.AsyncClient:
+        """
+        Get or create a dedicated pool for one upstream host.
+
+        Used when an upstream's idle timeout or connection budget differs from the shared
+        pool's, e.g. a longer keepalive_expiry for an API polled less often than the
+        shared expiry. The first client constructed for a host decides its limits.
+        """
+        host = httpx.URL(base_url).host
+        client = BaseClient._host_clients.get(host)
+        if client is None:
+            client = BaseClient._host_clients[host] = cls._build_pool(limits)
+            logger.info(
+                "Initialized per-host HTTP client pool",
+                host=host,
+                max_connections=limits.max_connections,
+                max_keepalive=limits.max_keepalive_connections,
+                keepalive_expiry=limits.keepalive_expiry,
+            )
+        return client
+
+    @classmethod
+    def init_shared_client(cls) -> httpx.AsyncClient:
+        """Create the shared HTTP client up front (call on application startup)."""
+        return BaseClient._get_shared_client()
+
+    @classmethod
+    async def close_shared_client(cls):
+        """Close the shared HTTP client (call on application shutdown)."""
+        if cls._http_client is not None:
+            await cls._http_client.aclose()
+            cls._http_client = None
+            logger.info("Closed shared HTTP client pool")
+        while BaseClient._host_clients:
+            _, client = BaseClient._host_clients.popitem()
+            await client.aclose()
+        # Re-read settings if the pool is recreated
+        BaseClient._limits = None
+
+    async def __aenter__(self):
+        """Borrow the shared connection pool; base URL, auth and headers are sent per request."""
+        if self.limits is None:
+            self.client = BaseClient._get_shared_client()
+        else:
+            self.client = BaseClient._get_host_client(self.base_url, self.limits)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        # The shared pool outlives the context and is closed on application shutdown;
+        # only clients created by a subclass for its own use are closed here.
+        if self.client is not None and not self._is_pooled(self.client):
+            await self.client.aclose()
+
+    @staticmethod
+    def _is_pooled(client: httpx.AsyncClient) -> bool:
+        """Whether `client` is the shared pool or a per-host pool."""
+        return client is BaseClient._http_client or client in BaseClient._host_clients.values()
+
+    def _concurrency_slot(self) -> AsyncContextManager[Any]:
+        """
+        Return the context manager held around each outbound HTTP call.
+
+        Caps in-flight calls across all clients at HTTP_MAX_CONCURRENCY, so bursts wait
+        here instead of queueing for pool connections until they hit connect timeouts.
+        Subclasses may add a tighter per-upstream limit. It is held only for the call
+        itself, not across retry backoff.
+        """
+        return BaseClient._pool_slots.get(self.settings.HTTP_MAX_CONCURRENCY)
+
+    async def _request(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """
+        Send a request, retrying timeouts and connection failures.
+
+        Makes up to `max_retries` attempts in total. HTTP error responses are raised
+        immediately, since repeating the same request will not change them.
+        """
+        attempts = max(self.max_retries, 1)
+        for attempt in range(1, attempts + 1):
+            try:
+                return await self._send(method, endpoint, **kwargs)
+            except (ServiceTimeoutError, ServiceConnectionError):
+                if attempt == attempts:
+                    raise
+            # Full-jitter backoff, so callers failing together don't retry in lock-step
+            delay = min(_RETRY_BACKOFF_MAX, self.retry_backoff * 2**attempt)
+            await asyncio.sleep(random.uniform(0, delay))
+
+    async def _send(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """Make a single request attempt, mapping transport errors to service errors."""
+        url = f"{self.base_url.rstrip('/')}{endpoint}"
+        if self._headers is not None:
+            extra_headers = kwargs.get("headers")
+            if extra_headers:
+                headers = self._headers.copy()
+                headers.update(extra_headers)
+                kwargs["headers"] = headers
+            else:
+                kwargs["headers"] = self._headers
+        if self.auth is not None:
+            kwargs.setdefault("auth", self.auth)
+        kwargs.setdefault("timeout", self.timeout)
+        try:
+            async with self._concurrency_slot():
+                response = await self.client.request(method, url, **kwargs)
+            response.raise_for_status()
+            return response
+        except (httpx.TimeoutException, httpx.ConnectTimeout, httpx.ReadTimeout) as e:
+            logger.error(
+                f"Timeout: {method} {endpoint} - {e}",
+                service=self._service_name,
+                timeout=self.timeout,
+            )
+            raise ServiceTimeoutError(
+                service=self._service_name,
+                timeout_seconds=self.timeout,
+                operation=f"{method} {endpoint}",
+            ) from e
+        except (httpx.ConnectError, httpx.NetworkError) as e:
+            logger.error(
+                f"Connection Error: {method} {endpoint} - {e}",
+                service=self._service_name,
+                url=url,
+            )
+            raise ServiceConnectionError(service=self._service_name, url=url, details=str(e)) from e
+        except httpx.HTTPError as e:
+            logger.error(f"HTTP Error: {method} {endpoint} - {e}", service=self._service_name)
+            raise
+
+    async def get(self, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """Make a GET request to the specified endpoint."""
+        response = await self._request("GET", endpoint, **kwargs)
+        return orjson.loads(response.content)
+
+    async def get_raw(self, endpoint: str, **kwargs) -> httpx.Response:
+        """Make a GET request and return the undecoded response, e.g. to forward its body."""
+        return await self._request("GET", endpoint, **kwargs)
+
+    async def post(self, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """Make a POST request to the specified endpoint."""
+        response = await self._request("POST", endpoint, **kwargs)
+        return orjson.loads(response.content)
+
+    async def post_raw(self, endpoint: str, **kwargs) -> httpx.Response:
+        """Make a POST request and return the undecoded response, e.g. to forward its body."""
+        return await self._request("POST", endpoint, **kwargs)
+
+    async def patch(self, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """Make a PATCH request to the specified endpoint."""
+        response = await self._request("PATCH", endpoint, **kwargs)
+        return orjson.loads(response.content)
+
+    async def put(self, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """Make a PUT request to the specified endpoint."""
+        response = await self._request("PUT", endpoint, **kwargs)
+        return orjson.loads(response.content)
+
+    async def delete(self, endpoint: str, **kwargs):
+        """Make a DELETE request to the specified endpoint."""
+        await self._request("DELETE", endpoint, **kwargs)
@@ -3,22 +3,90 @@ Google Gemini AI Client for generating IT solutions.
 Handles communication with Google's Generative AI API for creating solution recommendations.
 """
 
+import asyncio
+import hashlib
+import re
+import time
+from functools import lru_cache
 from typing import List, Optional
 
 import google.generativeai as genai
 import structlog
+from google.api_core import retry_async
+from google.api_core.exceptions import DeadlineExceeded, ResourceExhausted, ServiceUnavailable
+from google.generativeai.types import RequestOptions
 
+from app.cache.memory_cache import get_cache
+from app.cache.singleflight import singleflight
+from app.clients.base_client import _PerLoopSemaphore
 from app.config.settings import get_settings
+from app.exceptions.custom_exceptions import ServiceTimeoutError
 
 logger = structlog.get_logger(__name__)
 
+# Lines containing any of these are preamble, not steps
+_RE_HEADER = re.compile(
+    "|".join(
+        re.escape(header)
+        for header in (
+            "here are",
+            "here's",
+            "below are",
+            "following are",
+            "troubleshooting steps",
+            "solution steps",
+            "your vpn",
+            "your device",
+            "your issue",
+        )
+    ),
+    re.IGNORECASE,
+)
+# Transient Gemini errors (quota, overload, slow attempt) that are worth retrying
+_RETRYABLE_ERRORS = (ResourceExhausted, ServiceUnavailable, DeadlineExceeded)
+
+# Bounds on prompt inputs; longer values are truncated rather than sent and billed in full
+_MAX_DESCRIPTION_CHARS = 4000
+_MAX_CONTEXT_CHARS = 2048
+
+# Strips "1. " / "1) " numbering, a "-" or "•" bullet and a conversational "your "
+_RE_LINE = re.compile(r"^(?:\d+[.)])?\s*(?:[-•]\s*)?(?:your\s+)?(.*)", re.IGNORECASE)
+
+
+def _prompt_digest(prompt: str) -> str:
+    """
+    Return a short, stable digest identifying a prompt.
+
+    Case and whitespace are normalized first, so prompts that differ only in how the
+    incident was typed ("VPN  disconnects" vs "vpn disconnects") share a digest.
+    """
+    normalized = " ".join(prompt.lower().split())
+    return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
 
 class GoogleAIClient:
     """Client for interacting with Google Gemini AI API."""
 
+    # Process-wide cap on in-flight Gemini calls; they share the SDK's gRPC channel
+    _gemini_slots = _PerLoopSemaphore()
+
     def __init__(self):
         """Initialize the Google AI Client with API configuration."""
         self.settings = get_settings()
+        self.cache = get_cache() if self.settings.CACHE_ENABLED else None
+        # Each attempt is bounded by the timeout; transient errors are retried with exponential
+        # backoff until GOOGLE_AI_MAX_RETRIES attempts' worth of time has been spent
+        attempt_timeout = self.settings.GOOGLE_AI_TIMEOUT_SECONDS
+        self._request_options = RequestOptions(
+            timeout=attempt_timeout,
+            retry=retry_async.AsyncRetry(
+                predicate=retry_async.if_exception_type(*_RETRYABLE_ERRORS),
+                initial=1.0,
+                maximum=10.0,
+                multiplier=2.0,
+                timeout=attempt_timeout * max(self.settings.GOOGLE_AI_MAX_RETRIES, 1),
+            ),
+        )
 
         if not self.settings.GOOGLE_AI_ENABLED or not self.settings.GOOGLE_AI_API_KEY:
             logger.warning("Google AI is disabled or API key not configured")
@@ -89,21 +157,22 @@ class GoogleAIClient:
             List of 6-8 actionable solution steps as strings
 
         Raises:
-            ValueError: If API is not configured or enabled
+            ValueError: If API is not configured or enabled, or the description is empty
             Exception: If API call fails
         """
         if not self.model:
             logger.error("[GOOGLE_AI] CRITICAL: Model is None - Google AI not configured or enabled")
             raise ValueError("Google AI is not configured or enabled")
 
-        try:
-            logger.info(
-                "[GOOGLE_AI] Starting solution generation",
-                model=self.settings.GOOGLE_AI_MODEL_NAME,
-                has_incident_description=bool(incident_description),
-                incident_description_length=len(incident_description) if incident_description else 0,
-            )
+        # Validate before any network I/O; there is nothing to troubleshoot without a description
+        if not incident_description or not incident_description.strip():
+            raise ValueError("Incident description is empty")
+        incident_description = incident_description[:_MAX_DESCRIPTION_CHARS]
+        device_details = device_details[:_MAX_CONTEXT_CHARS] if device_details else None
+        error_message = error_message[:_MAX_CONTEXT_CHARS] if error_message else None
 
+        started = time.perf_counter()
+        try:
             # Build context information with device details priority
             context_parts = []
 
@@ -120,102 +189,25 @@ class GoogleAIClient:
 
             context_str = " | ".join(context_parts) if context_parts else ""
 
-            logger.info(
-                "[GOOGLE_AI] Context prepared",
-                context_length=len(context_str),
-                device_details_provided=bool(device_details),
-                category=category,
-                context_preview=context_str[:150] if context_str else "empty",
-            )
-
             # Build the prompt for Gemini
             prompt = self._build_solution_prompt(incident_description, context_str)
-
-            logger.info(
-                "[GOOGLE_AI] Prompt built, about to call Gemini API",
+            logger.debug(
+                "[GOOGLE_AI] Prompt built",
+                context_length=len(context_str),
                 prompt_length=len(prompt),
-                prompt_preview=prompt[:200] if prompt else "empty",
             )
 
-            # Call Gemini API
-            logger.info("[GOOGLE_AI] Making API call to generate_content()")
-            response = self.model.generate_content(prompt)
-            logger.info("[GOOGLE_AI] API call completed, processing response")
-
-            # Parse and validate response
-            solution_text = None
-            if response.candidates and len(response.candidates) > 0:
-                candidate = response.candidates[0]
-                # Log the finish reason to understand why response might be empty
-                finish_reason = getattr(candidate, "finish_reason", None)
-                has_parts = (
-                    candidate.content and len(candidate.content.parts) > 0
-                    if candidate.content
-                    else False
-                )
-
-                logger.info(
-                    "[GOOGLE_AI] Response processing",
-                    candidates_count=len(response.candidates),
-                    finish_reason=str(finish_reason),
-                    has_content=bool(candidate.content),
-                    has_parts=has_parts,
-                    content_parts_count=len(candidate.content.parts) if candidate.content else 0,
-                )
-
-                # Only try to get response.text if we have actual parts
-                if has_parts:
-                    try:
-                        solution_text = response.text
-                        logger.info(
-                            "[GOOGLE_AI] Successfully extracted response.text",
-                            text_length=len(solution_text),
-                            text_preview=solution_text[:200] if solution_text else "empty",
-                        )
-                    except Exception as e:
-                        logger.warning(
-                            "[GOOGLE_AI] Could not extract response.text",
-                            error=str(e),
-                            error_type=type(e).__name__,
-                        )
-                        solution_text = None
-
-                # If no parts, the response was cut off (MAX_TOKENS) - treat as failure
-                if not solution_text:
-                    logger.error(
-                        "[GOOGLE_AI] No valid response parts from Gemini",
-                        finish_reason=str(finish_reason),
-                        candidates_count=len(response.candidates),
-                    )
-                    raise ValueError(
-                        f"No valid response parts from Gemini (finish_reason={finish_reason})"
-                    )
-
-                logger.info("[GOOGLE_AI] Parsing solution response")
-                solution_points = self._parse_solution_response(solution_text)
-                logger.info(
-                    "[GOOGLE_AI] Solution points parsed",
-                    points_count=len(solution_points) if solution_points else 0,
-                    solution_points_preview=solution_points[:2] if solution_points else [],
-                )
-
-                if solution_points:  # Only return if we got actual points
-                    logger.info(
-                        "[GOOGLE_AI] SUCCESS - Successfully generated solution points",
-                        count=len(solution_points),
-                        category=category,
-                    )
-                    return solution_points
-                else:
-                    logger.error("[GOOGLE_AI] No solution points could be parsed from response")
-                    raise ValueError("No solution points could be parsed from response")
+            # Identical prompts (recurring incidents) are answered from the cache, up to
+            # differences in case and whitespace
+            cache_key = f"ai:solution_points:{_prompt_digest(prompt)}"
+            if self.cache:
+                cached_points = self.cache.get(cache_key)
+                if cached_points is not None:
+                    logger.debug("[GOOGLE_AI] Cache hit for solution points", key=cache_key)
+                    return list(cached_points)
 
-            # If we reach here, response was empty or invalid
-            logger.error(
-                "[GOOGLE_AI] No response candidates returned from Gemini API",
-                response_candidates=response.candidates if response else "no response object",
-            )
-            raise ValueError("No response candidates returned from Gemini API")
+            solution_points = await self._generate_uncached(cache_key, prompt, category, started)
+            return list(solution_points)
 
         except ValueError as e:
             logger.error("[GOOGLE_AI] Validation error in solution generation", error=str(e))
@@ -231,6 +223,107 @@ class GoogleAIClient:
             )
             raise
 
+    @singleflight(lambda self, cache_key, prompt, category, started: cache_key)
+    async def _generate_uncached(
+        self, cache_key: str, prompt: str, category: Optional[str], started: float
+    ) -> List[str]:
+        """
+        Call Gemini for a prompt and parse its solution points, caching them on success.
+
+        Concurrent calls for the same prompt share one API call.
+
+        Args:
+            cache_key: Cache key derived from the prompt
+            prompt: The full prompt sent to Gemini
+            category: The issue category, for logging
+            started: perf_counter() value when the caller started, for logging
+
+        Returns:
+            List of solution steps as strings
+
+        Raises:
+            ValueError: If Gemini returned no usable solution points
+            ServiceTimeoutError: If the call exceeded GOOGLE_AI_TIMEOUT_SECONDS
+        """
+        # Call Gemini API without blocking the event loop for the round-trip
+        # Overall budget across retries; also a backstop for hangs the transport misses
+        timeout = self.settings.GOOGLE_AI_TIMEOUT_SECONDS * max(
+            self.settings.GOOGLE_AI_MAX_RETRIES, 1
+        )
+        # Bursts queue here rather than tripping Gemini's per-minute quota
+        async with GoogleAIClient._gemini_slots.get(self.settings.GOOGLE_AI_MAX_CONCURRENCY):
+            try:
+                response = await asyncio.wait_for(
+                    self.model.generate_content_async(
+                        prompt, request_options=self._request_options
+                    ),
+                    timeout=timeout,
+                )
+            except asyncio.TimeoutError as e:
+                raise ServiceTimeoutError("Google AI", timeout, "generate_content") from e
+
+        # Parse and validate response
+        solution_text = None
+        if response.candidates and len(response.candidates) > 0:
+            candidate = response.candidates[0]
+            # Log the finish reason to understand why response might be empty
+            finish_reason = getattr(candidate, "finish_reason", None)
+            has_parts = (
+                candidate.content and len(candidate.content.parts) > 0
+                if candidate.content
+                else False
+            )
+
+            # Only try to get response.text if we have actual parts
+            if has_parts:
+                try:
+                    solution_text = response.text
+                except Exception as e:
+                    logger.warning(
+                        "[GOOGLE_AI] Could not extract response.text",
+                        error=str(e),
+                        error_type=type(e).__name__,
+                    )
+                    solution_text = None
+
+            # If no parts, the response was cut off (MAX_TOKENS) - treat as failure
+            if not solution_text:
+                logger.error(
+                    "[GOOGLE_AI] No valid response parts from Gemini",
+                    finish_reason=str(finish_reason),
+                    candidates_count=len(response.candidates),
+                )
+                raise ValueError(
+                    f"No valid response parts from Gemini (finish_reason={finish_reason})"
+                )
+
+            solution_points = self._parse_solution_response(solution_text)
+
+            if solution_points:  # Only return if we got actual points
+                if self.cache:
+                    self.cache.set(cache_key, solution_points, self.settings.CACHE_TTL_AI_RESPONSE)
+                logger.info(
+                    "[GOOGLE_AI] Generated solution points",
+                    model=self.settings.GOOGLE_AI_MODEL_NAME,
+                    duration_ms=round((time.perf_counter() - started) * 1000),
+                    prompt_length=len(prompt),
+                    response_length=len(solution_text),
+                    points=len(solution_points),
+                    finish_reason=str(finish_reason),
+                    category=category,
+                )
+                return solution_points
+            else:
+                logger.error("[GOOGLE_AI] No solution points could be parsed from response")
+                raise ValueError("No solution points could be parsed from response")
+
+        # If we reach here, response was empty or invalid
+        logger.error(
+            "[GOOGLE_AI] No response candidates returned from Gemini API",
+            response_candidates=response.candidates if response else "no response object",
+        )
+        raise ValueError("No response candidates returned from Gemini API")
+
     def _build_solution_prompt(self, incident_description: str, context: str) -> str:
         """
         Build a structured prompt for Gemini to generate solutions.
@@ -270,55 +363,19 @@ Steps:"""
         Returns:
             List of solution points as strings
         """
-        import re
-
-        # Split by newlines
-        lines = [line.strip() for line in response_text.split("\n") if line.strip()]
-
-        solution_points = []
-        for line in lines:
+        # Cleaning only shortens a line, so lines under 10 chars can never become a point
+        lines = [
+            line for raw_line in response_text.split("\n") if len(line := raw_line.strip()) >= 10
+        ]
+        solution_points = [
+            cleaned
+            for line in lines
             # Skip header lines like "Here are X troubleshooting steps" or "Here are the steps"
-            if any(
-                header in line.lower()
-                for header in [
-                    "here are",
-                    "here's",
-                    "below are",
-                    "following are",
-                    "troubleshooting steps",
-                    "solution steps",
-                    "your vpn",
-                    "your device",
-                    "your issue",
-                ]
-            ):
-                continue
-
-            # Remove leading numbering patterns (1., 1), -, *, etc.)
-            # Handle formats like "1. ", "1) ", "- ", "* ", "** ", etc.
-            cleaned = re.sub(r"^[\d]+[\.\)]\s*", "", line)  # Remove "1. " or "1) "
-            cleaned = re.sub(r"^\*+\s*", "", cleaned)  # Remove leading asterisks/bold markers
-
-            # Remove markdown bold/italic markers (* and **)
-            cleaned = cleaned.replace("**", "")
-            cleaned = cleaned.replace("*", "")
-
-            # Remove leading dashes/bullets
-            cleaned = re.sub(r"^[-•]\s*", "", cleaned)
-
-            cleaned = cleaned.strip()
-
-            # Remove conversational phrases and possessive language
-            conversational_phrases = [
-                r"^your\s+",  # Remove "your " at start
-                r"^your\s+",
-            ]
-            for phrase in conversational_phrases:
-                cleaned = re.sub(phrase, "", cleaned, flags=re.IGNORECASE)
-
-            # Only include non-empty lines with meaningful content (at least 10 chars)
-            if cleaned and len(cleaned) >= 10:
-                solution_points.append(cleaned)
+            if not _RE_HEADER.search(line)
+            # Drop markdown bold/italic markers, then the list marker and a leading "your ";
+            # only keep lines with meaningful content (at least 10 chars)
+            and len(cleaned := _RE_LINE.match(line.replace("*", "")).group(1).rstrip()) >= 10
+        ]
 
         logger.debug(
             "Parsed solution points from response",
@@ -329,10 +386,7 @@ Steps:"""
         return solution_points
 
 
-# Global instance
-_google_ai_client: Optional[GoogleAIClient] = None
-
-
+@lru_cache
 def get_google_ai_client() -> GoogleAIClient:
     """
     Get or create the singleton Google AI Client instance.
@@ -340,7 +394,4 @@ def get_google_ai_client() -> GoogleAIClient:
     Returns:
         GoogleAIClient instance
     """
-    global _google_ai_client
-    if _google_ai_client is None:
-        _google_ai_client = GoogleAIClient()
-    return _google_ai_client
+    return GoogleAIClient()
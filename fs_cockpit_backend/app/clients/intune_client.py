@@ -1,22 +1,48 @@
 """Intune API client for Microsoft Graph."""
 
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import httpx
+import orjson
 import structlog
 
-from app.clients.base_cleint import BaseClient
+from app.clients.base_client import BaseClient, _PerLoopSemaphore
 from app.exceptions.custom_exceptions import ExternalServiceError
 from app.utils.health_metrics import get_health_tracker
 
 # logging configuration
 logger = structlog.get_logger(__name__)
 
+# Device fields returned by every managedDevices query (mirrors DeviceDTO)
+_DEVICE_SELECT = (
+    "id,deviceName,userPrincipalName,operatingSystem,osVersion,complianceState,"
+    "managedDeviceOwnerType,enrolledDateTime,lastSyncDateTime,manufacturer,model,"
+    "serialNumber,isEncrypted,userDisplayName"
+)
+# Graph's JSON batching endpoint accepts at most 20 sub-requests per call
+_GRAPH_BATCH_MAX_SIZE = 20
+# Ask Graph for its largest page so device lists rarely need a second round trip
+_PAGED_HEADERS = {"Prefer": "odata.maxpagesize=999"}
+# Bodies are pre-encoded with orjson, so the content type has to be set explicitly
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _odata_str(value: str) -> str:
+    """Escape a value for use inside a single-quoted OData string literal."""
+    return value.replace("'", "''")
+
 
 class IntuneClient(BaseClient):
     """Client to interact with Microsoft Graph API for Intune."""
 
+    # Tokens are shared by every instance with the same identity provider,
+    # tenant and app. Services build a client per request, so a per-instance cache alone
+    # would fetch a token every time.
+    _token_cache: Dict[Tuple[str, str, str], Tuple[str, float]] = {}
+    _token_locks: Dict[Tuple[str, str, str], _PerLoopSemaphore] = {}
+
     def __init__(
         self,
         graph_base_url: str,
@@ -33,13 +59,17 @@ class IntuneClient(BaseClient):
         self.client_secret = client_secret
         self.timeout = timeout
         self.access_token: Optional[str] = None
-        self.token_expiry: Optional[datetime] = None
+        self._token_expiry_monotonic: float = 0.0
         self.client = None
-
-        # Get settings for connection pool configuration
-        from app.config.settings import get_settings
-
-        self.settings = get_settings()
+        self._token_key = (auth_base_url, tenant_id, client_id)
+        # The token request never changes for an instance, so build it once
+        self._token_url = f"{auth_base_url}/{tenant_id}/oauth2/v2.0/token"
+        self._token_data = {
+            "client_id": client_id,
+            "client_secret": client_secret,
+            "scope": "https://graph.microsoft.com/.default",
+            "grant_type": "client_credentials",
+        }
 
         # Initialize with Graph API base URL for API calls
         super().__init__(graph_base_url, timeout)
@@ -47,43 +77,56 @@ class IntuneClient(BaseClient):
     async def _get_access_token(self) -> str:
         """Obtain OAuth2 access token from Microsoft Identity Platform with caching."""
         # Check if we have a valid cached token
-        if self.access_token and self.token_expiry and datetime.now() < self.token_expiry:
+        if self._has_valid_token():
             logger.debug(
                 "Using cached access token",
-                expires_in=(self.token_expiry - datetime.now()).total_seconds(),
+                expires_in=self._token_expiry_monotonic - time.monotonic(),
             )
             return self.access_token
 
+        # One refresh per credentials at a time; callers that queued behind it reuse its token
+        lock = IntuneClient._token_locks.setdefault(self._token_key, _PerLoopSemaphore())
+        async with lock.get(1):
+            if self._has_valid_token():
+                return self.access_token
+            return await self._fetch_access_token()
+
+    def _has_valid_token(self) -> bool:
+        """Whether a valid token is cached, adopting one fetched by another instance."""
+        if self.access_token and time.monotonic() < self._token_expiry_monotonic:
+            return True
+        cached = IntuneClient._token_cache.get(self._token_key)
+        if cached is None or time.monotonic() >= cached[1]:
+            return False
+        self.access_token, self._token_expiry_monotonic = cached
+        return True
+
+    async def _fetch_access_token(self) -> str:
+        """Request a new access token from the Microsoft Identity Platform and cache it."""
         logger.debug(
             "Getting new access token", auth_base_url=self.auth_base_url, tenant_id=self.tenant_id
         )
-        token_url = f"{self.auth_base_url}/{self.tenant_id}/oauth2/v2.0/token"
-        logger.debug("Token URL", url=token_url)
-
-        data = {
-            "client_id": self.client_id,
-            "client_secret": self.client_secret,
-            "scope": "https://graph.microsoft.com/.default",
-            "grant_type": "client_credentials",
-        }
+        logger.debug("Token URL", url=self._token_url)
 
         try:
-            # Use optimized client for token acquisition
-            async with httpx.AsyncClient(
-                limits=httpx.Limits(
-                    max_connections=self.settings.HTTP_POOL_MAX_CONNECTIONS,
-                    max_keepalive_connections=self.settings.HTTP_POOL_MAX_KEEPALIVE,
-                )
-            ) as client:
-                response = await client.post(token_url, data=data)
-                response.raise_for_status()
-                token_data = response.json()
-                self.access_token = token_data.get("access_token")
+            # The shared pool keeps the connection to the identity provider alive between
+            # refreshes, instead of a new client and TLS handshake for every token
+            client = BaseClient._get_shared_client()
+            response = await client.post(
+                self._token_url, data=self._token_data, timeout=self.timeout
+            )
+            response.raise_for_status()
+            token_data = orjson.loads(response.content)
+            self.access_token = token_data.get("access_token")
 
             # Cache token with expiry (Microsoft tokens typically expire in 3600 seconds)
             # Set expiry to 5 minutes before actual expiry for safety margin
             expires_in = token_data.get("expires_in", 3600)
-            self.token_expiry = datetime.now() + timedelta(seconds=expires_in - 300)
+            self._token_expiry_monotonic = time.monotonic() + expires_in - 300
+            IntuneClient._token_cache[self._token_key] = (
+                self.access_token,
+                self._token_expiry_monotonic,
+            )
 
             logger.debug("Successfully obtained access token", expires_in=expires_in)
             return self.access_token
@@ -108,9 +151,7 @@ class IntuneClient(BaseClient):
         """
         try:
             # Check if we have a cached token before making the call
-            was_cached = bool(
-                self.access_token and self.token_expiry and datetime.now() < self.token_expiry
-            )
+            was_cached = self._has_valid_token()
 
             token = await self._get_access_token()
 
@@ -124,10 +165,9 @@ class IntuneClient(BaseClient):
                 "cached": was_cached,
             }
 
-            if self.token_expiry:
-                result["token_expires_in_seconds"] = int(
-                    (self.token_expiry - datetime.now()).total_seconds()
-                )
+            if self._token_expiry_monotonic:
+                expires_in = self._token_expiry_monotonic - time.monotonic()
+                result["token_expires_in_seconds"] = int(expires_in)
 
             # Track health metrics
             tracker = get_health_tracker()
@@ -179,34 +219,38 @@ class IntuneClient(BaseClient):
             }
 
     async def __aenter__(self):
-        """Set up the client with authentication and connection pooling."""
+        """Authenticate, then borrow the shared connection pool for API calls."""
         token = await self._get_access_token()
         self.auth_headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
-
-        # Create client with optimized connection pool
-        limits = httpx.Limits(
-            max_connections=self.settings.HTTP_POOL_MAX_CONNECTIONS,
-            max_keepalive_connections=self.settings.HTTP_POOL_MAX_KEEPALIVE,
-            keepalive_expiry=self.settings.HTTP_POOL_KEEPALIVE_EXPIRY,
-        )
-
-        # Try to enable HTTP/2
-        enable_http2 = getattr(self.settings, "HTTP_ENABLE_HTTP2", True)
-        if enable_http2:
-            try:
-                import h2  # noqa
-            except ImportError:
-                enable_http2 = False
-
-        self.client = httpx.AsyncClient(
-            base_url=self.graph_base_url,
-            timeout=self.timeout,
-            headers=self.auth_headers,
-            follow_redirects=True,
-            http2=enable_http2,
-            limits=limits,
-        )
-        return self
+        # Base URL and auth headers are applied per request by BaseClient._request
+        return await super().__aenter__()
+
+    async def _paginate(
+        self, endpoint: str, params: Dict[str, str]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield every item of a Graph collection, following `@odata.nextLink` pages."""
+        response = await self.get(endpoint, params=params, headers=_PAGED_HEADERS)
+        while True:
+            for item in response.get("value", []):
+                yield item
+            next_link = response.get("@odata.nextLink")
+            if not next_link:
+                return
+            # The link is absolute and already carries the query, including $skiptoken
+            base = self.base_url.rstrip("/")
+            if next_link.startswith(f"{base}/"):
+                response = await self.get(next_link[len(base) :], headers=_PAGED_HEADERS)
+            else:
+                response = await self._get_absolute(next_link)
+
+    async def _get_absolute(self, url: str) -> Dict[str, Any]:
+        """GET a page link that is not under `base_url` (another host or API version)."""
+        headers = self._headers.copy() if self._headers is not None else httpx.Headers()
+        headers.update(_PAGED_HEADERS)
+        async with self._concurrency_slot():
+            response = await self.client.get(url, headers=headers, timeout=self.timeout)
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
     async def fetch_devices_by_user_email(self, email: str) -> Dict[str, Any]:
         """
@@ -220,15 +264,14 @@ class IntuneClient(BaseClient):
         """
         endpoint = "/deviceManagement/managedDevices"
         params = {
-            "$filter": f"userPrincipalName eq '{email}'",
-            "$select": "id,deviceName,userPrincipalName,operatingSystem,osVersion,complianceState,managedDeviceOwnerType,enrolledDateTime,lastSyncDateTime,manufacturer,model,serialNumber,isEncrypted,userDisplayName",
+            "$filter": f"userPrincipalName eq '{_odata_str(email)}'",
+            "$select": _DEVICE_SELECT,
         }
 
         logger.debug("Fetching devices by user email", email=email)
 
         try:
-            response = await self.get(endpoint, params=params)
-            return response
+            return {"value": [device async for device in self._paginate(endpoint, params)]}
         except httpx.HTTPError as e:
             resp = getattr(e, "response", None)
             status = getattr(resp, "status_code", None) if resp is not None else None
@@ -236,6 +279,14 @@ class IntuneClient(BaseClient):
                 service="Microsoft Graph", status_code=status or 502, message=str(e)
             ) from e
 
+    @staticmethod
+    def _device_name_params(device_name: str) -> Dict[str, str]:
+        """Query parameters for looking up managed devices by name."""
+        return {
+            "$filter": f"deviceName eq '{_odata_str(device_name)}'",
+            "$select": _DEVICE_SELECT,
+        }
+
     async def fetch_device_by_name(self, device_name: str) -> Dict[str, Any]:
         """
         Fetch managed devices by device name.
@@ -247,16 +298,12 @@ class IntuneClient(BaseClient):
             dict: Response containing managed devices
         """
         endpoint = "/deviceManagement/managedDevices"
-        params = {
-            "$filter": f"deviceName eq '{device_name}'",
-            "$select": "id,deviceName,userPrincipalName,operatingSystem,osVersion,complianceState,managedDeviceOwnerType,enrolledDateTime,lastSyncDateTime,manufacturer,model,serialNumber,isEncrypted,userDisplayName",
-        }
+        params = self._device_name_params(device_name)
 
         logger.debug("Fetching device by name", device_name=device_name)
 
         try:
-            response = await self.get(endpoint, params=params)
-            return response
+            return {"value": [device async for device in self._paginate(endpoint, params)]}
         except httpx.HTTPError as e:
             resp = getattr(e, "response", None)
             status = getattr(resp, "status_code", None) if resp is not None else None
@@ -275,9 +322,7 @@ class IntuneClient(BaseClient):
             dict: Device details
         """
         endpoint = f"/deviceManagement/managedDevices/{device_id}"
-        params = {
-            "$select": "id,deviceName,userPrincipalName,operatingSystem,osVersion,complianceState,managedDeviceOwnerType,enrolledDateTime,lastSyncDateTime,manufacturer,model,serialNumber,isEncrypted,userDisplayName"
-        }
+        params = {"$select": _DEVICE_SELECT}
 
         logger.debug("Fetching device by ID", device_id=device_id)
 
@@ -293,3 +338,84 @@ class IntuneClient(BaseClient):
             raise ExternalServiceError(
                 service="Microsoft Graph", status_code=status or 502, message=str(e)
             ) from e
+
+    async def fetch_devices_batch(
+        self, requests: List[Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Send several Graph GET requests in a single JSON batch (`$batch`) call.
+
+        Args:
+            requests (list[dict]): Up to 20 sub-requests, each with a `url` relative to the
+                Graph version root (e.g. "/deviceManagement/managedDevices?$filter=...").
+
+        Returns:
+            dict: Sub-responses (`status`, `headers`, `body`) keyed by the index of their
+                request as a string.
+        """
+        if len(requests) > _GRAPH_BATCH_MAX_SIZE:
+            raise ValueError(f"Graph $batch accepts at most {_GRAPH_BATCH_MAX_SIZE} requests")
+
+        payload = {
+            "requests": [
+                {"id": str(i), "method": "GET", "url": request["url"]}
+                for i, request in enumerate(requests)
+            ]
+        }
+        logger.debug("Sending Graph batch request", size=len(requests))
+
+        try:
+            response = await self.post(
+                "/$batch", content=orjson.dumps(payload), headers=_JSON_HEADERS
+            )
+        except httpx.HTTPError as e:
+            resp = getattr(e, "response", None)
+            status = getattr(resp, "status_code", None) if resp is not None else None
+            raise ExternalServiceError(
+                service="Microsoft Graph", status_code=status or 502, message=str(e)
+            ) from e
+
+        return {item["id"]: item for item in response.get("responses", [])}
+
+    async def fetch_devices_by_names(self, device_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch managed devices for several device names, up to 20 names per Graph round trip.
+
+        Args:
+            device_names (list[str]): Device names to search for
+
+        Returns:
+            dict: Response containing managed devices, keyed by device name. Names whose
+                sub-request failed are left out.
+        """
+        endpoint = "/deviceManagement/managedDevices"
+        chunks = [
+            device_names[i : i + _GRAPH_BATCH_MAX_SIZE]
+            for i in range(0, len(device_names), _GRAPH_BATCH_MAX_SIZE)
+        ]
+
+        logger.debug("Fetching devices by name in batches", count=len(device_names))
+
+        batches = await asyncio.gather(
+            *(
+                self.fetch_devices_batch(
+                    [
+                        {"url": f"{endpoint}?{httpx.QueryParams(self._device_name_params(name))}"}
+                        for name in chunk
+                    ]
+                )
+                for chunk in chunks
+            )
+        )
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for chunk, batch in zip(chunks, batches):
+            for i, name in enumerate(chunk):
+                item = batch.get(str(i), {})
+                if item.get("status") == 200:
+                    results[name] = item.get("body") or {}
+                else:
+                    logger.warning(
+                        "Graph batch lookup failed", device_name=name, status=item.get("status")
+                    )
+        return results
@@ -1,12 +1,14 @@
 """NextThink API client."""
 
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
+import orjson
 import structlog
 
-from app.clients.base_cleint import BaseClient
+from app.clients.base_client import BaseClient, _PerLoopSemaphore
 from app.exceptions.custom_exceptions import ExternalServiceError
 from app.utils.health_metrics import get_health_tracker
 
@@ -17,6 +19,12 @@ logger = structlog.get_logger(__name__)
 class NextThinkClient(BaseClient):
     """Client to interact with NextThink API."""
 
+    # Tokens are shared by every instance with the same identity provider,
+    # user and scope. Services build a client per request, so a per-instance cache alone
+    # would fetch a token every time.
+    _token_cache: Dict[Tuple[str, str, str], Tuple[str, float]] = {}
+    _token_locks: Dict[Tuple[str, str, str], _PerLoopSemaphore] = {}
+
     def __init__(
         self,
         auth_base_url: str,
@@ -35,13 +43,14 @@ class NextThinkClient(BaseClient):
         self.scope = scope
         self.timeout = timeout
         self.access_token: Optional[str] = None
-        self.token_expiry: Optional[datetime] = None
+        self._token_expiry_monotonic: float = 0.0
         self.client = None
-
-        # Get settings for connection pool configuration
-        from app.config.settings import get_settings
-
-        self.settings = get_settings()
+        self._token_key = (auth_base_url, username, scope)
+        # The token request never changes for an instance, so build it once.
+        # NextThink uses the /oauth2/default/v1/token endpoint with Basic Auth and form data.
+        self._token_url = f"{auth_base_url}/oauth2/default/v1/token"
+        self._token_data = {"grant_type": grant_type, "scope": scope}
+        self._token_auth = httpx.BasicAuth(username=username, password=password)
 
         # Initialize with NextThink API URL for API calls
         super().__init__(api_base_url, timeout)
@@ -49,46 +58,58 @@ class NextThinkClient(BaseClient):
     async def _get_access_token(self) -> str:
         """Obtain OAuth2 access token from NextThink with caching."""
         # Check if we have a valid cached token
-        if self.access_token and self.token_expiry and datetime.now() < self.token_expiry:
+        if self._has_valid_token():
             logger.debug(
                 "Using cached access token",
-                expires_in=(self.token_expiry - datetime.now()).total_seconds(),
+                expires_in=self._token_expiry_monotonic - time.monotonic(),
             )
             return self.access_token
 
+        # One refresh per credentials at a time; callers that queued behind it reuse its token
+        lock = NextThinkClient._token_locks.setdefault(self._token_key, _PerLoopSemaphore())
+        async with lock.get(1):
+            if self._has_valid_token():
+                return self.access_token
+            return await self._fetch_access_token()
+
+    def _has_valid_token(self) -> bool:
+        """Whether a valid token is cached, adopting one fetched by another instance."""
+        if self.access_token and time.monotonic() < self._token_expiry_monotonic:
+            return True
+        cached = NextThinkClient._token_cache.get(self._token_key)
+        if cached is None or time.monotonic() >= cached[1]:
+            return False
+        self.access_token, self._token_expiry_monotonic = cached
+        return True
+
+    async def _fetch_access_token(self) -> str:
+        """Request a new access token from NextThink and cache it."""
         logger.debug("Getting new NextThink access token", auth_base_url=self.auth_base_url)
-        # NextThink uses /oauth2/default/v1/token endpoint
-        token_url = f"{self.auth_base_url}/oauth2/default/v1/token"
-        logger.debug("Token URL", url=token_url)
-
-        # Send as form data with proper OAuth2 format
-        data = {"grant_type": self.grant_type, "scope": self.scope}
-
-        # Use Basic Auth with username and password
-        auth = httpx.BasicAuth(username=self.username, password=self.password)
+        logger.debug("Token URL", url=self._token_url)
 
         try:
-            # Use optimized client for token acquisition
-            async with httpx.AsyncClient(
-                limits=httpx.Limits(
-                    max_connections=self.settings.HTTP_POOL_MAX_CONNECTIONS,
-                    max_keepalive_connections=self.settings.HTTP_POOL_MAX_KEEPALIVE,
-                )
-            ) as client:
-                response = await client.post(
-                    token_url,
-                    data=data,
-                    auth=auth,
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                )
-                response.raise_for_status()
-                token_data = response.json()
-                self.access_token = token_data.get("access_token")
+            # The shared pool keeps the connection to the identity provider alive between
+            # refreshes, instead of a new client and TLS handshake for every token
+            client = BaseClient._get_shared_client()
+            response = await client.post(
+                self._token_url,
+                data=self._token_data,
+                auth=self._token_auth,
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            token_data = orjson.loads(response.content)
+            self.access_token = token_data.get("access_token")
 
             # Cache token with expiry (NextThink tokens typically expire in 3600 seconds)
             # Set expiry to 5 minutes before actual expiry for safety margin
             expires_in = token_data.get("expires_in", 3600)
-            self.token_expiry = datetime.now() + timedelta(seconds=expires_in - 300)
+            self._token_expiry_monotonic = time.monotonic() + expires_in - 300
+            NextThinkClient._token_cache[self._token_key] = (
+                self.access_token,
+                self._token_expiry_monotonic,
+            )
 
             logger.debug("Successfully obtained NextThink access token", expires_in=expires_in)
             return self.access_token
@@ -111,9 +132,7 @@ class NextThinkClient(BaseClient):
         """
         try:
             # Check if we have a cached token before making the call
-            was_cached = bool(
-                self.access_token and self.token_expiry and datetime.now() < self.token_expiry
-            )
+            was_cached = self._has_valid_token()
 
             token = await self._get_access_token()
 
@@ -126,10 +145,9 @@ class NextThinkClient(BaseClient):
                 "cached": was_cached,
             }
 
-            if self.token_expiry:
-                result["token_expires_in_seconds"] = int(
-                    (self.token_expiry - datetime.now()).total_seconds()
-                )
+            if self._token_expiry_monotonic:
+                expires_in = self._token_expiry_monotonic - time.monotonic()
+                result["token_expires_in_seconds"] = int(expires_in)
 
             # Track health metrics
             tracker = get_health_tracker()
@@ -182,34 +200,11 @@ class NextThinkClient(BaseClient):
             }
 
     async def __aenter__(self):
-        """Set up the client with authentication and connection pooling."""
+        """Authenticate, then borrow the shared connection pool for API calls."""
         token = await self._get_access_token()
         self.auth_headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
-
-        # Create client with optimized connection pool
-        limits = httpx.Limits(
-            max_connections=self.settings.HTTP_POOL_MAX_CONNECTIONS,
-            max_keepalive_connections=self.settings.HTTP_POOL_MAX_KEEPALIVE,
-            keepalive_expiry=self.settings.HTTP_POOL_KEEPALIVE_EXPIRY,
-        )
-
-        # Try to enable HTTP/2
-        enable_http2 = getattr(self.settings, "HTTP_ENABLE_HTTP2", True)
-        if enable_http2:
-            try:
-                import h2  # noqa
-            except ImportError:
-                enable_http2 = False
-
-        self.client = httpx.AsyncClient(
-            base_url=self.api_base_url,
-            timeout=self.timeout,
-            headers=self.auth_headers,
-            follow_redirects=True,
-            http2=enable_http2,
-            limits=limits,
-        )
-        return self
+        # Base URL and auth headers are applied per request by BaseClient._request
+        return await super().__aenter__()
 
     async def get_remote_actions(
         self, device_name: str, query_type: str = "detailed"
@@ -1,9 +1,12 @@
 """ServiceNow API client."""
 
+import contextlib
+from typing import AsyncIterator
+
 import httpx
 import structlog
 
-from app.clients.base_cleint import BaseClient
+from app.clients.base_client import BaseClient, _PerLoopSemaphore
 from app.exceptions.custom_exceptions import ExternalServiceError
 from app.utils.health_metrics import get_health_tracker
 
@@ -14,6 +17,9 @@ logger = structlog.get_logger(__name__)
 class ServiceNowClient(BaseClient):
     """Client to interact with ServiceNow API."""
 
+    # Process-wide cap on in-flight ServiceNow calls, shared by every client instance
+    _servicenow_slots = _PerLoopSemaphore()
+
     def __init__(self, base_url: str, username: str, password: str, timeout: int = 30):
 
         self.base_url = base_url
@@ -29,6 +35,20 @@ class ServiceNowClient(BaseClient):
 
         super().__init__(base_url, timeout, auth=basic_auth, auth_headers=headers)
 
+    @contextlib.asynccontextmanager
+    async def _concurrency_slot(self) -> AsyncIterator[None]:
+        """
+        Limit concurrent ServiceNow calls to SERVICENOW_MAX_CONCURRENCY.
+
+        Bursts (e.g. many /logs requests, each fanning out to several calls) queue here
+        instead of tripping ServiceNow's rate limits and exhausting connections.
+        """
+        async with ServiceNowClient._servicenow_slots.get(
+            self.settings.SERVICENOW_MAX_CONCURRENCY
+        ):
+            async with super()._concurrency_slot():
+                yield
+
     async def health_check(self) -> dict:
         """
         Perform a lightweight health check by verifying connection to ServiceNow.
@@ -283,15 +303,22 @@ class ServiceNowClient(BaseClient):
 
         Returns:
             dict: Computer details or None if not found
+
+        Raises:
+            httpx.HTTPStatusError: For error responses other than 404, so callers can tell a
+                failed lookup from a computer that does not exist
         """
         endpoint = f"/api/now/table/cmdb_ci_computer/{sys_id}"
         params = {"sysparm_fields": "name,host_name,sys_id", "sysparm_display_value": "all"}
         try:
             response = await self.get(endpoint, params=params)
             return response.get("result")
-        except httpx.HTTPError:
-            logger.warning("Failed to fetch computer by sys_id", sys_id=sys_id)
-            return None
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                logger.debug("Computer not found", sys_id=sys_id)
+                return None
+            logger.warning("Failed to fetch computer by sys_id", sys_id=sys_id, error=str(e))
+            raise
 
     async def fetch_incident_details(
         self, incident_number: str, _fields: list[str] | None = None
@@ -327,6 +354,44 @@ class ServiceNowClient(BaseClient):
         logger.debug("Incident not found", incident_number=incident_number)
         return {}
 
+    @staticmethod
+    def incident_comments_request(
+        incident_sys_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        sysparm_display_value: str = "all",
+    ) -> tuple[str, dict]:
+        """Build the endpoint and query params for an incident comments lookup."""
+        endpoint = "/api/now/table/sys_journal_field"
+        params = {
+            "sysparm_query": f"element_id={incident_sys_id}^element=comments^ORelement=work_notes",
+            "sysparm_limit": str(limit),
+            "sysparm_offset": str(offset),
+            "sysparm_display_value": sysparm_display_value,
+            "sysparm_fields": "sys_id,element_id,value,sys_created_by,sys_created_on,sys_updated_on",
+            "sysparm_order_by": "-sys_created_on",
+        }
+        return endpoint, params
+
+    @staticmethod
+    def incident_activity_logs_request(
+        incident_sys_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        sysparm_display_value: str = "all",
+    ) -> tuple[str, dict]:
+        """Build the endpoint and query params for an incident activity log lookup."""
+        endpoint = "/api/now/table/sys_journal_field"
+        params = {
+            "sysparm_query": f"element_id={incident_sys_id}^element=state",
+            "sysparm_limit": str(limit),
+            "sysparm_offset": str(offset),
+            "sysparm_display_value": sysparm_display_value,
+            "sysparm_fields": "sys_id,value,sys_created_by,sys_created_on",
+            "sysparm_order_by": "-sys_created_on",
+        }
+        return endpoint, params
+
     async def fetch_incident_comments(
         self,
         incident_sys_id: str,
@@ -346,15 +411,9 @@ class ServiceNowClient(BaseClient):
         Returns:
             dict: Raw API response containing comments.
         """
-        endpoint = "/api/now/table/sys_journal_field"
-        params = {
-            "sysparm_query": f"element_id={incident_sys_id}^element=comments^ORelement=work_notes",
-            "sysparm_limit": str(limit),
-            "sysparm_offset": str(offset),
-            "sysparm_display_value": sysparm_display_value,
-            "sysparm_fields": "sys_id,element_id,value,sys_created_by,sys_created_on,sys_updated_on",
-            "sysparm_order_by": "-sys_created_on",
-        }
+        endpoint, params = self.incident_comments_request(
+            incident_sys_id, limit, offset, sysparm_display_value
+        )
         logger.debug(
             "Fetching incident comments from ServiceNow",
             incident_sys_id=incident_sys_id,
@@ -399,15 +458,9 @@ class ServiceNowClient(BaseClient):
             limit=limit,
             offset=offset,
         )
-        endpoint = "/api/now/table/sys_journal_field"
-        params = {
-            "sysparm_query": f"element_id={incident_sys_id}^element=state",
-            "sysparm_limit": str(limit),
-            "sysparm_offset": str(offset),
-            "sysparm_display_value": sysparm_display_value,
-            "sysparm_fields": "sys_id,value,sys_created_by,sys_created_on",
-            "sysparm_order_by": "-sys_created_on",
-        }
+        endpoint, params = self.incident_activity_logs_request(
+            incident_sys_id, limit, offset, sysparm_display_value
+        )
         try:
             response = await self.get(endpoint, params=params)
             return response
@@ -417,3 +470,29 @@ class ServiceNowClient(BaseClient):
             )
             # Return empty result instead of raising error
             return {"result": [], "warning": "Activity logs not available for this incident"}
+
+    async def execute_batch(self, batch_request_id: str, rest_requests: list[dict]) -> dict:
+        """
+        Send several REST sub-requests to ServiceNow in a single Batch API call.
+
+        Args:
+            batch_request_id (str): Identifier echoed back in the batch response.
+            rest_requests (list[dict]): Sub-requests in Batch API format (id, url, method, headers).
+
+        Returns:
+            dict: Raw Batch API response with `serviced_requests` and `unserviced_requests`.
+        """
+        payload = {"batch_request_id": batch_request_id, "rest_requests": rest_requests}
+        logger.debug(
+            "Sending ServiceNow batch request",
+            batch_request_id=batch_request_id,
+            size=len(rest_requests),
+        )
+        try:
+            return await self.post("/api/now/v1/batch", json=payload)
+        except httpx.HTTPError as e:
+            resp = getattr(e, "response", None)
+            status = getattr(resp, "status_code", None) if resp is not None else None
+            raise ExternalServiceError(
+                service="ServiceNow", status_code=status or 502, message=str(e)
+            ) from e
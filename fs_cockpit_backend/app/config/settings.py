@@ -34,6 +34,10 @@ class Settings(BaseSettings):
     SERVICENOW_INSTANCE_URL: str = Field(..., env=("SERVICENOW_INSTANCE_URL", "SN_INSTANCE_URL"))
     SERVICENOW_USERNAME: str = Field(..., env=("SERVICENOW_USERNAME", "SN_USERNAME"))
     SERVICENOW_PASSWORD: str = Field(..., env=("SERVICENOW_PASSWORD", "SN_PASSWORD"))
+    SERVICENOW_BATCH_ENABLED: bool = True  # Coalesce concurrent table reads via the Batch API
+    SERVICENOW_BATCH_WINDOW_MS: int = 10  # How long to wait for more requests to join a batch
+    SERVICENOW_BATCH_MAX_SIZE: int = 20  # Maximum sub-requests per Batch API call
+    SERVICENOW_MAX_CONCURRENCY: int = 32  # In-flight ServiceNow calls per worker process
 
     # Intune Configuration
     INTUNE_BASE_URL: str = Field(..., env="INTUNE_BASE_URL")
@@ -61,9 +65,13 @@ class Settings(BaseSettings):
     # Http Configuration
     HTTP_TIMEOUT_SECONDS: int = 30
     HTTP_POOL_MAX_CONNECTIONS: int = 200
-    HTTP_POOL_MAX_KEEPALIVE: int = 100
+    # Idle sockets kept warm for reuse; more than steady-state concurrency just piles up
+    HTTP_POOL_MAX_KEEPALIVE: int = 20
+    # Seconds an idle socket is kept. Longer avoids a TCP+TLS handshake per poll, but it
+    # must stay below the upstream's idle timeout or reuse hits connections it has closed
     HTTP_POOL_KEEPALIVE_EXPIRY: float = 30.0
     HTTP_ENABLE_HTTP2: bool = True  # Enable HTTP/2 if h2 package available
+    HTTP_MAX_CONCURRENCY: int = 200  # In-flight outbound calls per process; keep <= pool size
 
     # NextThink Query Optimization
     NEXTTHINK_DEFAULT_DAYS: int = 7  # Reduced from 30 for better performance
@@ -124,6 +132,8 @@ class Settings(BaseSettings):
     CACHE_MAX_SIZE: int = 10000  # Maximum number of cache entries
     CACHE_DEFAULT_TTL: int = 300  # Default TTL in seconds (5 minutes)
     CACHE_CLEANUP_INTERVAL: int = 300  # Cleanup interval in seconds (5 minutes)
+    CACHE_WARMUP_ENABLED: bool = True  # Preload data for the busiest devices on startup
+    CACHE_WARMUP_TOP_DEVICES: int = 50  # Number of most active devices to warm
 
     # Cache TTL for different data types
     CACHE_TTL_DEVICE: int = 900  # 15 minutes for device info
@@ -132,7 +142,9 @@ class Settings(BaseSettings):
     CACHE_TTL_REMOTE_ACTION: int = 600  # 10 minutes for remote actions
     CACHE_TTL_KNOWLEDGE: int = 900  # 15 minutes for KB articles
     CACHE_TTL_SOLUTION: int = 900  # 15 minutes for AI-generated solutions
+    CACHE_TTL_AI_RESPONSE: int = 3600  # 1 hour for Gemini responses, keyed by prompt
     CACHE_TTL_DIAGNOSTICS: int = 600  # 10 minutes for device diagnostics
+    CACHE_TTL_NEGATIVE: int = 120  # 2 minutes for lookups that found nothing
 
     # Google Gemini AI Configuration
     GOOGLE_AI_API_KEY: str = Field(default="", env="GOOGLE_AI_API_KEY")
@@ -141,6 +153,9 @@ class Settings(BaseSettings):
     GOOGLE_AI_MODEL_NAME: str = Field(default="gemini-pro", env="GOOGLE_AI_MODEL_NAME")
     GOOGLE_AI_TEMPERATURE: float = Field(default=0.7, env="GOOGLE_AI_TEMPERATURE")
     GOOGLE_AI_MAX_OUTPUT_TOKENS: int = Field(default=1000, env="GOOGLE_AI_MAX_OUTPUT_TOKENS")
+    GOOGLE_AI_TIMEOUT_SECONDS: int = Field(default=30, env="GOOGLE_AI_TIMEOUT_SECONDS")
+    GOOGLE_AI_MAX_RETRIES: int = Field(default=3, env="GOOGLE_AI_MAX_RETRIES")
+    GOOGLE_AI_MAX_CONCURRENCY: int = Field(default=8, env="GOOGLE_AI_MAX_CONCURRENCY")
 
     # CORS defaults
     ALLOWED_ORIGINS: List[str] = ["*"]
@@ -150,6 +165,7 @@ class Settings(BaseSettings):
 
     # GZip configuration
     GZIP_MINIMUM_SIZE: int = 1000
+    GZIP_COMPRESS_LEVEL: int = 6  # 1-9; levels above 6 cost much more CPU for little gain on JSON
     # Runtime environment for logging/configuration (e.g. development|production)
     ENVIRONMENT: str = "development"
 
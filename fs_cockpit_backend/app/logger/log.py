@@ -13,7 +13,7 @@ import logging
 import os
 import sys
 from logging.handlers import RotatingFileHandler
-from typing import Optional
+from typing import Any, Optional
 
 import structlog
 
@@ -26,6 +26,16 @@ except ImportError:
     _HAS_CONTEXTVARS = False
     print("[logger] structlog contextvars import failed", file=sys.stderr)
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - falls back to the stdlib json serializer
+    orjson = None
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """JSONRenderer serializer backed by orjson; stdlib handlers expect str, not bytes."""
+    return orjson.dumps(obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 def configure_logging(env: str = "development", *, enable_file: Optional[bool] = None) -> None:
     """Initialize stdlib logging and structlog.
@@ -77,7 +87,9 @@ def configure_logging(env: str = "development", *, enable_file: Optional[bool] =
             print(f"[logger] failed to set up file handler: {exc}", file=sys.stderr)
 
     # structlog configuration
-    processors = []
+    # Drop records below the stdlib level before any processor runs, so logger.debug()
+    # calls on hot paths cost only a level check in production.
+    processors = [structlog.stdlib.filter_by_level]
     # If structlog contextvars is available, merge any bound contextvars
     # (like request_id) into the event dict so processors can render them.
     if _HAS_CONTEXTVARS and _structlog_contextvars is not None:
@@ -92,7 +104,10 @@ def configure_logging(env: str = "development", *, enable_file: Optional[bool] =
     )
 
     if env == "production":
-        processors.append(structlog.processors.JSONRenderer())
+        if orjson is not None:
+            processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
+        else:
+            processors.append(structlog.processors.JSONRenderer())
     else:
         processors.append(structlog.dev.ConsoleRenderer())
 
@@ -7,7 +7,8 @@ and extend. The module still exposes a top-level `app` variable for
 `uvicorn main:app` / `gunicorn main:app` compatibility.
 """
 
-from typing import Optional
+import asyncio
+from typing import List, Optional
 
 import structlog
 from fastapi import FastAPI, Request
@@ -62,6 +63,8 @@ class FSCockpitApplication:
         self.logger.info("app.initializing", title=title or self.settings.TITLE)
         self.title = title or self.settings.TITLE
         self._app: Optional[FastAPI] = None
+        # Strong references to startup tasks; asyncio only keeps weak ones
+        self._background_tasks: List[asyncio.Task] = []
         self._create_app()
         # Register routes separately from app creation
         self._register_health()
@@ -104,7 +107,11 @@ class FSCockpitApplication:
         )
 
         # GZip compression middleware
-        self._app.add_middleware(GZipMiddleware, minimum_size=self.settings.GZIP_MINIMUM_SIZE)
+        self._app.add_middleware(
+            GZipMiddleware,
+            minimum_size=self.settings.GZIP_MINIMUM_SIZE,
+            compresslevel=self.settings.GZIP_COMPRESS_LEVEL,
+        )
 
         # Register security headers middleware (moved to app.middleware.security)
         self._app.add_middleware(SecurityHeadersMiddleware)
@@ -156,10 +163,19 @@ class FSCockpitApplication:
         @self._app.on_event("startup")
         async def startup_event():
             """Initialize database and background tasks on startup."""
-            import asyncio
-
             from app.cache.memory_cache import get_cache
 
+            # Open the shared upstream connection pool before the first request needs it
+            from app.clients.base_client import BaseClient
+
+            BaseClient.init_shared_client()
+
+            # Coalesce concurrent ServiceNow table reads into Batch API calls
+            if self.settings.SERVICENOW_BATCH_ENABLED:
+                from app.services.servicenow_batcher import get_servicenow_batcher
+
+                get_servicenow_batcher().start()
+
             # Initialize database and verify connection
             self.logger.info("Starting database initialization")
             db_initialized = await init_db()
@@ -185,24 +201,51 @@ class FSCockpitApplication:
 
             # Start background cleanup task
             if self.settings.CACHE_ENABLED:
-                asyncio.create_task(cleanup_cache_periodically())
+                self._background_tasks.append(asyncio.create_task(cleanup_cache_periodically()))
                 self.logger.info(
                     "Cache cleanup task started",
                     interval_seconds=self.settings.CACHE_CLEANUP_INTERVAL,
                 )
 
+            # Warm the cache for the busiest devices without delaying startup
+            if (
+                self.settings.CACHE_ENABLED
+                and self.settings.CACHE_WARMUP_ENABLED
+                and db_initialized
+            ):
+                from app.cache.warmup import warm_caches
+
+                self._background_tasks.append(
+                    asyncio.create_task(warm_caches(self.settings.CACHE_WARMUP_TOP_DEVICES))
+                )
+                self.logger.info(
+                    "Cache warmup task started",
+                    top_devices=self.settings.CACHE_WARMUP_TOP_DEVICES,
+                )
+
         @self._app.on_event("shutdown")
         async def shutdown_event():
             """Cleanup resources on application shutdown."""
             try:
                 self.logger.info("Starting application shutdown")
 
+                # Stop background tasks before the pools they use are torn down
+                for task in self._background_tasks:
+                    task.cancel()
+                await asyncio.gather(*self._background_tasks, return_exceptions=True)
+                self._background_tasks.clear()
+
                 # Close database connections
                 await close_db()
                 self.logger.info("Database connections closed")
 
+                # Flush the ServiceNow batcher before the connection pool goes away
+                from app.services.servicenow_batcher import get_servicenow_batcher
+
+                await get_servicenow_batcher().stop()
+
                 # Close HTTP client connections
-                from app.clients.base_cleint import BaseClient
+                from app.clients.base_client import BaseClient
 
                 await BaseClient.close_shared_client()
                 self.logger.info("HTTP client connections closed")
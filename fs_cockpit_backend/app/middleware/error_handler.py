@@ -130,16 +130,17 @@ class GlobalErrorHandlerMiddleware(BaseHTTPMiddleware):
             }
             logger.warning("circuitbreaker.open", request_id=request_id, error=str(exc))
             return JSONResponse(status_code=503, content=body)
-        # For any other unhandled exception, return a generic error response
-        logger.exception("unhandled.exception", request_id=request_id)
-        body = {
-            "success": False,
-            "message": "internal server error",
-            "data": None,
-            "timestamp": _now_iso(),
-            "request_id": request_id,
-        }
-        return JSONResponse(status_code=500, content=body)
+        except Exception:  # noqa: BLE001
+            # For any other unhandled exception, return a generic error response
+            logger.exception("unhandled.exception", request_id=request_id, path=request.url.path)
+            body = {
+                "success": False,
+                "message": "internal server error",
+                "data": None,
+                "timestamp": _now_iso(),
+                "request_id": request_id,
+            }
+            return JSONResponse(status_code=500, content=body)
 
 
 __all__ = ["GlobalErrorHandlerMiddleware"]
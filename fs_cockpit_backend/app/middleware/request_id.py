@@ -58,4 +58,14 @@ def get_request_id(request: Request) -> Optional[str]:
     return request_id
 
 
-__all__ = ["RequestIDMiddleware", "get_request_id"]
+async def request_id_dependency(request: Request) -> Optional[str]:
+    """
+    FastAPI dependency form of get_request_id.
+
+    Declared async because FastAPI runs sync dependencies in the threadpool; this
+    lookup never blocks, so it is resolved directly on the event loop.
+    """
+    return get_request_id(request)
+
+
+__all__ = ["RequestIDMiddleware", "get_request_id", "request_id_dependency"]
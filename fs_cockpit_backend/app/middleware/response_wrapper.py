@@ -1,17 +1,23 @@
 from __future__ import annotations
 
-import json
 from datetime import datetime
 
+import orjson
 import structlog
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import Response
 
 from app.logger.log import get_logger
 
 logger = structlog.get_logger(__name__)
 
+# Caching headers set by handlers that must survive re-wrapping
+_PRESERVED_HEADERS = ("cache-control", "etag", "last-modified", "vary")
+# Fixed head of the success envelope; the handler's serialized body is spliced in after it
+_SUCCESS_HEAD = b'{"success":true,"message":"Operation completed successfully","data":'
+
 
 def _now_iso() -> str:
     return datetime.utcnow().isoformat() + "Z"
@@ -63,31 +69,52 @@ class ResponseWrapperMiddleware(BaseHTTPMiddleware):
         else:
             body_bytes = getattr(response, "body", b"") or b""
 
+        # The body iterator is consumed now, so pass-through cases must rebuild the response
+        def _passthrough() -> Response:
+            return Response(
+                content=body_bytes,
+                status_code=response.status_code,
+                headers=dict(response.headers),
+                background=response.background,
+            )
+
         # Parse JSON body, or return original response if not JSON
         try:
-            payload = json.loads(body_bytes.decode("utf-8")) if body_bytes else None
-        except (json.JSONDecodeError, UnicodeDecodeError):
-            return response
+            payload = orjson.loads(body_bytes) if body_bytes else None
+        except orjson.JSONDecodeError:
+            return _passthrough()
 
         # If it's already our standard shape, return as-is
         if isinstance(payload, dict) and payload.get("success") is not None:
-            return response
+            return _passthrough()
+
+        # Don't preserve original headers - the wrapped response sets its own content headers
+        # Only preserve specific headers if needed (like cache-control, etc.)
+        preserved = {
+            name: response.headers[name] for name in _PRESERVED_HEADERS if name in response.headers
+        }
 
         # Build wrapper
         status_code = getattr(response, "status_code", 200)
         if status_code < 400:
-            wrapper = {
-                "success": True,
-                "message": "Operation completed successfully",
-                "data": payload,
-                "timestamp": _now_iso(),
-                "request_id": request_id,
-            }
+            # The body is already serialized JSON, so splice it in rather than re-encoding it
+            tail = orjson.dumps({"timestamp": _now_iso(), "request_id": request_id})
+            content = b"".join((_SUCCESS_HEAD, body_bytes or b"null", b",", tail[1:]))
+            return Response(
+                content=content,
+                status_code=status_code,
+                headers=preserved or None,
+                media_type="application/json",
+            )
         else:
             # For error responses, try to extract message from payload
             message = None
             if isinstance(payload, dict):
-                message = payload.get("message") or payload.get("detail") or json.dumps(payload)
+                message = (
+                    payload.get("message")
+                    or payload.get("detail")
+                    or orjson.dumps(payload).decode()
+                )
             else:
                 message = str(payload)
 
@@ -99,9 +126,7 @@ class ResponseWrapperMiddleware(BaseHTTPMiddleware):
                 "request_id": request_id,
             }
 
-        # Don't preserve original headers - let JSONResponse set them correctly
-        # Only preserve specific headers if needed (like cache-control, etc.)
-        return JSONResponse(status_code=status_code, content=wrapper)
+        return ORJSONResponse(status_code=status_code, content=wrapper, headers=preserved or None)
 
 
 __all__ = ["ResponseWrapperMiddleware"]
@@ -37,6 +37,7 @@ class PaginationMetadata(BaseModel):
     limit: int
     offset: int
     has_more: bool
+    next_cursor: Optional[str] = None  # Opaque cursor for the next page (None on the last page)
 
 
 class IncidentListResponse(BaseModel):
@@ -69,6 +69,9 @@ class RemoteActionExecuteRequest(BaseModel):
 
     actionType: str = Field(..., description="Type of action to execute")
     deviceId: str = Field(..., description="Target device identifier")
+    deviceName: Optional[str] = Field(
+        None, description="Target device name; refreshes its cached action history"
+    )
     parameters: Optional[Dict[str, Any]] = Field(
         default_factory=dict, description="Action parameters"
     )
@@ -80,6 +83,7 @@ class RemoteActionExecuteRequest(BaseModel):
             "example": {
                 "actionType": "restart",
                 "deviceId": "dev_67890",
+                "deviceName": "DESKTOP-ABC123",
                 "parameters": {"timeout": 30},
             }
         }
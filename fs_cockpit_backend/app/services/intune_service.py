@@ -3,7 +3,7 @@ Intune Service Module
 This module provides functionalities to interact with Microsoft Intune via Graph API.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import structlog
 
@@ -58,6 +58,42 @@ class IntuneService:
             userDisplayName=device.get("userDisplayName"),
         )
 
+    def _push_devices_to_db(
+        self,
+        dtos: List[DeviceDTO],
+        sync_status: str = "success",
+        error_message: Optional[str] = None,
+        **log_fields,
+    ) -> None:
+        """Push looked-up devices to the database for the AI engine and log the sync."""
+        db = SessionLocal()
+        try:
+            for device in dtos:
+                DeviceWriter.push_device(
+                    db,
+                    device_name=device.deviceName or "",
+                    device_type=device.operatingSystem or "Unknown",
+                    intune_device_id=device.deviceId,
+                    os_version=device.osVersion,
+                    serial_number=device.serialNumber,
+                    is_compliant=(device.complianceState == "Compliant"),
+                    is_managed=True,
+                )
+
+            # Log sync
+            SyncHistoryWriter.push_sync_record(
+                db,
+                source="Intune",
+                sync_status=sync_status,
+                record_count=len(dtos),
+                error_message=error_message,
+            )
+            logger.info("Pushed devices to DB", count=len(dtos), **log_fields)
+        except Exception as e:  # noqa: BLE001
+            logger.error("Error pushing devices to DB", error=str(e))
+        finally:
+            db.close()
+
     async def health_check(self) -> dict:
         """
         Perform a health check by attempting to authenticate with Microsoft Graph.
@@ -182,32 +218,7 @@ class IntuneService:
         dtos: List[DeviceDTO] = [self._map_device_to_dto(d) for d in devices]
 
         # Push devices to database for AI engine
-        db = SessionLocal()
-        try:
-            for device in dtos:
-                DeviceWriter.push_device(
-                    db,
-                    device_name=device.deviceName or "",
-                    device_type=device.operatingSystem or "Unknown",
-                    intune_device_id=device.deviceId,
-                    os_version=device.osVersion,
-                    serial_number=device.serialNumber,
-                    is_compliant=(device.complianceState == "Compliant"),
-                    is_managed=True,
-                )
-
-            # Log sync
-            SyncHistoryWriter.push_sync_record(
-                db,
-                source="Intune",
-                sync_status="success",
-                record_count=len(dtos),
-            )
-            logger.info("Pushed devices to DB", count=len(dtos), device_name=device_name)
-        except Exception as e:  # noqa: BLE001
-            logger.error("Error pushing devices to DB", error=str(e))
-        finally:
-            db.close()
+        self._push_devices_to_db(dtos, device_name=device_name)
 
         # Cache the result
         if self.cache:
@@ -216,6 +227,76 @@ class IntuneService:
 
         return dtos
 
+    async def fetch_devices_by_names(self, device_names: List[str]) -> Dict[str, List[DeviceDTO]]:
+        """
+        Fetch devices for several device names, sharing Graph round trips via JSON batching.
+        Reads and fills the same cache entries as fetch_devices_by_name.
+
+        Args:
+            device_names (List[str]): The device names
+
+        Returns:
+            Dict[str, List[DeviceDTO]]: Devices matching each name. Names whose lookup
+                failed are left out.
+        """
+        names = list(dict.fromkeys(device_names))
+        results: Dict[str, List[DeviceDTO]] = {}
+
+        # Check cache first
+        if self.cache:
+            cached = self.cache.many_get(f"intune:devices_by_name:{name}" for name in names)
+            for name in names:
+                key = f"intune:devices_by_name:{name}"
+                if key in cached:
+                    results[name] = cached[key]
+
+        missing = [name for name in names if name not in results]
+        if not missing:
+            return results
+
+        logger.debug(
+            "Connecting to Microsoft Graph", graph_url=self.graph_url, tenant_id=self.tenant_id
+        )
+
+        async with IntuneClient(
+            self.graph_url,
+            self.tenant_id,
+            self.client_id,
+            self.client_secret,
+            auth_base_url=self.base_url,
+        ) as client:
+            raw = await client.fetch_devices_by_names(missing)
+
+        fetched = {
+            name: [self._map_device_to_dto(d) for d in body.get("value", [])]
+            for name, body in raw.items()
+        }
+
+        failed = len(missing) - len(fetched)
+        if not fetched:
+            # Nothing came back, so there is no sync to record
+            logger.warning("Intune batch lookups all failed", device_names=len(missing))
+            return results
+
+        # Push devices to database for AI engine
+        self._push_devices_to_db(
+            [dto for dtos in fetched.values() for dto in dtos],
+            sync_status="partial" if failed else "success",
+            error_message=f"{failed} of {len(missing)} device lookups failed" if failed else None,
+            device_names=len(fetched),
+        )
+
+        # Cache the result
+        if self.cache:
+            self.cache.many_set(
+                {f"intune:devices_by_name:{name}": dtos for name, dtos in fetched.items()},
+                ttl_seconds=self.settings.CACHE_TTL_DEVICE,
+            )
+            logger.debug("Cached devices by name", device_names=len(fetched))
+
+        results.update(fetched)
+        return results
+
     async def fetch_device_by_id(self, device_id: str) -> Optional[DeviceDTO]:
         """
         Fetch a specific device by its ID.
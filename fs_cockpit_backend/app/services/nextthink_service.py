@@ -3,12 +3,14 @@ NextThink Service Module
 This module provides functionalities to interact with NextThink API.
 """
 
+import asyncio
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Collection, Dict, List, Optional, Tuple
 
 import structlog
 
 from app.cache.memory_cache import get_cache
+from app.cache.singleflight import singleflight
 from app.clients.nextthink_client import NextThinkClient
 from app.config.settings import get_settings
 from app.db import (
@@ -21,6 +23,26 @@ from app.schemas.remote_action import RemoteActionDTO, RemoteActionExecuteReques
 # logging configuration
 logger = structlog.get_logger(__name__)
 
+# Action count above which recommendation scoring runs off the event loop
+_SCORING_OFFLOAD_THRESHOLD = 200
+
+# Common device name patterns: CPC-*, LAPTOP-*, DESKTOP-*, WIN-*, PC-*, etc. (checked in order)
+_DEVICE_NAME_PATTERNS = tuple(
+    re.compile(rf"\b({prefix}-[A-Za-z0-9-]+)\b", re.IGNORECASE)
+    for prefix in ("CPC", "LAPTOP", "DESKTOP", "WIN", "PC", "WS")
+)
+
+# Words of 4+ characters taken from the incident description for keyword matching
+_DESCRIPTION_KEYWORD_RE = re.compile(r"\b\w{4,}\b")
+_MAX_DESCRIPTION_KEYWORDS = 10
+
+# Action-name keywords per incident category used by recommendation scoring
+_HARDWARE_ACTION_KEYWORDS = ("hardware", "health", "diagnostic", "disk", "memory", "cpu")
+_SOFTWARE_ACTION_KEYWORDS = ("software", "application", "app", "install", "update", "patch")
+_NETWORK_ACTION_KEYWORDS = ("network", "vpn", "connectivity", "ping", "dns", "proxy")
+_INQUIRY_NETWORK_ACTION_KEYWORDS = ("vpn", "network", "connectivity", "ping", "dns")
+_INQUIRY_SOFTWARE_ACTION_KEYWORDS = ("software", "app", "install", "update", "patch")
+
 
 class NextThinkService:
     """
@@ -42,7 +64,7 @@ class NextThinkService:
     def _apply_filters(
         self,
         dtos: List[RemoteActionDTO],
-        status_filter: Optional[List[str]],
+        status_filter: Optional[Collection[str]],
         days: Optional[int],
         limit: Optional[int],
     ) -> List[RemoteActionDTO]:
@@ -53,7 +75,7 @@ class NextThinkService:
 
         # Filter by status
         if status_filter:
-            status_lower = [s.lower() for s in status_filter]
+            status_lower = {s.lower() for s in status_filter}
             filtered = [
                 dto for dto in filtered if dto.status and dto.status.lower() in status_lower
             ]
@@ -74,8 +96,9 @@ class NextThinkService:
                         filtered_by_date.append(dto)
             filtered = filtered_by_date
 
-        # Sort by updatedAt (most recent first)
-        filtered.sort(
+        # Sort by updatedAt (most recent first); sorted() leaves the cached history untouched
+        filtered = sorted(
+            filtered,
             key=lambda x: (
                 datetime.strptime(x.updatedAt, "%Y-%m-%d %H:%M:%S") if x.updatedAt else datetime.min
             ),
@@ -167,28 +190,52 @@ class NextThinkService:
         self,
         device_name: str,
         query_type: str = "detailed",
-        status_filter: Optional[List[str]] = None,
+        status_filter: Optional[Collection[str]] = None,
         days: Optional[int] = None,
         limit: Optional[int] = None,
     ) -> List[RemoteActionDTO]:
         """
         Fetch remote actions from NextThink with optional filtering.
-        Cached for 10 minutes since remote actions don't change frequently.
+
+        The saved NQL queries only accept a device name, so the device's action history is
+        fetched (and cached) once and every status/days/limit combination is filtered from it.
 
         Args:
             device_name (str): The device name to query
             query_type (str): "detailed" for all details or "basic" for simple list
-            status_filter (List[str], optional): Filter by status (e.g., ["success", "failure"])
+            status_filter (Collection[str], optional): Statuses to keep (e.g., {"success"})
             days (int, optional): Filter actions from last N days
             limit (int, optional): Maximum number of actions to return
 
         Returns:
             List[RemoteActionDTO]: List of remote actions
         """
-        # Build cache key including all parameters
+        dtos = await self._fetch_remote_actions(device_name, query_type)
+
+        filtered_dtos = self._apply_filters(dtos, status_filter, days, limit)
+
+        logger.debug(
+            "Filtered actions", original_count=len(dtos), filtered_count=len(filtered_dtos)
+        )
+        return filtered_dtos
+
+    @singleflight(lambda self, device_name, query_type: f"{device_name}:{query_type}")
+    async def _fetch_remote_actions(
+        self, device_name: str, query_type: str
+    ) -> List[RemoteActionDTO]:
+        """
+        Fetch a device's unfiltered remote action history from NextThink.
+        Cached for 10 minutes since remote actions don't change frequently.
+
+        Args:
+            device_name (str): The device name to query
+            query_type (str): "detailed" for all details or "basic" for simple list
+
+        Returns:
+            List[RemoteActionDTO]: All remote actions returned by the NQL query
+        """
         if self.cache:
-            status_str = ",".join(sorted(status_filter)) if status_filter else "all"
-            cache_key = f"nt:remote_actions:{device_name}:{query_type}:{status_str}:{days}:{limit}"
+            cache_key = f"nt:remote_actions:{device_name}:{query_type}"
             cached_actions = self.cache.get(cache_key)
             if cached_actions is not None:
                 logger.debug("Cache hit for remote actions", device_name=device_name)
@@ -237,20 +284,11 @@ class NextThinkService:
 
         dtos: List[RemoteActionDTO] = [self._map_action_to_dto(a) for a in actions]
 
-        # Apply filters
-        filtered_dtos = self._apply_filters(dtos, status_filter, days, limit)
-
-        # Cache the filtered result
         if self.cache:
-            self.cache.set(
-                cache_key, filtered_dtos, ttl_seconds=self.settings.CACHE_TTL_REMOTE_ACTION
-            )
-            logger.debug("Cached remote actions", device_name=device_name, count=len(filtered_dtos))
+            self.cache.set(cache_key, dtos, ttl_seconds=self.settings.CACHE_TTL_REMOTE_ACTION)
+            logger.debug("Cached remote actions", device_name=device_name, count=len(dtos))
 
-        logger.debug(
-            "Filtered actions", original_count=len(dtos), filtered_count=len(filtered_dtos)
-        )
-        return filtered_dtos
+        return dtos
 
     async def get_remote_action_by_id(self, action_id: str) -> Optional[RemoteActionDTO]:
         """
@@ -279,16 +317,16 @@ class NextThinkService:
 
         return self._map_action_to_dto(raw)
 
-    async def execute_remote_action(
-        self, request: RemoteActionExecuteRequest, technician_username: Optional[str] = None
-    ) -> Dict[str, Any]:
+    async def execute_remote_action(self, request: RemoteActionExecuteRequest) -> Dict[str, Any]:
         """
-        Execute a remote action on NextThink.
-        Pushes action to database for Agentic AI and audit trail.
+        Submit a remote action to NextThink.
+
+        NextThink queues the action and answers with its ID; progress is polled through
+        get_remote_action_by_id. Persisting the submission is left to
+        record_remote_action so callers can run it after responding.
 
         Args:
             request (RemoteActionExecuteRequest): The action execution request
-            technician_username (str): Username of technician executing the action
 
         Returns:
             Dict[str, Any]: Execution response
@@ -311,7 +349,30 @@ class NextThinkService:
         ) as client:
             result = await client.execute_remote_action(action_data)
 
-        # Push action to database for AI engine
+        # The device's cached action history is stale once a new action is queued. It is
+        # keyed by device name (the NQL queries take names), not by the action's deviceId
+        if self.cache and request.deviceName:
+            self.cache.delete_pattern(f"nt:remote_actions:{request.deviceName}:")
+
+        return result
+
+    def record_remote_action(
+        self,
+        request: RemoteActionExecuteRequest,
+        result: Dict[str, Any],
+        technician_username: Optional[str] = None,
+    ) -> None:
+        """
+        Push a submitted remote action to the database for Agentic AI and audit trail.
+
+        Uses a blocking database session, so run it outside the event loop
+        (e.g. as a FastAPI background task).
+
+        Args:
+            request (RemoteActionExecuteRequest): The action execution request
+            result (Dict[str, Any]): Response returned by execute_remote_action
+            technician_username (str): Username of technician executing the action
+        """
         db = SessionLocal()
         try:
             RemoteActionWriter.push_action(
@@ -341,8 +402,6 @@ class NextThinkService:
         finally:
             db.close()
 
-        return result
-
     def _extract_device_name_from_text(self, text: str) -> Optional[str]:
         """
         Extract device name from text using common device naming patterns.
@@ -356,25 +415,19 @@ class NextThinkService:
         if not text:
             return None
 
-        # Common device name patterns: CPC-*, LAPTOP-*, DESKTOP-*, WIN-*, PC-*, etc.
-        patterns = [
-            r"\b(CPC-[A-Za-z0-9-]+)\b",
-            r"\b(LAPTOP-[A-Za-z0-9-]+)\b",
-            r"\b(DESKTOP-[A-Za-z0-9-]+)\b",
-            r"\b(WIN-[A-Za-z0-9-]+)\b",
-            r"\b(PC-[A-Za-z0-9-]+)\b",
-            r"\b(WS-[A-Za-z0-9-]+)\b",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _DEVICE_NAME_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1)
 
         return None
 
     def _score_action_by_category(
-        self, action: RemoteActionDTO, category: str, description: str
+        self,
+        action: RemoteActionDTO,
+        category_lower: str,
+        description_lower: str,
+        description_keywords: Tuple[str, ...],
     ) -> float:
         """
         Score a remote action based on incident category and description.
@@ -382,8 +435,9 @@ class NextThinkService:
 
         Args:
             action (RemoteActionDTO): The remote action
-            category (str): ServiceNow incident category
-            description (str): Incident description
+            category_lower (str): Lowercased ServiceNow incident category
+            description_lower (str): Lowercased incident description
+            description_keywords (Tuple[str, ...]): Keywords extracted from the description
 
         Returns:
             float: Relevance score (0-100)
@@ -391,16 +445,11 @@ class NextThinkService:
         score = 0.0
         action_name = (action.actionName or "").lower()
         action_purpose = (action.result.get("purpose") or "").lower() if action.result else ""
-        description_lower = (description or "").lower()
-        category_lower = (category or "").lower()
 
         # Category-based scoring
         if category_lower == "hardware":
             # Hardware issues: prioritize hardware diagnostics, health checks
-            if any(
-                kw in action_name
-                for kw in ["hardware", "health", "diagnostic", "disk", "memory", "cpu"]
-            ):
+            if any(kw in action_name for kw in _HARDWARE_ACTION_KEYWORDS):
                 score += 40
             if "printer" in description_lower and "print" in action_name:
                 score += 50
@@ -408,18 +457,14 @@ class NextThinkService:
         elif category_lower == "inquiry":
             # Inquiry: analyze description for specific issues
             if "vpn" in description_lower or "network" in description_lower:
-                if any(
-                    kw in action_name for kw in ["vpn", "network", "connectivity", "ping", "dns"]
-                ):
+                if any(kw in action_name for kw in _INQUIRY_NETWORK_ACTION_KEYWORDS):
                     score += 50
             if (
                 "software" in description_lower
                 or "app" in description_lower
                 or "application" in description_lower
             ):
-                if any(
-                    kw in action_name for kw in ["software", "app", "install", "update", "patch"]
-                ):
+                if any(kw in action_name for kw in _INQUIRY_SOFTWARE_ACTION_KEYWORDS):
                     score += 50
             if "print" in description_lower:
                 if "print" in action_name:
@@ -427,18 +472,12 @@ class NextThinkService:
 
         elif category_lower == "software":
             # Software issues: prioritize software-related actions
-            if any(
-                kw in action_name
-                for kw in ["software", "application", "app", "install", "update", "patch"]
-            ):
+            if any(kw in action_name for kw in _SOFTWARE_ACTION_KEYWORDS):
                 score += 40
 
         elif category_lower == "network":
             # Network issues: prioritize network diagnostics
-            if any(
-                kw in action_name
-                for kw in ["network", "vpn", "connectivity", "ping", "dns", "proxy"]
-            ):
+            if any(kw in action_name for kw in _NETWORK_ACTION_KEYWORDS):
                 score += 40
 
         # Purpose-based scoring
@@ -455,15 +494,87 @@ class NextThinkService:
                 score += 5  # Failed actions still relevant to know what was tried
 
         # Keyword matching in description
-        keywords = re.findall(r"\b\w{4,}\b", description_lower)  # Extract words 4+ chars
-        for keyword in keywords[:10]:  # Check top 10 keywords
+        for keyword in description_keywords:
             if keyword in action_name:
                 score += 5
 
         return min(score, 100.0)  # Cap at 100
 
+    def _rank_actions(
+        self, actions: List[RemoteActionDTO], category: str, description: str, limit: int
+    ) -> Tuple[List[RemoteActionDTO], int]:
+        """
+        Score, de-duplicate and rank remote actions for an incident (pure CPU work).
+
+        Args:
+            actions (List[RemoteActionDTO]): Candidate remote actions
+            category (str): Incident category used for scoring
+            description (str): Incident short description and description
+            limit (int): Maximum number of recommendations to return
+
+        Returns:
+            Tuple[List[RemoteActionDTO], int]: Top recommendations and the unique action count
+        """
+        scored_actions = []
+        seen_action_names = set()  # Track unique action names
+
+        # Incident-side terms are the same for every action, so derive them once
+        category_lower = (category or "").lower()
+        description_lower = (description or "").lower()
+        description_keywords = tuple(
+            _DESCRIPTION_KEYWORD_RE.findall(description_lower)[:_MAX_DESCRIPTION_KEYWORDS]
+        )
+
+        for action in actions:
+            score = self._score_action_by_category(
+                action, category_lower, description_lower, description_keywords
+            )
+            if score > 0:  # Only include actions with positive scores
+                action_name = action.actionName or ""
+
+                # Only add if we haven't seen this action name before
+                if action_name and action_name not in seen_action_names:
+                    scored_actions.append((score, action))
+                    seen_action_names.add(action_name)
+                elif action_name in seen_action_names:
+                    # If duplicate, keep the one with higher score
+                    existing_idx = next(
+                        (
+                            i
+                            for i, (s, a) in enumerate(scored_actions)
+                            if a.actionName == action_name
+                        ),
+                        None,
+                    )
+                    if existing_idx is not None and score > scored_actions[existing_idx][0]:
+                        scored_actions[existing_idx] = (score, action)
+
+        # Sort by score (descending) and take top N
+        scored_actions.sort(key=lambda x: x[0], reverse=True)
+        recommendations = [action for score, action in scored_actions[:limit]]
+        return recommendations, len(scored_actions)
+
+    async def get_recommendation_candidates(self, device_name: str) -> List[RemoteActionDTO]:
+        """
+        Fetch the remote actions that recommendations are scored from.
+
+        Args:
+            device_name (str): The device name to query
+
+        Returns:
+            List[RemoteActionDTO]: Remote actions for the device over the default window
+        """
+        return await self.get_remote_actions(
+            device_name=device_name,
+            query_type="detailed",
+            days=self.settings.NEXTTHINK_DEFAULT_DAYS,
+        )
+
     async def get_recommendations_for_incident(
-        self, incident: Any, limit: int = 10  # IncidentDTO type
+        self,
+        incident: Any,  # IncidentDTO type
+        limit: int = 10,
+        candidate_actions: Optional[List[RemoteActionDTO]] = None,
     ) -> List[RemoteActionDTO]:
         """
         Get recommended remote actions for a ServiceNow incident based on category and description.
@@ -471,6 +582,8 @@ class NextThinkService:
         Args:
             incident: The ServiceNow incident (IncidentDTO)
             limit (int): Maximum number of recommendations to return
+            candidate_actions (Optional[List[RemoteActionDTO]]): Actions already fetched for
+                incident.deviceName via get_recommendation_candidates; fetched here when omitted
 
         Returns:
             List[RemoteActionDTO]: Recommended remote actions sorted by relevance
@@ -503,11 +616,10 @@ class NextThinkService:
         )
 
         # Fetch all remote actions for the device (last 7 days for better performance)
-        all_actions = await self.get_remote_actions(
-            device_name=device_name,
-            query_type="detailed",
-            days=self.settings.NEXTTHINK_DEFAULT_DAYS,
-        )
+        if candidate_actions is None:
+            all_actions = await self.get_recommendation_candidates(device_name)
+        else:
+            all_actions = candidate_actions
 
         if not all_actions:
             logger.warning("No remote actions found for device", device_name=device_name)
@@ -517,40 +629,21 @@ class NextThinkService:
         category = getattr(incident, "priority", "") or ""  # Using priority as category proxy
         description = f"{incident.shortDescription or ''} {incident.description or ''}"
 
-        scored_actions = []
-        seen_action_names = set()  # Track unique action names
-
-        for action in all_actions:
-            score = self._score_action_by_category(action, category, description)
-            if score > 0:  # Only include actions with positive scores
-                action_name = action.actionName or ""
-
-                # Only add if we haven't seen this action name before
-                if action_name and action_name not in seen_action_names:
-                    scored_actions.append((score, action))
-                    seen_action_names.add(action_name)
-                elif action_name in seen_action_names:
-                    # If duplicate, keep the one with higher score
-                    existing_idx = next(
-                        (
-                            i
-                            for i, (s, a) in enumerate(scored_actions)
-                            if a.actionName == action_name
-                        ),
-                        None,
-                    )
-                    if existing_idx is not None and score > scored_actions[existing_idx][0]:
-                        scored_actions[existing_idx] = (score, action)
-
-        # Sort by score (descending) and take top N
-        scored_actions.sort(key=lambda x: x[0], reverse=True)
-        recommendations = [action for score, action in scored_actions[:limit]]
+        # Large action lists are scored in a worker thread so the event loop stays responsive
+        if len(all_actions) >= _SCORING_OFFLOAD_THRESHOLD:
+            recommendations, unique_actions = await asyncio.to_thread(
+                self._rank_actions, all_actions, category, description, limit
+            )
+        else:
+            recommendations, unique_actions = self._rank_actions(
+                all_actions, category, description, limit
+            )
 
         logger.info(
             "Generated recommendations",
             incident_number=incident.incidentNumber,
             total_actions=len(all_actions),
-            unique_actions=len(scored_actions),
+            unique_actions=unique_actions,
             recommendations=len(recommendations),
         )
 
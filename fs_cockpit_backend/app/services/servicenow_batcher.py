@@ -0,0 +1,202 @@
+"""
+Micro-batching of ServiceNow table reads.
+
+ServiceNow's Batch API (`/api/now/v1/batch`) accepts several REST sub-requests in
+one HTTP transaction. `ServiceNowBatcher` queues GET requests submitted by the
+service layer, waits a few milliseconds for others to arrive, then ships them
+together and hands each caller its own decoded response.
+"""
+
+import asyncio
+import base64
+import uuid
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+import orjson
+import structlog
+
+from app.clients.servicenow_client import ServiceNowClient
+from app.config.settings import get_settings
+from app.exceptions.custom_exceptions import ExternalServiceError
+
+logger = structlog.get_logger(__name__)
+
+# Headers sent with every batched sub-request
+_SUBREQUEST_HEADERS = [
+    {"name": "Accept", "value": "application/json"},
+    {"name": "Content-Type", "value": "application/json"},
+]
+
+_PendingRequest = Tuple[str, asyncio.Future]
+
+
+class ServiceNowBatcher:
+    """Coalesces concurrent ServiceNow GET requests into Batch API calls."""
+
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        window_seconds: float = 0.01,
+        max_batch_size: int = 20,
+    ):
+        self.base_url = base_url
+        self.username = username
+        self.password = password
+        self.window_seconds = window_seconds
+        self.max_batch_size = max_batch_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._in_flight: set[asyncio.Task] = set()
+
+    @property
+    def running(self) -> bool:
+        """Whether the background worker is accepting requests."""
+        return self._worker is not None and not self._worker.done()
+
+    def start(self) -> None:
+        """Start the background worker on the running event loop."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+        logger.info(
+            "ServiceNow batcher started",
+            window_ms=int(self.window_seconds * 1000),
+            max_batch_size=self.max_batch_size,
+        )
+
+    async def stop(self) -> None:
+        """Stop the worker and fail any requests that were never sent."""
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(
+                    ExternalServiceError(
+                        service="ServiceNow", status_code=503, message="Batcher stopped"
+                    )
+                )
+
+    async def submit(self, endpoint: str, params: Optional[Dict[str, str]] = None) -> Dict:
+        """
+        Queue a GET request and wait for its response from the next batch.
+
+        Args:
+            endpoint (str): API path, e.g. `/api/now/table/sys_journal_field`.
+            params (dict, optional): Query parameters for the request.
+
+        Returns:
+            dict: Decoded JSON body of the sub-request.
+
+        Raises:
+            ExternalServiceError: If the batch call or the sub-request failed.
+        """
+        if not self.running:
+            raise RuntimeError("ServiceNowBatcher is not running")
+        url = f"{endpoint}?{urlencode(params)}" if params else endpoint
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((url, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Drain the queue into batches of up to `max_batch_size` or one time window."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[_PendingRequest] = [await self._queue.get()]
+            deadline = loop.time() + self.window_seconds
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            # Dispatch without blocking the next window from filling up
+            task = asyncio.create_task(self._dispatch(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _dispatch(self, batch: List[_PendingRequest]) -> None:
+        """Send one Batch API call and resolve each pending future from its envelope."""
+        futures = {str(index): future for index, (_, future) in enumerate(batch)}
+        rest_requests = [
+            {
+                "id": str(index),
+                "url": url,
+                "method": "GET",
+                "headers": _SUBREQUEST_HEADERS,
+                "exclude_response_headers": True,
+            }
+            for index, (url, _) in enumerate(batch)
+        ]
+
+        try:
+            async with ServiceNowClient(self.base_url, self.username, self.password) as client:
+                response = await client.execute_batch(uuid.uuid4().hex, rest_requests)
+        except Exception as e:  # noqa: BLE001
+            logger.warning("ServiceNow batch request failed", size=len(batch), error=str(e))
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for envelope in response.get("serviced_requests", []):
+            future = futures.pop(str(envelope.get("id")), None)
+            if future is None or future.done():
+                continue
+            try:
+                future.set_result(self._decode_envelope(envelope))
+            except ExternalServiceError as e:
+                future.set_exception(e)
+
+        # Anything ServiceNow did not service (e.g. batch time limit) is reported as failed
+        for future in futures.values():
+            if not future.done():
+                future.set_exception(
+                    ExternalServiceError(
+                        service="ServiceNow",
+                        status_code=503,
+                        message="Request was not serviced by the Batch API",
+                    )
+                )
+
+    @staticmethod
+    def _decode_envelope(envelope: Dict[str, Any]) -> Dict:
+        """Decode a Batch API response envelope into the sub-request's JSON body."""
+        status_code = int(envelope.get("status_code") or 0)
+        body = base64.b64decode(envelope.get("body") or "")
+        if status_code >= 400:
+            raise ExternalServiceError(
+                service="ServiceNow",
+                status_code=status_code,
+                message=body.decode("utf-8", errors="replace")
+                or envelope.get("status_text", ""),
+            )
+        return orjson.loads(body) if body else {}
+
+
+@lru_cache
+def get_servicenow_batcher() -> ServiceNowBatcher:
+    """Return the process-wide ServiceNow batcher."""
+    settings = get_settings()
+    return ServiceNowBatcher(
+        settings.SERVICENOW_INSTANCE_URL,
+        settings.SERVICENOW_USERNAME,
+        settings.SERVICENOW_PASSWORD,
+        window_seconds=settings.SERVICENOW_BATCH_WINDOW_MS / 1000,
+        max_batch_size=settings.SERVICENOW_BATCH_MAX_SIZE,
+    )
@@ -3,11 +3,15 @@ ServiceNow Service Module
 This module provides functionalities to interact with the ServiceNow platform.
 """
 
+import asyncio
+import hashlib
 from typing import List, Optional
 
+import httpx
 import structlog
 
 from app.cache.memory_cache import get_cache
+from app.cache.singleflight import singleflight
 from app.clients.google_ai_client import get_google_ai_client
 from app.clients.servicenow_client import ServiceNowClient
 from app.config.settings import get_settings
@@ -20,6 +24,7 @@ from app.exceptions.custom_exceptions import ExternalServiceError
 from app.schemas.computer import ComputerDTO
 from app.schemas.incident import IncidentDTO
 from app.schemas.knowledge import KnowledgeArticleDTO
+from app.services.servicenow_batcher import get_servicenow_batcher
 from app.utils.incident_utils import IncidentUtils
 
 # logging configuration
@@ -54,6 +59,7 @@ class ServiceNowService:
 
         return result
 
+    @singleflight(lambda self, username: username)
     async def fetch_user_sys_id_by_username(self, username: str) -> str:
         """
         Fetches the ServiceNow `sys_id` for a user given their username.
@@ -85,13 +91,34 @@ class ServiceNowService:
 
         return sys_id
 
+    @staticmethod
+    def _paginate(
+        dtos: List[IncidentDTO], limit: int, offset: int, after: tuple[str, str] | None
+    ) -> tuple[List[IncidentDTO], int, int]:
+        """
+        Slice one page out of a full, newest-first incident list.
+
+        Args:
+            dtos (List[IncidentDTO]): Full incident list
+            limit (int): Page size
+            offset (int): Number of incidents to skip (ignored when `after` is given)
+            after (tuple[str, str] | None): Decoded cursor of the previous page's last incident
+
+        Returns:
+            tuple: (page of IncidentDTO objects, total count of all incidents, page offset)
+        """
+        if after is not None:
+            offset = IncidentUtils.offset_after(dtos, after)
+        return dtos[offset : offset + limit], len(dtos), offset
+
     async def fetch_incidents_by_technician(
         self,
         technician_username: str,
         cmdb_ci_name: str | None = None,
         limit: int = 25,
         offset: int = 0,
-    ) -> tuple[List[IncidentDTO], int]:
+        after: tuple[str, str] | None = None,
+    ) -> tuple[List[IncidentDTO], int, int]:
         """
         Retrieve incidents assigned to a specific technician with pagination.
         Cached for 5 minutes since incident lists change frequently.
@@ -102,9 +129,11 @@ class ServiceNowService:
             cmdb_ci_name (str | None): Optional device/CMDB CI name filter.
             limit (int): Maximum number of incidents to return (default 25, max 300).
             offset (int): Number of incidents to skip for pagination (default 0).
+            after (tuple[str, str] | None): Decoded cursor; when given, the page starts
+                after that incident and `offset` is ignored.
 
         Returns:
-            tuple: (List of IncidentDTO objects, total count of all incidents)
+            tuple: (List of IncidentDTO objects, total count of all incidents, page offset)
         """
         # Validate pagination params
         limit = min(limit, 300)  # Cap at 300 to prevent excessive API calls
@@ -121,9 +150,7 @@ class ServiceNowService:
                     "Cache hit for incidents by technician", username=technician_username
                 )
                 # Paginate cached results
-                total = len(cached_incidents)
-                paginated = cached_incidents[offset : offset + limit]
-                return paginated, total
+                return self._paginate(cached_incidents, limit, offset, after)
 
         logger.debug("Connecting to ServiceNow", instance_url=self.base_url)
 
@@ -170,21 +197,28 @@ class ServiceNowService:
         if self.cache:
             cache_key = f"sn:incidents_by_tech:{technician_username}:{device_key}:full"
             self.cache.set(cache_key, dtos, ttl_seconds=self.settings.CACHE_TTL_INCIDENT)
+            # The list query returns the same fields as the details query, so opening an
+            # incident from the list can be served from cache
+            self.cache.many_set(
+                {f"sn:incident_details:{dto.incidentNumber}": dto for dto in dtos},
+                ttl_seconds=self.settings.CACHE_TTL_INCIDENT,
+            )
             logger.debug(
                 "Cached incidents by technician", username=technician_username, count=len(dtos)
             )
 
         # Paginate results
-        total = len(dtos)
-        paginated = dtos[offset : offset + limit]
-        return paginated, total
+        return self._paginate(dtos, limit, offset, after)
 
     # Extract string fields using the shared utility
 
+    @singleflight(lambda self, cmdb_ci_value: cmdb_ci_value)
     async def resolve_device_name(self, cmdb_ci_value: str) -> str | None:
         """
         Resolve device name from cmdb_ci value (could be sys_id or name).
         Cached for 15 minutes since device info is relatively stable.
+        Misses are cached for CACHE_TTL_NEGATIVE and concurrent lookups are coalesced;
+        failed lookups are not cached.
 
         Args:
             cmdb_ci_value: Either a sys_id or device name
@@ -195,20 +229,27 @@ class ServiceNowService:
         if not cmdb_ci_value:
             return None
 
-        # Check cache first
+        # Check cache first ("" marks a sys_id that matched no computer)
         if self.cache:
             cache_key = f"sn:device_name:{cmdb_ci_value}"
             cached_name = self.cache.get(cache_key)
             if cached_name is not None:
                 logger.debug("Cache hit for device name", cmdb_ci=cmdb_ci_value)
-                return cached_name
+                return cached_name or None
 
         # If it looks like a sys_id (32 hex chars), fetch the computer name
         if len(cmdb_ci_value) == 32 and all(c in "0123456789abcdef" for c in cmdb_ci_value.lower()):
             async with ServiceNowClient(
                 self.base_url, self.sn_username, self.sn_password
             ) as client:
-                computer = await client.fetch_computer_by_sys_id(cmdb_ci_value)
+                try:
+                    computer = await client.fetch_computer_by_sys_id(cmdb_ci_value)
+                except httpx.HTTPError as e:
+                    # A failed lookup is not a miss; caching it would hide the device
+                    logger.warning(
+                        "Could not resolve device name", cmdb_ci=cmdb_ci_value, error=str(e)
+                    )
+                    return None
                 if computer:
                     device_name = IncidentUtils.extract_str(
                         computer.get("name")
@@ -222,15 +263,20 @@ class ServiceNowService:
                         logger.debug("Cached device name", cmdb_ci=cmdb_ci_value)
 
                     return device_name
+
+            if self.cache:
+                self.cache.set(cache_key, "", ttl_seconds=self.settings.CACHE_TTL_NEGATIVE)
             return None
 
         # Otherwise, assume it's already a device name
         return cmdb_ci_value
 
+    @singleflight(lambda self, caller_sys_id: caller_sys_id)
     async def get_device_name_from_caller(self, caller_sys_id: str) -> str | None:
         """
         Get device name from caller by fetching user's devices from ServiceNow.
         Cached for 15 minutes since device assignments are relatively stable.
+        Misses are cached for CACHE_TTL_NEGATIVE and concurrent lookups are coalesced.
 
         Args:
             caller_sys_id: The sys_id of the caller from incident
@@ -241,13 +287,13 @@ class ServiceNowService:
         if not caller_sys_id:
             return None
 
-        # Check cache first
+        # Check cache first ("" marks a caller with no assigned devices)
         if self.cache:
             cache_key = f"sn:device_name_from_caller:{caller_sys_id}"
             cached_device_name = self.cache.get(cache_key)
             if cached_device_name is not None:
                 logger.debug("Cache hit for device name from caller", caller_sys_id=caller_sys_id)
-                return cached_device_name
+                return cached_device_name or None
 
         logger.info("Fetching devices from ServiceNow for caller", caller_sys_id=caller_sys_id)
 
@@ -256,6 +302,8 @@ class ServiceNowService:
 
         if not devices:
             logger.warning("No devices found for caller", caller_sys_id=caller_sys_id)
+            if self.cache:
+                self.cache.set(cache_key, "", ttl_seconds=self.settings.CACHE_TTL_NEGATIVE)
             return None
 
         # Return the first device's name
@@ -320,8 +368,12 @@ class ServiceNowService:
         )
 
     async def fetch_incidents_by_user(
-        self, user_name: str, limit: int = 25, offset: int = 0
-    ) -> tuple[List[IncidentDTO], int]:
+        self,
+        user_name: str,
+        limit: int = 25,
+        offset: int = 0,
+        after: tuple[str, str] | None = None,
+    ) -> tuple[List[IncidentDTO], int, int]:
         """
         Retrieves incidents raised by the specified user with pagination.
         Cached for 5 minutes since incident lists change frequently.
@@ -330,9 +382,11 @@ class ServiceNowService:
             user_name (str): The name/username of the user.
             limit (int): Maximum number of incidents to return (default 25, max 300).
             offset (int): Number of incidents to skip for pagination (default 0).
+            after (tuple[str, str] | None): Decoded cursor; when given, the page starts
+                after that incident and `offset` is ignored.
 
         Returns:
-            tuple: (List of IncidentDTO objects, total count of all incidents)
+            tuple: (List of IncidentDTO objects, total count of all incidents, page offset)
         """
         # Validate pagination params
         limit = min(limit, 300)  # Cap at 300 to prevent excessive API calls
@@ -346,9 +400,7 @@ class ServiceNowService:
             if cached_incidents is not None:
                 logger.debug("Cache hit for incidents by user", user_name=user_name)
                 # Paginate cached results
-                total = len(cached_incidents)
-                paginated = cached_incidents[offset : offset + limit]
-                return paginated, total
+                return self._paginate(cached_incidents, limit, offset, after)
 
         logger.debug("Connecting to ServiceNow", instance_url=self.base_url)
 
@@ -367,13 +419,20 @@ class ServiceNowService:
             logger.debug("Cached incidents by user", user_name=user_name, count=len(dtos))
 
         # Paginate results
-        total = len(dtos)
-        paginated = dtos[offset : offset + limit]
-        return paginated, total
+        return self._paginate(dtos, limit, offset, after)
 
+    @singleflight(
+        lambda self, device_name, limit=25, offset=0, after=None: (
+            f"{device_name}:{limit}:{offset}:{after}"
+        )
+    )
     async def fetch_incidents_by_device(
-        self, device_name: str, limit: int = 25, offset: int = 0
-    ) -> tuple[List[IncidentDTO], int]:
+        self,
+        device_name: str,
+        limit: int = 25,
+        offset: int = 0,
+        after: tuple[str, str] | None = None,
+    ) -> tuple[List[IncidentDTO], int, int]:
         """
         Retrieve incidents related to a specific device with pagination.
         Cached for 5 minutes since incident lists change frequently.
@@ -382,9 +441,11 @@ class ServiceNowService:
             device_name (str): The name of the device.
             limit (int): Maximum number of incidents to return (default 25, max 300).
             offset (int): Number of incidents to skip for pagination (default 0).
+            after (tuple[str, str] | None): Decoded cursor; when given, the page starts
+                after that incident and `offset` is ignored.
 
         Returns:
-            tuple: (List of IncidentDTO objects, total count of all incidents)
+            tuple: (List of IncidentDTO objects, total count of all incidents, page offset)
         """
         # Validate pagination params
         limit = min(limit, 300)
@@ -398,9 +459,7 @@ class ServiceNowService:
             if cached_incidents is not None:
                 logger.debug("Cache hit for incidents by device", device_name=device_name)
                 # Paginate cached results
-                total = len(cached_incidents)
-                paginated = cached_incidents[offset : offset + limit]
-                return paginated, total
+                return self._paginate(cached_incidents, limit, offset, after)
 
         logger.debug("Connecting to ServiceNow", instance_url=self.base_url)
 
@@ -419,10 +478,9 @@ class ServiceNowService:
             logger.debug("Cached incidents by device", device_name=device_name, count=len(dtos))
 
         # Paginate results
-        total = len(dtos)
-        paginated = dtos[offset : offset + limit]
-        return paginated, total
+        return self._paginate(dtos, limit, offset, after)
 
+    @singleflight(lambda self, incident_number: incident_number)
     async def fetch_incident_details(self, incident_number: str) -> Optional[IncidentDTO]:
         """
         Retrieve details of a specific incident.
@@ -460,6 +518,11 @@ class ServiceNowService:
 
         return incident_dto
 
+    @singleflight(
+        lambda self, incident_number, incident_sys_id=None, limit=100, offset=0: (
+            f"{incident_number}:{limit}:{offset}"
+        )
+    )
     async def fetch_incident_comments(
         self,
         incident_number: str,
@@ -529,12 +592,19 @@ class ServiceNowService:
 
         try:
             # Fetch raw comments from ServiceNow API
-            async with ServiceNowClient(
-                self.base_url, self.sn_username, self.sn_password
-            ) as client:
-                raw_response = await client.fetch_incident_comments(
-                    incident_sys_id=incident_sys_id, limit=limit, offset=offset
+            batcher = get_servicenow_batcher()
+            if batcher.running:
+                # Shares one Batch API round trip with concurrent lookups (e.g. /logs)
+                raw_response = await batcher.submit(
+                    *ServiceNowClient.incident_comments_request(incident_sys_id, limit, offset)
                 )
+            else:
+                async with ServiceNowClient(
+                    self.base_url, self.sn_username, self.sn_password
+                ) as client:
+                    raw_response = await client.fetch_incident_comments(
+                        incident_sys_id=incident_sys_id, limit=limit, offset=offset
+                    )
         except ExternalServiceError as e:
             # ServiceNow API errors (4xx/5xx) are wrapped in ExternalServiceError
             logger.error(
@@ -633,6 +703,11 @@ class ServiceNowService:
 
         return result
 
+    @singleflight(
+        lambda self, incident_number, incident_sys_id=None, limit=100, offset=0: (
+            f"{incident_number}:{limit}:{offset}"
+        )
+    )
     async def fetch_incident_activity_logs(
         self,
         incident_number: str,
@@ -707,12 +782,19 @@ class ServiceNowService:
 
         try:
             # Fetch raw activity logs from ServiceNow API
-            async with ServiceNowClient(
-                self.base_url, self.sn_username, self.sn_password
-            ) as client:
-                raw_response = await client.fetch_incident_activity_logs(
-                    incident_sys_id=incident_sys_id, limit=limit, offset=offset
+            batcher = get_servicenow_batcher()
+            if batcher.running:
+                # Shares one Batch API round trip with concurrent lookups (e.g. /logs)
+                raw_response = await batcher.submit(
+                    *ServiceNowClient.incident_activity_logs_request(incident_sys_id, limit, offset)
                 )
+            else:
+                async with ServiceNowClient(
+                    self.base_url, self.sn_username, self.sn_password
+                ) as client:
+                    raw_response = await client.fetch_incident_activity_logs(
+                        incident_sys_id=incident_sys_id, limit=limit, offset=offset
+                    )
         except ExternalServiceError as e:
             # ServiceNow API errors (4xx/5xx) are wrapped in ExternalServiceError
             logger.error(
@@ -834,6 +916,7 @@ class ServiceNowService:
             assignedToName=assigned_to_name,
         )
 
+    @singleflight(lambda self, user_sys_id: user_sys_id)
     async def fetch_devices_by_user(self, user_sys_id: str) -> List[ComputerDTO]:
         """
         Retrieves devices (computers) assigned to a specific user.
@@ -937,6 +1020,15 @@ class ServiceNowService:
                 publishedDate=IncidentUtils.extract_str(rec.get("published")),
             )
 
+    @staticmethod
+    def _knowledge_cache_key(query: str, limit: int, use_search_api: bool) -> str:
+        """Build the knowledge search cache key, hashing free-text queries to a fixed length."""
+        query_hash = hashlib.sha1(query.encode("utf-8"), usedforsecurity=False).hexdigest()
+        return f"sn:knowledge:{query_hash}:{limit}:{use_search_api}"
+
+    @singleflight(
+        lambda self, query, limit=5, use_search_api=False: f"{query}:{limit}:{use_search_api}"
+    )
     async def search_knowledge_articles(
         self,
         query: str,
@@ -961,7 +1053,7 @@ class ServiceNowService:
         if self.cache:
             # Use CACHE_TTL_KNOWLEDGE if available, otherwise 900 seconds (15 minutes)
             cache_ttl = getattr(self.settings, "CACHE_TTL_KNOWLEDGE", 900)
-            cache_key = f"sn:knowledge:{query}:{limit}:{use_search_api}"
+            cache_key = self._knowledge_cache_key(query, limit, use_search_api)
             cached_articles = self.cache.get(cache_key)
             if cached_articles is not None:
                 logger.debug("Cache hit for knowledge articles", query=query[:50])
@@ -1053,7 +1145,7 @@ class ServiceNowService:
                 # Cache the result
                 if self.cache:
                     cache_ttl = getattr(self.settings, "CACHE_TTL_KNOWLEDGE", 900)
-                    cache_key = f"sn:knowledge:{query}:{limit}:{use_search_api}"
+                    cache_key = self._knowledge_cache_key(query, limit, use_search_api)
                     self.cache.set(cache_key, filtered_articles, ttl_seconds=cache_ttl)
                     logger.debug(
                         "Cached knowledge articles", query=query[:50], count=len(filtered_articles)
@@ -1061,6 +1153,7 @@ class ServiceNowService:
 
                 return filtered_articles
 
+    @singleflight(lambda self, incident_number, limit=5: f"{incident_number}:{limit}")
     async def search_knowledge_articles_for_incident(
         self, incident_number: str, limit: int = 5
     ) -> List[KnowledgeArticleDTO]:
@@ -1117,9 +1210,13 @@ class ServiceNowService:
 
         return articles
 
+    @singleflight(
+        lambda self, article_sys_id, article_number="": article_sys_id or article_number
+    )
     async def get_kb_article_content(self, article_sys_id: str, article_number: str = "") -> str:
         """
         Fetch the full content/body of a KB article from ServiceNow.
+        Cached for 15 minutes since published articles rarely change.
 
         Args:
             article_sys_id (str): The sys_id of the KB article
@@ -1128,6 +1225,14 @@ class ServiceNowService:
         Returns:
             str: The full article content/body text
         """
+        # Check cache first ("" is a valid cached answer for an article without a body)
+        cache_key = f"sn:kb_content:{article_sys_id or article_number}"
+        if self.cache:
+            cached_content = self.cache.get(cache_key)
+            if cached_content is not None:
+                logger.debug("Cache hit for KB article content", article_sys_id=article_sys_id)
+                return cached_content
+
         logger.debug(
             "Fetching KB article content",
             article_sys_id=article_sys_id,
@@ -1173,9 +1278,12 @@ class ServiceNowService:
                             article_sys_id=article_sys_id,
                             content_length=len(str(content)),
                         )
-                        return str(content)
+                        content = str(content)
+                        self._cache_kb_content(cache_key, content)
+                        return content
 
                 logger.debug("No content found for KB article", article_sys_id=article_sys_id)
+                self._cache_kb_content(cache_key, "")
                 return ""
         except (KeyError, ValueError, TypeError) as e:
             logger.warning(
@@ -1186,6 +1294,12 @@ class ServiceNowService:
                 return f"Reference Article: {article_number}"
             return ""
 
+    def _cache_kb_content(self, cache_key: str, content: str) -> None:
+        """Cache a fetched KB article body (errors are not cached so they can be retried)."""
+        if self.cache:
+            cache_ttl = getattr(self.settings, "CACHE_TTL_KNOWLEDGE", 900)
+            self.cache.set(cache_key, content, ttl_seconds=cache_ttl)
+
     def _extract_summary_points_from_content(self, content: str, min_points: int = 5) -> List[str]:
         """
         Extract summary points from KB article content by parsing sentences and formatting.
@@ -1224,6 +1338,7 @@ class ServiceNowService:
 
         return points if points else [content[:200] + "..."]
 
+    @singleflight(lambda self, incident_number, limit=3: f"{incident_number}:{limit}")
     async def get_solution_summary_for_incident(self, incident_number: str, limit: int = 3) -> dict:
         """
         Get a summary of solution points from KB articles for a specific incident.
@@ -1257,9 +1372,15 @@ class ServiceNowService:
                 summary_points = []
                 articles_with_content = 0
 
-                for article in articles:
-                    content = await self.get_kb_article_content(article.sysId, article.number)
+                # Article bodies are independent lookups, so fetch them concurrently
+                contents = await asyncio.gather(
+                    *(
+                        self.get_kb_article_content(article.sysId, article.number)
+                        for article in articles
+                    )
+                )
 
+                for article, content in zip(articles, contents):
                     if content and len(content) > 20:
                         extracted_points = self._extract_summary_points_from_content(
                             content, min_points=5
@@ -0,0 +1,123 @@
+"""
+HTTP caching helpers
+
+ETag generation and conditional-request (If-None-Match) handling for endpoints
+that serve static, snapshotted or slowly changing payloads.
+"""
+
+import hashlib
+from typing import Any, Optional
+
+import orjson
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+def compute_etag(body: bytes) -> str:
+    """
+    Build a weak ETag for a serialized payload.
+
+    The ETag is weak because ResponseWrapperMiddleware adds a timestamp and request_id
+    around the payload, so only the wrapped data is guaranteed to be identical.
+
+    Args:
+        body: Serialized payload bytes
+
+    Returns:
+        str: Quoted weak ETag value (e.g. W/"3f2a...")
+    """
+    return f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether the request's If-None-Match header matches an ETag (weak comparison).
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+
+    Returns:
+        bool: True if the client already holds this representation
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque_tag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def not_modified(etag: str, cache_control: Optional[str] = None) -> Response:
+    """
+    Build an empty 304 Not Modified response carrying the validator headers.
+
+    Args:
+        etag: Current ETag of the resource
+        cache_control: Optional Cache-Control value to repeat on the 304
+
+    Returns:
+        Response: 304 response with no body
+    """
+    headers = {"ETag": etag}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    return Response(status_code=304, headers=headers)
+
+
+def conditional_json_response(
+    request: Request,
+    content: Any,
+    cache_control: Optional[str] = None,
+    vary: Optional[str] = None,
+) -> Response:
+    """
+    Serialize a payload and answer with 304 if the client already holds it.
+
+    Args:
+        request: Incoming request (If-None-Match is read from it)
+        content: JSON-serializable payload
+        cache_control: Optional Cache-Control value for the 200 and 304 responses
+        vary: Optional Vary value, needed when shared caches may store the response
+
+    Returns:
+        Response: 304 Not Modified, or the JSON body with ETag/Cache-Control headers
+    """
+    return conditional_body_response(request, orjson.dumps(content), cache_control, vary)
+
+
+def conditional_body_response(
+    request: Request,
+    body: bytes,
+    cache_control: Optional[str] = None,
+    vary: Optional[str] = None,
+) -> Response:
+    """
+    Answer with an already serialized JSON body, or 304 if the client already holds it.
+
+    Lets callers serialize Pydantic models straight to bytes (model_dump_json) instead of
+    building an intermediate dict for orjson.
+
+    Args:
+        request: Incoming request (If-None-Match is read from it)
+        body: Serialized JSON payload
+        cache_control: Optional Cache-Control value for the 200 and 304 responses
+        vary: Optional Vary value, needed when shared caches may store the response
+
+    Returns:
+        Response: 304 Not Modified, or the JSON body with ETag/Cache-Control headers
+    """
+    etag = compute_etag(body)
+    headers = {"ETag": etag}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    if vary:
+        headers["Vary"] = vary
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
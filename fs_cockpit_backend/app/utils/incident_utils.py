@@ -1,3 +1,5 @@
+import base64
+import binascii
 from datetime import datetime
 from typing import List, Optional
 
@@ -7,7 +9,8 @@ from app.schemas.incident import IncidentDTO
 class IncidentUtils:
     """Utility helpers for operations on IncidentDTO objects.
 
-    Includes string extraction, parsing of openedAt timestamps, and sorting dtos.
+    Includes string extraction, parsing of openedAt timestamps, sorting dtos and
+    cursor pagination over newest-first incident lists.
     """
 
     @staticmethod
@@ -68,3 +71,53 @@ class IncidentUtils:
             )
         except (ValueError, TypeError):
             return dtos
+
+    @staticmethod
+    def encode_cursor(dto: IncidentDTO) -> str:
+        """Build an opaque pagination cursor pointing just after ``dto``."""
+        raw = f"{dto.sysId}|{dto.openedAt or ''}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[str, str]:
+        """Decode a cursor built by encode_cursor.
+
+        Returns:
+            tuple: (sys_id, openedAt) of the last incident on the previous page
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        except (binascii.Error, UnicodeDecodeError) as e:
+            raise ValueError("Invalid pagination cursor") from e
+        sys_id, sep, opened_at = raw.partition("|")
+        if not sep or not sys_id:
+            raise ValueError("Invalid pagination cursor")
+        return sys_id, opened_at
+
+    @staticmethod
+    def offset_after(dtos: List[IncidentDTO], after: tuple[str, str]) -> int:
+        """Index of the first incident after the cursor position in a newest-first list.
+
+        If the cursor's incident is no longer in the list, resumes at the first incident
+        opened before it, so pages stay stable while new incidents arrive at the top.
+        """
+        sys_id, opened_at = after
+        for index, dto in enumerate(dtos):
+            if dto.sysId == sys_id:
+                return index + 1
+
+        anchor = IncidentUtils.parse_opened_at(opened_at)
+        try:
+            return next(
+                (
+                    index
+                    for index, dto in enumerate(dtos)
+                    if IncidentUtils.parse_opened_at(dto.openedAt) < anchor
+                ),
+                len(dtos),
+            )
+        except TypeError:  # naive vs aware timestamps
+            return len(dtos)
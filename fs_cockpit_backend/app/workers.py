@@ -0,0 +1,19 @@
+"""
+Gunicorn worker classes for serving the ASGI app.
+
+uvicorn's default worker picks its event loop and HTTP parser automatically and
+silently falls back to asyncio and h11 when the C extensions are missing. This
+worker requires uvloop and httptools (both installed by uvicorn[standard]) so a
+broken image fails at boot instead of running on the slower implementations.
+
+Usage:
+    gunicorn app.main:app -k app.workers.UvloopUvicornWorker -w 4 -b 0.0.0.0:8000
+"""
+
+from uvicorn.workers import UvicornWorker
+
+
+class UvloopUvicornWorker(UvicornWorker):
+    """UvicornWorker pinned to the uvloop event loop and the httptools HTTP parser."""
+
+    CONFIG_KWARGS = {**UvicornWorker.CONFIG_KWARGS, "loop": "uvloop", "http": "httptools"}
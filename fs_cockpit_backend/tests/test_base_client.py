@@ -0,0 +1,150 @@
+import ast
+import asyncio
+import inspect
+
+import httpx
+import pytest
+
+from app.clients import base_client
+from app.clients.base_client import BaseClient
+from app.exceptions.custom_exceptions import ServiceConnectionError
+
+
+def test_base_client_is_defined_once_with_shared_pool():
+    # A second class definition would silently shadow the pooled client
+    tree = ast.parse(inspect.getsource(base_client))
+    definitions = [
+        node.name
+        for node in tree.body
+        if isinstance(node, ast.ClassDef) and node.name == "BaseClient"
+    ]
+    assert definitions == ["BaseClient"]
+    assert callable(BaseClient._get_shared_client)
+
+
+def test_misspelled_module_is_an_alias_of_base_client():
+    with pytest.deprecated_call():
+        from app.clients import base_cleint
+
+    # One module object means one shared pool, whichever name callers import
+    assert base_cleint is base_client
+
+
+def test_request_retries_up_to_max_retries(monkeypatch):
+    calls = []
+
+    async def failing_request(self, method, url, **kwargs):
+        calls.append(url)
+        raise httpx.ConnectError("refused")
+
+    monkeypatch.setattr(httpx.AsyncClient, "request", failing_request)
+    client = BaseClient("https://api.example.com", max_retries=2, retry_backoff=0)
+
+    async def run():
+        async with client:
+            await client.get("/ping")
+
+    with pytest.raises(ServiceConnectionError):
+        asyncio.run(run())
+    assert calls == ["https://api.example.com/ping"] * 2
+
+
+def test_http_error_responses_are_not_retried(monkeypatch):
+    calls = []
+
+    async def not_found(self, method, url, **kwargs):
+        calls.append(url)
+        return httpx.Response(404, request=httpx.Request(method, url))
+
+    monkeypatch.setattr(httpx.AsyncClient, "request", not_found)
+
+    async def run():
+        async with BaseClient("https://api.example.com", retry_backoff=0) as client:
+            await client.get("/missing")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(run())
+    assert len(calls) == 1
+
+
+def test_pool_wide_concurrency_cap(monkeypatch):
+    in_flight = 0
+    peak = 0
+
+    async def slow_request(self, method, url, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={}, request=httpx.Request(method, url))
+
+    monkeypatch.setattr(httpx.AsyncClient, "request", slow_request)
+    client = BaseClient("https://api.example.com")
+    monkeypatch.setattr(client.settings, "HTTP_MAX_CONCURRENCY", 2)
+
+    async def run():
+        async with client:
+            await asyncio.gather(*(client.get("/ping") for _ in range(6)))
+
+    asyncio.run(run())
+    assert peak == 2
+
+
+def test_custom_limits_use_a_per_host_pool():
+    limits = httpx.Limits(max_connections=5, max_keepalive_connections=2, keepalive_expiry=60.0)
+
+    async def run():
+        async with BaseClient("https://api.example.com", limits=limits) as first:
+            async with BaseClient("https://api.example.com/v2", limits=limits) as second:
+                async with BaseClient("https://api.example.com") as shared:
+                    pools = first.client, second.client, shared.client
+        await BaseClient.close_shared_client()
+        return pools
+
+    first, second, shared = asyncio.run(run())
+    assert first is second
+    assert first is not shared
+    assert first.is_closed
+    assert BaseClient._host_clients == {}
+
+
+def test_get_decodes_json_and_get_raw_returns_the_response(monkeypatch):
+    async def fake_request(self, method, url, **kwargs):
+        return httpx.Response(
+            200, content=b'{"result": [1, 2]}', request=httpx.Request(method, url)
+        )
+
+    monkeypatch.setattr(httpx.AsyncClient, "request", fake_request)
+
+    async def run():
+        async with BaseClient("https://api.example.com") as client:
+            return await client.get("/items"), await client.get_raw("/items")
+
+    decoded, raw = asyncio.run(run())
+    assert decoded == {"result": [1, 2]}
+    assert isinstance(raw, httpx.Response)
+    assert raw.content == b'{"result": [1, 2]}'
+
+
+def test_auth_headers_are_sent_and_merged_with_per_request_headers(monkeypatch):
+    sent = []
+
+    async def fake_request(self, method, url, **kwargs):
+        sent.append(kwargs.get("headers"))
+        return httpx.Response(200, json={}, request=httpx.Request(method, url))
+
+    monkeypatch.setattr(httpx.AsyncClient, "request", fake_request)
+    client = BaseClient("https://api.example.com")
+    client.auth_headers = {"Authorization": "Bearer abc"}
+
+    async def run():
+        async with client:
+            await client.get("/items")
+            await client.get("/items", headers={"Accept": "text/csv"})
+
+    asyncio.run(run())
+    assert sent[0] is client._headers
+    assert sent[1]["Authorization"] == "Bearer abc"
+    assert sent[1]["Accept"] == "text/csv"
+    assert "Accept" not in client._headers
@@ -0,0 +1,158 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.cache.memory_cache import reset_cache
+from app.clients.google_ai_client import GoogleAIClient
+from app.exceptions.custom_exceptions import ServiceTimeoutError
+
+
+class _SlowModel:
+    async def generate_content_async(self, prompt, **kwargs):
+        await asyncio.sleep(10)
+
+
+def test_generation_times_out_without_blocking_the_loop(monkeypatch):
+    client = GoogleAIClient()
+    client.model = _SlowModel()
+    monkeypatch.setattr(client.settings, "GOOGLE_AI_TIMEOUT_SECONDS", 0.05)
+    ticks = []
+
+    async def heartbeat():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0.01)
+
+    async def run():
+        beat = asyncio.create_task(heartbeat())
+        try:
+            await client.generate_solution_points("Outlook crashes on startup")
+        finally:
+            beat.cancel()
+
+    with pytest.raises(ServiceTimeoutError):
+        asyncio.run(run())
+    assert len(ticks) > 1
+
+
+def test_parse_solution_response_strips_list_formatting():
+    client = GoogleAIClient.__new__(GoogleAIClient)
+    text = (
+        "Here are 5 steps:\n"
+        "1. Restart the laptop and reconnect the VPN.\n"
+        "2) **Verify** the adapter in Device Manager.\n"
+        "- Your credentials must be re-entered in Outlook.\n"
+        "* Run ipconfig /flushdns from an elevated prompt.\n"
+        "**5.** Check Event Viewer for application errors.\n"
+        "short\n"
+    )
+
+    assert client._parse_solution_response(text) == [
+        "Restart the laptop and reconnect the VPN.",
+        "Verify the adapter in Device Manager.",
+        "credentials must be re-entered in Outlook.",
+        "Run ipconfig /flushdns from an elevated prompt.",
+        "Check Event Viewer for application errors.",
+    ]
+
+
+class _RecordingModel:
+    def __init__(self):
+        self.prompts = []
+
+    async def generate_content_async(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        raise RuntimeError("stop after recording the prompt")
+
+
+def test_empty_description_is_rejected_before_calling_gemini():
+    client = GoogleAIClient()
+    client.model = _RecordingModel()
+
+    with pytest.raises(ValueError):
+        asyncio.run(client.generate_solution_points("   "))
+    assert client.model.prompts == []
+
+
+def test_oversized_device_details_are_truncated():
+    client = GoogleAIClient()
+    client.model = _RecordingModel()
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(client.generate_solution_points("VPN drops", device_details="x" * 500_000))
+    assert len(client.model.prompts[0]) < 5000
+
+
+class _CountingModel:
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_content_async(self, prompt, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        part = SimpleNamespace(text="1. Restart the print spooler service.")
+        candidate = SimpleNamespace(finish_reason="STOP", content=SimpleNamespace(parts=[part]))
+        return SimpleNamespace(candidates=[candidate], text=part.text)
+
+
+def test_identical_prompts_share_one_gemini_call_and_are_cached():
+    reset_cache()
+    client = GoogleAIClient()
+    client.model = _CountingModel()
+
+    async def run():
+        first = await asyncio.gather(
+            *(client.generate_solution_points("Printer queue stuck") for _ in range(3))
+        )
+        return first, await client.generate_solution_points("Printer queue stuck")
+
+    concurrent, later = asyncio.run(run())
+
+    assert client.model.calls == 1
+    assert concurrent == [["Restart the print spooler service."]] * 3
+    assert later == ["Restart the print spooler service."]
+
+
+def test_concurrent_gemini_calls_are_capped(monkeypatch):
+    reset_cache()
+    in_flight = 0
+    peak = 0
+
+    class _SlowCountingModel(_CountingModel):
+        async def generate_content_async(self, prompt, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                return await super().generate_content_async(prompt, **kwargs)
+            finally:
+                in_flight -= 1
+
+    client = GoogleAIClient()
+    client.model = _SlowCountingModel()
+    monkeypatch.setattr(client.settings, "GOOGLE_AI_MAX_CONCURRENCY", 2)
+
+    async def run():
+        await asyncio.gather(
+            *(client.generate_solution_points(f"Printer {i} offline") for i in range(6))
+        )
+
+    asyncio.run(run())
+    assert client.model.calls == 6
+    assert peak == 2
+
+
+def test_prompts_differing_in_case_and_whitespace_share_the_cache():
+    reset_cache()
+    client = GoogleAIClient()
+    client.model = _CountingModel()
+
+    async def run():
+        await client.generate_solution_points("VPN disconnects on Win11", category="Network")
+        return await client.generate_solution_points(
+            "  vpn   disconnects on WIN11 ", category="network"
+        )
+
+    assert asyncio.run(run()) == ["Restart the print spooler service."]
+    assert client.model.calls == 1
@@ -0,0 +1,60 @@
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.utils.http_cache import conditional_body_response, conditional_json_response
+
+app = FastAPI()
+
+
+@app.get("/item")
+async def item(request: Request):
+    return conditional_json_response(request, {"id": 1}, "private, max-age=30")
+
+
+@app.get("/raw")
+async def raw(request: Request):
+    return conditional_body_response(request, b'{"id": 1}')
+
+
+client = TestClient(app)
+
+
+def test_conditional_json_response_sets_validators():
+    resp = client.get("/item")
+    assert resp.status_code == 200
+    assert resp.json() == {"id": 1}
+    assert resp.headers["etag"].startswith('W/"')
+    assert resp.headers["cache-control"] == "private, max-age=30"
+
+
+def test_conditional_json_response_returns_304_on_match():
+    etag = client.get("/item").headers["etag"]
+    resp = client.get("/item", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["etag"] == etag
+
+    resp = client.get("/item", headers={"If-None-Match": 'W/"other"'})
+    assert resp.status_code == 200
+
+
+def test_conditional_json_response_repeats_vary_on_304():
+    shared = FastAPI()
+
+    @shared.get("/kb")
+    async def kb(request: Request):
+        return conditional_json_response(request, [], "public, s-maxage=300", "Accept-Encoding")
+
+    shared_client = TestClient(shared)
+    etag = shared_client.get("/kb").headers["etag"]
+    resp = shared_client.get("/kb", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.headers["vary"] == "Accept-Encoding"
+    assert resp.headers["cache-control"] == "public, s-maxage=300"
+
+
+def test_conditional_body_response_serves_prebuilt_body():
+    resp = client.get("/raw")
+    assert resp.json() == {"id": 1}
+    assert "cache-control" not in resp.headers
+    assert client.get("/raw", headers={"If-None-Match": resp.headers["etag"]}).status_code == 304
@@ -1,4 +1,12 @@
 """Tests for Intune service."""
+import asyncio
+
+import httpx
+import orjson
+
+from app.cache.memory_cache import reset_cache
+from app.clients.base_client import BaseClient
+from app.clients.intune_client import IntuneClient
 from app.services.intune_service import IntuneService
 
 
@@ -46,3 +54,193 @@ def test_map_device_with_missing_fields():
     assert dto.deviceId == "device-456"
     assert dto.deviceName is None
     assert dto.userPrincipalName is None
+
+
+def test_token_requests_use_the_shared_pool(monkeypatch):
+    """Token refreshes reuse the shared connection pool rather than a throwaway client."""
+    clients = []
+
+    async def fake_request(self, method, url, **kwargs):
+        clients.append(self)
+        return httpx.Response(
+            200,
+            json={"access_token": "abc", "expires_in": 3600},
+            request=httpx.Request(method, url),
+        )
+
+    monkeypatch.setattr(httpx.AsyncClient, "request", fake_request)
+    monkeypatch.setattr(IntuneClient, "_token_cache", {})
+    client = IntuneClient("https://graph.example.com", "tenant", "client", "secret")
+
+    async def run():
+        token = await client._get_access_token()
+        return token, BaseClient._get_shared_client()
+
+    token, shared = asyncio.run(run())
+    assert token == "abc"
+    assert clients == [shared]
+
+
+def test_concurrent_clients_share_one_token_refresh(monkeypatch):
+    """Clients with the same credentials fetch one token between them."""
+    token_posts = []
+
+    async def fake_request(self, method, url, **kwargs):
+        token_posts.append(url)
+        await asyncio.sleep(0.01)
+        return httpx.Response(
+            200,
+            json={"access_token": "shared", "expires_in": 3600},
+            request=httpx.Request(method, url),
+        )
+
+    monkeypatch.setattr(httpx.AsyncClient, "request", fake_request)
+    monkeypatch.setattr(IntuneClient, "_token_cache", {})
+    monkeypatch.setattr(IntuneClient, "_token_locks", {})
+    clients = [
+        IntuneClient("https://graph.example.com", "tenant", "app", "secret") for _ in range(5)
+    ]
+
+    async def run():
+        return await asyncio.gather(*(client._get_access_token() for client in clients))
+
+    assert asyncio.run(run()) == ["shared"] * 5
+    assert len(token_posts) == 1
+
+
+def test_device_name_lookups_share_one_graph_batch(monkeypatch):
+    """Several device-name lookups go to Graph as one $batch call, keyed back by name."""
+    calls = []
+
+    async def fake_request(self, method, url, **kwargs):
+        calls.append((method, str(url)))
+        if "oauth2" in str(url):
+            body = {"access_token": "abc", "expires_in": 3600}
+        else:
+            assert kwargs["headers"]["Content-Type"] == "application/json"
+            subrequests = orjson.loads(kwargs["content"])["requests"]
+            body = {
+                "responses": [
+                    {"id": "0", "status": 200, "body": {"value": [{"id": "dev-a"}]}},
+                    {"id": "1", "status": 429, "body": {}},
+                ]
+            }
+            assert [r["method"] for r in subrequests] == ["GET", "GET"]
+            assert "LAPTOP-A" in subrequests[0]["url"]
+        return httpx.Response(200, json=body, request=httpx.Request(method, url))
+
+    monkeypatch.setattr(httpx.AsyncClient, "request", fake_request)
+    monkeypatch.setattr(IntuneClient, "_token_cache", {})
+
+    async def run():
+        async with IntuneClient("https://graph.example.com", "tenant", "app", "secret") as client:
+            return await client.fetch_devices_by_names(["LAPTOP-A", "LAPTOP-B"])
+
+    results = asyncio.run(run())
+    assert results == {"LAPTOP-A": {"value": [{"id": "dev-a"}]}}
+    assert [method for method, url in calls if "$batch" in url] == ["POST"]
+    assert not any("managedDevices" in url for _, url in calls)
+
+
+def test_device_lists_follow_next_link(monkeypatch):
+    """Device list lookups request large pages and follow @odata.nextLink to the end."""
+    graph_calls = []
+
+    async def fake_request(self, method, url, **kwargs):
+        url = str(url)
+        if "oauth2" in url:
+            body = {"access_token": "abc", "expires_in": 3600}
+        else:
+            graph_calls.append((url, kwargs.get("headers", {}).get("Prefer")))
+            if "skiptoken" in url:
+                body = {"value": [{"id": "dev-2"}]}
+            else:
+                body = {
+                    "value": [{"id": "dev-1"}],
+                    "@odata.nextLink": "https://graph.example.com/deviceManagement/"
+                    "managedDevices?$skiptoken=abc",
+                }
+        return httpx.Response(200, json=body, request=httpx.Request(method, url))
+
+    monkeypatch.setattr(httpx.AsyncClient, "request", fake_request)
+    monkeypatch.setattr(IntuneClient, "_token_cache", {})
+
+    async def run():
+        async with IntuneClient("https://graph.example.com", "tenant", "app", "secret") as client:
+            return await client.fetch_devices_by_user_email("user@example.com")
+
+    assert asyncio.run(run()) == {"value": [{"id": "dev-1"}, {"id": "dev-2"}]}
+    next_url = "https://graph.example.com/deviceManagement/managedDevices?$skiptoken=abc"
+    assert graph_calls[1][0] == next_url
+    assert {prefer for _, prefer in graph_calls} == {"odata.maxpagesize=999"}
+
+
+def test_filter_values_escape_single_quotes():
+    """Quotes in lookup values are doubled so the OData string literal stays intact."""
+    params = IntuneClient._device_name_params("O'Brien-PC")
+    assert params["$filter"] == "deviceName eq 'O''Brien-PC'"
+
+
+def test_next_link_outside_base_url_is_requested_as_is(monkeypatch):
+    """A nextLink on another API version is fetched directly, not joined onto base_url."""
+    graph_urls = []
+    next_url = "https://graph.microsoft.com/beta/deviceManagement/managedDevices?$skiptoken=x"
+
+    async def fake_request(self, method, url, **kwargs):
+        url = str(url)
+        if "oauth2" in url:
+            body = {"access_token": "abc", "expires_in": 3600}
+        else:
+            graph_urls.append(url)
+            assert kwargs["headers"]["Authorization"] == "Bearer abc"
+            if "skiptoken" in url:
+                body = {"value": [{"id": "dev-2"}]}
+            else:
+                body = {"value": [{"id": "dev-1"}], "@odata.nextLink": next_url}
+        return httpx.Response(200, json=body, request=httpx.Request(method, url))
+
+    monkeypatch.setattr(httpx.AsyncClient, "request", fake_request)
+    monkeypatch.setattr(IntuneClient, "_token_cache", {})
+
+    async def run():
+        async with IntuneClient(
+            "https://graph.microsoft.com/v1.0/", "tenant", "app", "secret"
+        ) as client:
+            return await client.fetch_device_by_name("LAPTOP-A")
+
+    assert asyncio.run(run()) == {"value": [{"id": "dev-1"}, {"id": "dev-2"}]}
+    assert graph_urls[1] == next_url
+
+
+def test_batch_lookup_records_sync_status_from_sub_requests(monkeypatch):
+    """Failed sub-requests are never recorded as a successful sync."""
+    reset_cache()
+    pushes = []
+    responses = [{}, {"LAPTOP-A": {"value": [{"id": "dev-a", "deviceName": "LAPTOP-A"}]}}]
+
+    async def fake_aenter(self):
+        return self
+
+    async def fake_aexit(self, exc_type, exc_val, exc_tb):
+        return None
+
+    async def fake_fetch(self, device_names):
+        return responses.pop(0)
+
+    def fake_push(self, dtos, sync_status="success", error_message=None, **log_fields):
+        pushes.append((len(dtos), sync_status, error_message))
+
+    monkeypatch.setattr(IntuneClient, "__aenter__", fake_aenter)
+    monkeypatch.setattr(IntuneClient, "__aexit__", fake_aexit)
+    monkeypatch.setattr(IntuneClient, "fetch_devices_by_names", fake_fetch)
+    monkeypatch.setattr(IntuneService, "_push_devices_to_db", fake_push)
+    service = IntuneService()
+
+    # every sub-request failed: no devices pushed and no sync record
+    assert asyncio.run(service.fetch_devices_by_names(["LAPTOP-A", "LAPTOP-B"])) == {}
+    assert pushes == []
+
+    # one of two failed: recorded as a partial sync
+    results = asyncio.run(service.fetch_devices_by_names(["LAPTOP-A", "LAPTOP-B"]))
+    assert list(results) == ["LAPTOP-A"]
+    assert pushes == [(1, "partial", "1 of 2 device lookups failed")]
@@ -0,0 +1,108 @@
+from app.cache.memory_cache import InMemoryCache
+
+
+def test_delete_pattern_scans_only_matching_prefix():
+    cache = InMemoryCache(max_size=100)
+    cache.set("nt:remote_actions:DEV1:all", 1)
+    cache.set("nt:remote_actions:DEV2:all", 2)
+    cache.set("sn:incident_details:DEV1", 3)
+    cache.set("plain-key-DEV1", 4)
+
+    assert cache.delete_pattern("nt:remote_actions:DEV1:") == 1
+    assert cache.get("nt:remote_actions:DEV2:all") == 2
+
+    # Patterns without an indexed prefix still match anywhere in the key
+    assert cache.delete_pattern("DEV1") == 2
+    assert cache.size() == 1
+    indexed = {prefix for stripe in cache._stripes for prefix in stripe.prefix_index}
+    assert indexed == {"nt", "nt:remote_actions"}
+
+
+def test_eviction_drops_least_recently_used_entry():
+    cache = InMemoryCache(max_size=2, stripes=1)
+    cache.set("sn:a", 1)
+    cache.set("sn:b", 2)
+    assert cache.get("sn:a") == 1  # "sn:b" is now the least recently used
+
+    cache.set("sn:c", 3)
+
+    assert cache.get("sn:b") is None
+    assert cache.get("sn:a") == 1
+    assert cache.get("sn:c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("app.cache.memory_cache.time.monotonic", lambda: now[0])
+    cache = InMemoryCache(max_size=10)
+    cache.set("sn:a", 1, ttl_seconds=30)
+    cache.set("sn:b", 2, ttl_seconds=90)
+
+    now[0] += 60
+
+    assert cache.get("sn:a") is None
+    assert cache.cleanup_expired() == 0  # "sn:a" was already dropped by the get
+    now[0] += 60
+    assert cache.cleanup_expired() == 1
+    assert cache.size() == 0
+
+
+def test_stats_count_hits_misses_and_sets():
+    cache = InMemoryCache(max_size=10)
+    cache.set("sn:a", 1)
+    cache.get("sn:a")
+    cache.get("sn:a")
+    cache.get("sn:missing")
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["total_sets"]) == (2, 1, 1)
+    assert stats["hit_rate_percent"] == 66.67
+
+    cache.reset_stats()
+    assert cache.stats()["total_requests"] == 0
+
+
+def test_stats_count_batch_operations():
+    cache = InMemoryCache(max_size=100, stripes=4)
+    cache.many_set({f"sn:key:{i}": i for i in range(10)})
+    cache.many_get([f"sn:key:{i}" for i in range(15)])
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["total_sets"]) == (10, 5, 10)
+
+
+def test_max_size_is_shared_between_stripes():
+    cache = InMemoryCache(max_size=40, stripes=4)
+    for i in range(200):
+        cache.set(f"sn:key:{i}", i)
+
+    assert [stripe.max_size for stripe in cache._stripes] == [10, 10, 10, 10]
+    assert cache.size() <= 40
+    assert cache.stats()["evictions"] == 200 - cache.size()
+
+
+def test_cleanup_skips_entries_refreshed_after_expiry_was_scheduled(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("app.cache.memory_cache.time.monotonic", lambda: now[0])
+    cache = InMemoryCache(max_size=10, stripes=1)
+    cache.set("sn:a", 1, ttl_seconds=30)
+    cache.set("sn:b", 2, ttl_seconds=30)
+    cache.set("sn:a", 3, ttl_seconds=300)  # refreshed: the first expiry record is stale
+    cache.delete("sn:b")
+
+    now[0] += 60
+
+    assert cache.cleanup_expired() == 0
+    assert cache.get("sn:a") == 3
+
+
+def test_many_set_and_many_get():
+    cache = InMemoryCache(max_size=100, stripes=4)
+    cache.many_set({f"sn:incident_details:INC{i}": i for i in range(10)}, ttl_seconds=60)
+
+    found = cache.many_get(["sn:incident_details:INC1", "sn:incident_details:INC9", "sn:none"])
+
+    assert found == {"sn:incident_details:INC1": 1, "sn:incident_details:INC9": 9}
+    stats = cache.stats()
+    assert (stats["size"], stats["total_sets"], stats["hits"], stats["misses"]) == (10, 10, 2, 1)
@@ -0,0 +1,47 @@
+"""Tests for NextThink service."""
+import asyncio
+
+from app.cache.memory_cache import reset_cache
+from app.clients.nextthink_client import NextThinkClient
+from app.schemas.remote_action import RemoteActionExecuteRequest
+from app.services.nextthink_service import NextThinkService
+
+
+def test_execute_remote_action_invalidates_cached_history(monkeypatch):
+    """Queuing an action drops the device's cached action history, keyed by device name."""
+    reset_cache()
+    history_queries = []
+
+    async def fake_aenter(self):
+        return self
+
+    async def fake_aexit(self, exc_type, exc_val, exc_tb):
+        return None
+
+    async def fake_get_remote_actions(self, device_name, query_type):
+        history_queries.append(device_name)
+        return {"headers": [], "data": []}
+
+    async def fake_execute(self, action_data):
+        return {"id": "act_1", "status": "initiated"}
+
+    monkeypatch.setattr(NextThinkClient, "__aenter__", fake_aenter)
+    monkeypatch.setattr(NextThinkClient, "__aexit__", fake_aexit)
+    monkeypatch.setattr(NextThinkClient, "get_remote_actions", fake_get_remote_actions)
+    monkeypatch.setattr(NextThinkClient, "execute_remote_action", fake_execute)
+    service = NextThinkService()
+    request = RemoteActionExecuteRequest(
+        actionType="restart", deviceId="dev_67890", deviceName="DESKTOP-ABC123"
+    )
+
+    async def run():
+        await service.get_remote_actions(device_name="DESKTOP-ABC123")
+        await service.get_remote_actions(device_name="DESKTOP-ABC123")
+        cached = service.cache.get("nt:remote_actions:DESKTOP-ABC123:detailed")
+        await service.execute_remote_action(request)
+        return cached, service.cache.get("nt:remote_actions:DESKTOP-ABC123:detailed")
+
+    cached_before, cached_after = asyncio.run(run())
+    assert cached_before == []
+    assert cached_after is None
+    assert history_queries == ["DESKTOP-ABC123"]
@@ -0,0 +1,52 @@
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.testclient import TestClient
+
+from app.middleware.response_wrapper import ResponseWrapperMiddleware
+
+app = FastAPI()
+app.add_middleware(ResponseWrapperMiddleware)
+
+
+@app.get("/devices")
+def devices():
+    payload = {"devices": [{"name": "LAPTOP-1", "ok": True}]}
+    return ORJSONResponse(payload, headers={"ETag": 'W/"1"'})
+
+
+@app.get("/wrapped")
+def wrapped():
+    return JSONResponse({"success": True, "message": "done", "data": 1})
+
+
+@app.get("/missing")
+def missing():
+    return JSONResponse({"detail": "Device not found"}, status_code=404)
+
+
+client = TestClient(app)
+
+
+def test_success_body_is_spliced_into_envelope():
+    response = client.get("/devices", headers={"X-Request-ID": "req-1"})
+    body = response.json()
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["etag"] == 'W/"1"'
+    assert body["success"] is True
+    assert body["data"] == {"devices": [{"name": "LAPTOP-1", "ok": True}]}
+    assert body["request_id"] == "req-1"
+    assert body["timestamp"].endswith("Z")
+
+
+def test_already_wrapped_body_passes_through():
+    assert client.get("/wrapped").json() == {"success": True, "message": "done", "data": 1}
+
+
+def test_error_body_is_wrapped_with_its_detail():
+    response = client.get("/missing")
+    body = response.json()
+    assert response.status_code == 404
+    assert body["success"] is False
+    assert body["message"] == "Device not found"
+    assert body["data"] is None
@@ -0,0 +1,54 @@
+import asyncio
+from collections import Counter
+
+import app.cache.warmup as warmup
+import app.main as main
+from app.main import app
+
+
+def test_routes_are_registered_once():
+    # Each router module must be included exactly once; a duplicate include
+    # doubles the route table and the OpenAPI operations.
+    registered = Counter(
+        (method, route.path)
+        for route in app.routes
+        for method in getattr(route, "methods", None) or ()
+    )
+    duplicates = [key for key, count in registered.items() if count > 1]
+    assert duplicates == []
+
+
+def test_shutdown_cancels_startup_warmup(monkeypatch):
+    # The warmup task is kept referenced and is stopped before the pools close
+    started = []
+
+    async def fake_warm_caches(top_devices):
+        started.append(top_devices)
+        await asyncio.sleep(3600)
+
+    async def fake_init_db():
+        return True
+
+    async def fake_close_db():
+        return None
+
+    monkeypatch.setattr(warmup, "warm_caches", fake_warm_caches)
+    monkeypatch.setattr(main, "init_db", fake_init_db)
+    monkeypatch.setattr(main, "close_db", fake_close_db)
+    factory = main.FSCockpitApplication()
+    monkeypatch.setattr(factory.settings, "CACHE_WARMUP_ENABLED", True)
+    monkeypatch.setattr(factory.settings, "SERVICENOW_BATCH_ENABLED", False)
+
+    async def run():
+        for handler in factory.app.router.on_startup:
+            await handler()
+        tasks = list(factory._background_tasks)
+        await asyncio.sleep(0)
+        for handler in factory.app.router.on_shutdown:
+            await handler()
+        return tasks
+
+    tasks = asyncio.run(run())
+    assert started
+    assert tasks and all(task.cancelled() for task in tasks)
+    assert factory._background_tasks == []
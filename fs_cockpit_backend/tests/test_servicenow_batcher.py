@@ -0,0 +1,57 @@
+import asyncio
+import base64
+
+import orjson
+import pytest
+
+from app.clients.servicenow_client import ServiceNowClient
+from app.exceptions.custom_exceptions import ExternalServiceError
+from app.services.servicenow_batcher import ServiceNowBatcher
+
+
+def _envelope(request_id, status_code, body):
+    return {
+        "id": request_id,
+        "status_code": status_code,
+        "body": base64.b64encode(orjson.dumps(body)).decode(),
+    }
+
+
+def test_concurrent_submits_share_one_batch_call(monkeypatch):
+    batches = []
+
+    async def fake_execute_batch(self, batch_request_id, rest_requests):
+        batches.append(rest_requests)
+        return {
+            "serviced_requests": [
+                _envelope("0", 200, {"result": [{"url": rest_requests[0]["url"]}]}),
+                _envelope("1", 404, {"error": {"message": "No Record found"}}),
+            ]
+        }
+
+    monkeypatch.setattr(ServiceNowClient, "execute_batch", fake_execute_batch)
+
+    async def run():
+        batcher = ServiceNowBatcher("https://sn.example.com", "user", "pass")
+        batcher.start()
+        try:
+            return await asyncio.gather(
+                batcher.submit("/api/now/table/incident", {"sysparm_limit": "1"}),
+                batcher.submit("/api/now/table/sys_user"),
+                return_exceptions=True,
+            )
+        finally:
+            await batcher.stop()
+
+    found, missing = asyncio.run(run())
+
+    assert len(batches) == 1
+    assert found == {"result": [{"url": "/api/now/table/incident?sysparm_limit=1"}]}
+    assert isinstance(missing, ExternalServiceError)
+    assert missing.status_code == 404
+
+
+def test_submit_requires_running_batcher():
+    batcher = ServiceNowBatcher("https://sn.example.com", "user", "pass")
+    with pytest.raises(RuntimeError):
+        asyncio.run(batcher.submit("/api/now/table/incident"))
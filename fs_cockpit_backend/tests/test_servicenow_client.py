@@ -0,0 +1,29 @@
+import asyncio
+
+import httpx
+
+from app.clients.servicenow_client import ServiceNowClient
+from app.config.settings import get_settings
+
+
+def test_concurrent_calls_are_capped(monkeypatch):
+    monkeypatch.setattr(get_settings(), "SERVICENOW_MAX_CONCURRENCY", 2)
+    in_flight = []
+    peak = []
+
+    async def fake_request(self, method, url, **kwargs):
+        in_flight.append(url)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(url)
+        return httpx.Response(200, json={"result": []}, request=httpx.Request(method, url))
+
+    monkeypatch.setattr(httpx.AsyncClient, "request", fake_request)
+
+    async def run():
+        async with ServiceNowClient("https://sn.example.com", "user", "pass") as client:
+            await asyncio.gather(*(client.get(f"/api/now/table/t{i}") for i in range(6)))
+
+    asyncio.run(run())
+
+    assert max(peak) == 2
@@ -0,0 +1,95 @@
+import asyncio
+
+import orjson
+from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+
+from app.api.routes import servicenow
+
+
+class _FakeService:
+    def __init__(self):
+        self.release_activity = asyncio.Event()
+        self.activity_done = False
+
+    async def fetch_incident_comments(self, incident_number, limit, offset):
+        return {"comments": [{"value": "x" * 2000}], "total_comments": 1}
+
+    async def fetch_incident_activity_logs(self, incident_number, limit, offset):
+        await self.release_activity.wait()
+        self.activity_done = True
+        raise RuntimeError("ServiceNow unavailable")
+
+
+def _build_app(service):
+    app = FastAPI()
+    app.add_middleware(GZipMiddleware, minimum_size=10)
+    app.include_router(servicenow.router)
+    app.dependency_overrides[servicenow.get_service] = lambda: service
+    return app
+
+
+def _scope(path, query):
+    return {
+        "type": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query,
+        "headers": [(b"host", b"test"), (b"accept-encoding", b"gzip")],
+        "client": ("test", 1),
+        "server": ("test", 80),
+    }
+
+
+def test_stream_sends_first_line_before_slower_part_under_gzip():
+    """NDJSON lines are not held back by GZip, and a failed part becomes an error line."""
+    service = _FakeService()
+    app = _build_app(service)
+
+    async def run():
+        messages: asyncio.Queue = asyncio.Queue()
+
+        async def receive():
+            await asyncio.sleep(3600)
+
+        scope = _scope("/api/v1/servicenow/incident/INC001/logs", b"stream=true")
+        app_task = asyncio.create_task(app(scope, receive, messages.put))
+
+        start = await asyncio.wait_for(messages.get(), timeout=2)
+        first = await asyncio.wait_for(messages.get(), timeout=2)
+        activity_done_at_first_line = service.activity_done
+
+        service.release_activity.set()
+        rest = b""
+        while True:
+            message = await asyncio.wait_for(messages.get(), timeout=2)
+            rest += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        await app_task
+        return start, first["body"], rest, activity_done_at_first_line
+
+    start, first, rest, activity_done_at_first_line = asyncio.run(run())
+    headers = dict(start["headers"])
+    assert headers[b"content-encoding"] == b"identity"
+    assert not activity_done_at_first_line
+    assert orjson.loads(first)["kind"] == "comments"
+    assert orjson.loads(rest) == {
+        "kind": "activity",
+        "error": "ServiceNow unavailable",
+        "request_id": None,
+    }
+
+
+def test_knowledge_results_stay_private_behind_auth(monkeypatch):
+    """Shared caches may only keep KB results when Azure AD auth is disabled."""
+    settings = servicenow.get_settings()
+    monkeypatch.setattr(settings, "AZURE_AD_ENABLED", True)
+    assert servicenow._knowledge_cache_control() == "private, max-age=30"
+
+    monkeypatch.setattr(settings, "AZURE_AD_ENABLED", False)
+    assert servicenow._knowledge_cache_control().startswith("public, ")
@@ -1,3 +1,9 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.cache.memory_cache import reset_cache
 from app.services.servicenow_service import ServiceNowService
 from app.utils.incident_utils import IncidentUtils
 
@@ -47,3 +53,55 @@ def test_parse_opened_at_various_formats():
     # invalid or empty strings should return datetime.min
     dtnone = IncidentUtils.parse_opened_at("")
     assert dtnone.year == 1
+
+
+def test_cursor_pagination_resumes_after_last_incident():
+    service = ServiceNowService()
+    recs = [
+        {"sys_id": str(i), "number": f"INC00{i}", "opened_at": f"2021-0{i}-01 12:00:00"}
+        for i in range(1, 6)
+    ]
+    dtos = IncidentUtils.sort_dtos_by_opened_at([service._map_incident_to_dto(r) for r in recs])
+
+    page, total, offset = service._paginate(dtos, 2, 0, None)
+    assert [d.sysId for d in page] == ["5", "4"]
+    assert (total, offset) == (5, 0)
+
+    after = IncidentUtils.decode_cursor(IncidentUtils.encode_cursor(page[-1]))
+    # a new incident at the top does not shift the next page
+    newest = service._map_incident_to_dto(
+        {"sys_id": "6", "number": "INC006", "opened_at": "2021-07-01 12:00:00"}
+    )
+    page, total, offset = service._paginate([newest] + dtos, 2, 0, after)
+    assert [d.sysId for d in page] == ["3", "2"]
+    assert (total, offset) == (6, 3)
+
+    # the cursor's incident left the list: resume at the next older one
+    page, _, _ = service._paginate([d for d in dtos if d.sysId != "4"], 2, 0, after)
+    assert [d.sysId for d in page] == ["3", "2"]
+
+
+def test_decode_cursor_rejects_malformed_values():
+    with pytest.raises(ValueError):
+        IncidentUtils.decode_cursor("not a cursor!")
+
+
+def test_failed_device_lookup_is_not_cached_as_a_miss(monkeypatch):
+    reset_cache()
+    statuses = [503, 404]
+
+    async def fake_request(self, method, url, **kwargs):
+        return httpx.Response(statuses.pop(0), json={}, request=httpx.Request(method, url))
+
+    monkeypatch.setattr(httpx.AsyncClient, "request", fake_request)
+    service = ServiceNowService()
+    sys_id = "a" * 32
+    cache_key = f"sn:device_name:{sys_id}"
+
+    # a 5xx is a failed lookup: no negative entry, so the next call asks again
+    assert asyncio.run(service.resolve_device_name(sys_id)) is None
+    assert service.cache.get(cache_key) is None
+
+    # a 404 means the computer does not exist, which is cached as a miss
+    assert asyncio.run(service.resolve_device_name(sys_id)) is None
+    assert service.cache.get(cache_key) == ""
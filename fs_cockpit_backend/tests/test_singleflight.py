@@ -0,0 +1,40 @@
+import asyncio
+
+from app.cache.singleflight import singleflight
+
+
+def test_concurrent_identical_calls_share_one_upstream_call():
+    calls = []
+
+    @singleflight(lambda key: key)
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return key.upper()
+
+    async def run():
+        return await asyncio.gather(fetch("a"), fetch("a"), fetch("a"), fetch("b"))
+
+    assert asyncio.run(run()) == ["A", "A", "A", "B"]
+    assert calls == ["a", "b"]
+
+    # Finished calls are not memoized
+    assert asyncio.run(fetch("a")) == "A"
+    assert calls == ["a", "b", "a"]
+
+
+def test_exception_is_shared_with_all_waiters():
+    calls = []
+
+    @singleflight(lambda key: key)
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        raise ValueError(key)
+
+    async def run():
+        return await asyncio.gather(fetch("x"), fetch("x"), return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, ValueError) for r in results)
+    assert calls == ["x"]